@@ -1 +1,4 @@
-from .comprehensive import ComprehensiveAnalyzer, ComprehensiveMomentumAnalysis, AnalyzerInput
\ No newline at end of file
+from .comprehensive import ComprehensiveAnalyzer, ComprehensiveMomentumAnalysis, AnalyzerInput
+from .batched import BatchedComprehensiveAnalyzer, BatchedMomentumAnalysis, TickerMomentumAnalysis
+from .cascade import CascadeAnalyzer, CascadeConfig, TierStats
+from .runner import AnalysisRunner, AnalysisReport
@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 from pydantic import BaseModel 
 
 from nifty_500_momentum.static.shortlister import StaticScoutResult
 from nifty_500_momentum.analysts.news_model import NewsArticle
-from nifty_500_momentum.llm import llm, StructuredLLMInput
+from nifty_500_momentum.llm import llm, BaseLLM, StructuredLLMInput
 
 
 
@@ -18,9 +18,32 @@ class BaseAnalyzer(ABC):
     Abstract Base Strategy.
     Any new analyzer must implement the `analyze` method.
     """
-    def __init__(self):
-        self.llm = llm
+    def __init__(self, llm_client: Optional[BaseLLM] = None):
+        self.llm = llm_client or llm
+        # Set by `AnalysisRunner` for the duration of a run: rate_budget(tokens) blocks until one more request fits
+        self.rate_budget: Optional[Callable[[int], None]] = None
     
     @abstractmethod
     def analyze(self, data: AnalyzerInput) -> Any:
-        pass
\ No newline at end of file
+        pass
+
+    def estimate_tokens(self, data: AnalyzerInput) -> int:
+        """Prompt + completion tokens one `analyze` call is expected to use (0 = unknown)."""
+        return 0
+
+    def acquire_budget(self, tokens: int) -> None:
+        """Call before any request beyond the one the runner metered for this `analyze_batch` call."""
+        if self.rate_budget is not None:
+            self.rate_budget(tokens)
+
+    # --- Batching (default: one ticker per request) ---
+    def plan_batches(self, inputs: Dict[str, AnalyzerInput]) -> List[List[str]]:
+        """Groups the tickers into the requests `analyze_batch` will be called with."""
+        return [[ticker] for ticker in inputs]
+
+    def analyze_batch(self, inputs: Dict[str, AnalyzerInput]) -> Dict[str, Any]:
+        """{ticker: result}; a ticker missing from the result failed."""
+        return {ticker: self.analyze(data) for ticker, data in inputs.items()}
+
+    def estimate_batch_tokens(self, inputs: Dict[str, AnalyzerInput]) -> int:
+        return sum(self.estimate_tokens(data) for data in inputs.values())
\ No newline at end of file
@@ -0,0 +1,115 @@
+import logging
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from .base import AnalyzerInput, StructuredLLMInput
+from .comprehensive import ComprehensiveAnalyzer, ComprehensiveMomentumAnalysis, SYSTEM_PROMPT
+from nifty_500_momentum.llm import BaseLLM, estimate_tokens
+
+"""
+BATCHED COMPREHENSIVE ANALYZER
+------------------------------
+Packs several tickers into one structured request, so the system prompt (with the whole
+`MarketDriver` catalogue) and the output schema are sent once per batch instead of once
+per ticker. Tickers are packed greedily, in input order, until the estimated prompt +
+completion tokens of the batch reach `max_batch_tokens` (or `max_batch_size` tickers).
+A batch whose response does not validate, or does not return exactly one analysis per
+requested ticker, falls back to single-ticker requests for the tickers it is missing;
+each of those takes its share of the runner's rate budgets first (`acquire_budget`).
+"""
+
+
+class TickerMomentumAnalysis(ComprehensiveMomentumAnalysis):
+    ticker: str = Field(..., description="The ticker exactly as given in the '### Ticker:' header")
+
+
+class BatchedMomentumAnalysis(BaseModel):
+    analyses: List[TickerMomentumAnalysis] = Field(..., description="One analysis per ticker in the input")
+
+
+BATCH_INSTRUCTIONS = """
+BATCH MODE:
+You will receive several stocks, each under its own '### Ticker: <TICKER>' header.
+Analyze every stock independently (never let one stock's news influence another's scores)
+and return exactly one entry per ticker in 'analyses', with 'ticker' copied exactly.
+"""
+
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + BATCH_INSTRUCTIONS
+
+
+class BatchedComprehensiveAnalyzer(ComprehensiveAnalyzer):
+    SCHEMA_TOKENS = 350  # response schema sent with every request (field descriptions + driver enum)
+
+    def __init__(self,
+                 llm_client: Optional[BaseLLM] = None,
+                 max_batch_tokens: int = 12_000,
+                 max_batch_size: int = 10) -> None:
+        super().__init__(llm_client)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max(1, max_batch_size)
+
+    # --- Prompts ---
+    def build_batch_input(self, inputs: Dict[str, AnalyzerInput]) -> StructuredLLMInput:
+        user_prompt = "\n\n".join(f"### Ticker: {ticker}\n{self.format_signal(data)}" for ticker, data in inputs.items())
+        return StructuredLLMInput(
+            messages=[
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ]
+        )
+
+    def _ticker_tokens(self, ticker: str, data: AnalyzerInput) -> int:
+        """Marginal prompt + completion tokens of adding the ticker to a batch."""
+        section = f"### Ticker: {ticker}\n{self.format_signal(data)}"
+        return estimate_tokens([{"role": "user", "content": section}]) + self.OUTPUT_TOKENS
+
+    def _base_tokens(self) -> int:
+        return estimate_tokens([{"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                                {"role": "user", "content": ""}]) + self.SCHEMA_TOKENS
+
+    def estimate_batch_tokens(self, inputs: Dict[str, AnalyzerInput]) -> int:
+        return self._base_tokens() + sum(self._ticker_tokens(ticker, data) for ticker, data in inputs.items())
+
+    # --- Batching ---
+    def plan_batches(self, inputs: Dict[str, AnalyzerInput]) -> List[List[str]]:
+        """Greedy, in input order; a ticker larger than the budget goes alone."""
+        base = self._base_tokens()
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        tokens = base
+        for ticker, data in inputs.items():
+            cost = self._ticker_tokens(ticker, data)
+            if batch and (tokens + cost > self.max_batch_tokens or len(batch) >= self.max_batch_size):
+                batches.append(batch)
+                batch, tokens = [], base
+            batch.append(ticker)
+            tokens += cost
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def analyze_batch(self, inputs: Dict[str, AnalyzerInput]) -> Dict[str, ComprehensiveMomentumAnalysis]:
+        if len(inputs) == 1:
+            return super().analyze_batch(inputs)
+
+        results: Dict[str, ComprehensiveMomentumAnalysis] = {}
+        try:
+            response = self.llm.generate_structured(inp=self.build_batch_input(inputs), output_model=BatchedMomentumAnalysis)
+            for analysis in response.analyses:
+                ticker = analysis.ticker.strip()
+                if ticker in inputs and ticker not in results:
+                    results[ticker] = ComprehensiveMomentumAnalysis.model_validate(analysis.model_dump(exclude={"ticker"}))
+        except Exception as e:
+            logging.warning(f"Batch of {len(inputs)} tickers failed ({e}); retrying them one by one.")
+
+        missing = [ticker for ticker in inputs if ticker not in results]
+        if missing and results:
+            logging.warning(f"Batch response missed {missing}; retrying them one by one.")
+        for ticker in missing:
+            try:
+                self.acquire_budget(self.estimate_tokens(inputs[ticker]))
+                results[ticker] = self.analyze(inputs[ticker])
+            except Exception as e:
+                logging.error(f"Analysis of {ticker} failed: {e}")
+        # Input order
+        return {ticker: results[ticker] for ticker in inputs if ticker in results}
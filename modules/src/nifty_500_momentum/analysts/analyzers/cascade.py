@@ -0,0 +1,211 @@
+import threading
+import time
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from pydantic import BaseModel
+
+from .base import AnalyzerInput
+from .comprehensive import ComprehensiveAnalyzer, ComprehensiveMomentumAnalysis
+from .runner import AnalysisRunner, AnalysisReport
+from nifty_500_momentum.llm import BaseLLM, LLMFactory, DEFAULT_LLM_PROVIDER, llm_cache
+
+"""
+MODEL CASCADE
+-------------
+Runs every ticker on a small model and re-runs only the ambiguous ones on a larger model,
+so the final shortlist gets large-model judgement at close to small-model cost.
+A small-model result is escalated when (each rule can be switched off in `CascadeConfig`):
+- conviction is within `conviction_margin` of the conviction threshold
+- sentiment is within `sentiment_margin` of the sentiment threshold
+- `is_operator_trap` disagrees with the scores: flagged as a trap yet passing both
+  thresholds, or not flagged although the news sentiment is negative
+- the small-model call failed (e.g. the response did not validate)
+The final shortlist ranks the passing tickers by conviction and keeps the `top_n` best, so
+the rank cut-off is a second decision boundary, usually far above the conviction threshold.
+It is only known once every ticker has a result: `run` makes a second pass that sends the
+passing small-model results within `shortlist_margin` of the cut-off to the large model.
+An escalation is an extra request, so it takes the runner's rate budgets first. If the
+large-model call fails, the small-model result is kept (when there is one).
+Calls, estimated tokens and latency are counted per tier and logged by `log_stats`.
+"""
+
+
+class CascadeConfig(BaseModel):
+    large_model: str = "gpt-4.1"
+    large_provider: str = DEFAULT_LLM_PROVIDER
+    conviction_margin: float = 1.0          # 0 disables the rule
+    sentiment_margin: float = 0.15          # 0 disables the rule
+    escalate_trap_disagreement: bool = True
+    escalate_failures: bool = True
+    shortlist_margin: float = 1.0           # conviction points around the top-N cut-off; 0 disables the pass
+
+
+class TierStats(BaseModel):
+    model: str
+    calls: int = 0
+    failures: int = 0
+    estimated_tokens: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        mean_ms = self.seconds / self.calls * 1000 if self.calls else 0.0
+        return (f"{self.model}: {self.calls} calls ({self.failures} failed) | ~{self.estimated_tokens} tokens | "
+                f"{self.seconds:.1f}s, {mean_ms:.0f}ms/call")
+
+
+class CascadeAnalyzer(ComprehensiveAnalyzer):
+    """`llm` (the small tier) defaults to the default client; `large_llm` to `config.large_model`."""
+
+    def __init__(self,
+                 config: CascadeConfig,
+                 conviction_threshold: float = 5.0,
+                 sentiment_threshold: float = 0.1,
+                 top_n: int = 0,
+                 llm_client: Optional[BaseLLM] = None,
+                 large_llm: Optional[BaseLLM] = None) -> None:
+        super().__init__(llm_client)
+        self.config = config
+        self.conviction_threshold = conviction_threshold
+        self.sentiment_threshold = sentiment_threshold
+        self.top_n = top_n   # size of the final shortlist; 0 skips the cut-off pass
+        large_llm = large_llm or LLMFactory.create(provider=config.large_provider, model=config.large_model, cache=llm_cache)
+        self.large = ComprehensiveAnalyzer(large_llm)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.tiers = {"small": TierStats(model=self.llm.model), "large": TierStats(model=self.large.llm.model)}
+            self.escalations: Dict[str, int] = {}  # reason -> tickers
+            self.large_tickers: Set[str] = set()   # tickers whose result came from the large model
+            self._forced: Set[str] = set()         # tickers the next pass sends straight to the large model
+
+    # --- Routing ---
+    def escalation_reasons(self, analysis: ComprehensiveMomentumAnalysis) -> List[str]:
+        """Why a small-model result is ambiguous (empty: keep it)."""
+        reasons = []
+        config = self.config
+        if config.conviction_margin and abs(analysis.conviction_score - self.conviction_threshold) <= config.conviction_margin:
+            reasons.append("conviction_near_threshold")
+        if config.sentiment_margin and abs(analysis.sentiment_score - self.sentiment_threshold) <= config.sentiment_margin:
+            reasons.append("sentiment_near_threshold")
+        if config.escalate_trap_disagreement:
+            passes = self.passes(analysis)
+            if analysis.is_operator_trap and passes or not analysis.is_operator_trap and analysis.sentiment_score < 0:
+                reasons.append("operator_trap_disagreement")
+        return reasons
+
+    def passes(self, analysis: ComprehensiveMomentumAnalysis) -> bool:
+        return (analysis.conviction_score >= self.conviction_threshold
+                and analysis.sentiment_score >= self.sentiment_threshold)
+
+    def shortlist_boundary(self, results: Dict[str, ComprehensiveMomentumAnalysis]) -> List[str]:
+        """Small-model results within `shortlist_margin` of the final shortlist's conviction cut-off."""
+        margin = self.config.shortlist_margin
+        convictions = sorted((analysis.conviction_score for analysis in results.values() if self.passes(analysis)),
+                             reverse=True)
+        if not margin or not self.top_n or len(convictions) <= self.top_n:
+            return []  # every passing ticker makes the shortlist: only the thresholds decide
+        cutoff = convictions[self.top_n - 1]
+        return [ticker for ticker, analysis in results.items()
+                if ticker not in self.large_tickers and self.passes(analysis)
+                and abs(analysis.conviction_score - cutoff) <= margin]
+
+    def _call(self, tier: str, data: AnalyzerInput) -> ComprehensiveMomentumAnalysis:
+        # Both tiers send the same prompt
+        tokens = self.estimate_tokens(data)
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = super().analyze(data) if tier == "small" else self.large.analyze(data)
+            failed = False
+            return result
+        finally:
+            with self._lock:
+                stats = self.tiers[tier]
+                stats.calls += 1
+                stats.failures += failed
+                stats.estimated_tokens += tokens
+                stats.seconds += time.perf_counter() - start
+
+    # --- Analysis ---
+    def analyze_ticker(self, ticker: str, data: AnalyzerInput) -> ComprehensiveMomentumAnalysis:
+        with self._lock:
+            forced = ticker in self._forced
+        if forced:
+            # The runner metered this request; on failure the caller keeps the first-pass result
+            result = self._call("large", data)
+            with self._lock:
+                self.large_tickers.add(ticker)
+            return result
+
+        analysis: Optional[ComprehensiveMomentumAnalysis] = None
+        try:
+            analysis = self._call("small", data)
+            reasons = self.escalation_reasons(analysis)
+        except Exception as e:
+            if not self.config.escalate_failures:
+                raise
+            reasons = ["small_model_failure"]
+            logging.warning(f"Small-model analysis of {ticker} failed ({e}).")
+        if not reasons:
+            return analysis
+
+        logging.info(f"Escalating {ticker} to {self.large.llm.model}: {', '.join(reasons)}")
+        with self._lock:
+            for reason in reasons:
+                self.escalations[reason] = self.escalations.get(reason, 0) + 1
+        try:
+            self.acquire_budget(self.estimate_tokens(data))
+            result = self._call("large", data)
+            with self._lock:
+                self.large_tickers.add(ticker)
+            return result
+        except Exception as e:
+            if analysis is None:
+                raise
+            logging.warning(f"Large-model analysis of {ticker} failed ({e}); keeping the small-model result.")
+            return analysis
+
+    def analyze(self, data: AnalyzerInput) -> ComprehensiveMomentumAnalysis:
+        return self.analyze_ticker("<ticker>", data)
+
+    def analyze_batch(self, inputs: Dict[str, AnalyzerInput]) -> Dict[str, ComprehensiveMomentumAnalysis]:
+        return {ticker: self.analyze_ticker(ticker, data) for ticker, data in inputs.items()}
+
+    def run(self,
+            runner: AnalysisRunner,
+            inputs: Dict[str, AnalyzerInput],
+            on_result: Optional[Callable[[str, Any], None]] = None) -> Tuple[Dict[str, Any], AnalysisReport]:
+        """
+        `runner.run(inputs)`, then the second pass over the shortlist boundary. Returns the merged
+        results in input order and the first pass's report with the second pass's requests added.
+        """
+        results, report = runner.run(inputs, on_result=on_result)
+        boundary = self.shortlist_boundary(results)
+        if not boundary:
+            return results, report
+        logging.info(f"Escalating {len(boundary)} tickers near the shortlist cut-off to {self.large.llm.model}.")
+        with self._lock:
+            self.escalations["shortlist_boundary"] = self.escalations.get("shortlist_boundary", 0) + len(boundary)
+            self._forced = set(boundary)
+        try:
+            escalated, second = runner.run({ticker: inputs[ticker] for ticker in boundary}, on_result=on_result)
+        finally:
+            with self._lock:
+                self._forced = set()
+        # A failed escalation keeps the small-model result
+        results.update(escalated)
+        report.requests += second.requests
+        report.estimated_tokens += second.estimated_tokens
+        report.waited_seconds += second.waited_seconds
+        report.llm_seconds += second.llm_seconds
+        report.elapsed_seconds += second.elapsed_seconds
+        return results, report
+
+    def log_stats(self) -> None:
+        with self._lock:
+            logging.info(f">>> Cascade: escalated {self.tiers['large'].calls}/{self.tiers['small'].calls} tickers "
+                         f"{self.escalations or ''}")
+            for name, stats in self.tiers.items():
+                logging.info(f">>> Cascade {name} tier - {stats.summary()}")
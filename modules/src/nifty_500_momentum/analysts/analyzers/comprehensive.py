@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 from typing import List
 
 from .base import BaseAnalyzer, StructuredLLMInput, AnalyzerInput
+from nifty_500_momentum.llm import estimate_tokens
 from .market_drivers import MarketDriver, driver_options
 
 class ComprehensiveMomentumAnalysis(BaseModel):
@@ -61,7 +62,11 @@ Return valid JSON only. Matches the requested schema.
 """
     
 class ComprehensiveAnalyzer(BaseAnalyzer):
-    def analyze(self, data: AnalyzerInput) -> ComprehensiveMomentumAnalysis:
+    OUTPUT_TOKENS = 350  # typical completion size of ComprehensiveMomentumAnalysis
+
+    @staticmethod
+    def format_signal(data: AnalyzerInput) -> str:
+        """The technical signal and headlines of one ticker, as sent to the LLM."""
         user_prompt = ""
         
         # Add the technical signal
@@ -73,13 +78,21 @@ class ComprehensiveAnalyzer(BaseAnalyzer):
         user_prompt += "\n\nRecent News Headlines:\n"
         for article in data.news_data:
             user_prompt += f"- [{article.published_dt}] {article.source}: {article.title}\n"
-            
-        # call the LLM
-        inp = StructuredLLMInput(
+        return user_prompt
+
+    def build_input(self, data: AnalyzerInput) -> StructuredLLMInput:
+        return StructuredLLMInput(
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
+                {"role": "user", "content": self.format_signal(data)}
             ]
         )
+
+    def estimate_tokens(self, data: AnalyzerInput) -> int:
+        return estimate_tokens(self.build_input(data).messages) + self.OUTPUT_TOKENS
+
+    def analyze(self, data: AnalyzerInput) -> ComprehensiveMomentumAnalysis:
+        # call the LLM
+        inp = self.build_input(data)
         response = self.llm.generate_structured(inp=inp, output_model=ComprehensiveMomentumAnalysis)
         return response
\ No newline at end of file
@@ -0,0 +1,126 @@
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Optional
+from pydantic import BaseModel
+
+from nifty_500_momentum.data.rate_limiter import TokenBucket
+from .base import BaseAnalyzer, AnalyzerInput
+
+"""
+ANALYSIS RUNNER
+---------------
+Runs an analyzer over many tickers, optionally on a thread pool (the LLM round-trip is
+I/O bound). The unit of work is one request of the analyzer's `plan_batches` (a single
+ticker unless the analyzer batches). Two token buckets shared by all workers keep the
+provider budgets: requests per minute, and tokens per minute (each request takes the
+analyzer's estimate of its prompt + completion tokens before it is sent). Requests the
+analyzer makes on its own within a batch (retries, escalations) take the same budgets
+through `BaseAnalyzer.acquire_budget`.
+Results come back in input order whatever the completion order.
+"""
+
+
+class AnalysisReport(BaseModel):
+    total: int
+    requests: int = 0             # metered requests (batches, plus the analyzer's own retries / escalations)
+    succeeded: int = 0
+    failed: Dict[str, str] = {}   # ticker -> error message
+    estimated_tokens: int = 0
+    waited_seconds: float = 0.0   # time spent waiting on the rate budgets (summed over workers)
+    llm_seconds: float = 0.0      # time spent in analyzer calls (summed over workers)
+    elapsed_seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (f"Analysed {self.succeeded}/{self.total} (failed {len(self.failed)}) in {self.requests} requests | "
+                f"~{self.estimated_tokens} tokens | waited {self.waited_seconds:.1f}s on budgets | "
+                f"{self.llm_seconds:.1f}s in calls | {self.elapsed_seconds:.1f}s")
+
+
+class AnalysisRunner:
+    def __init__(self,
+                 analyzer: BaseAnalyzer,
+                 max_workers: int = 1,
+                 requests_per_minute: float = 0.0,
+                 tokens_per_minute: float = 0.0) -> None:
+        """`requests_per_minute` / `tokens_per_minute` of 0 disable that budget."""
+        self.analyzer = analyzer
+        self.max_workers = max(1, max_workers)
+        # Up to one request per worker may start back-to-back
+        self.request_limiter = TokenBucket(rate=requests_per_minute / 60, capacity=self.max_workers) \
+            if requests_per_minute > 0 else None
+        self.token_limiter = TokenBucket(rate=tokens_per_minute / 60, capacity=tokens_per_minute) \
+            if tokens_per_minute > 0 else None
+
+    def _acquire(self, tokens: int, report: AnalysisReport, lock: threading.Lock) -> None:
+        """Waits until one request of `tokens` fits both budgets."""
+        waited = 0.0
+        if self.request_limiter is not None:
+            waited += self.request_limiter.acquire()
+        if self.token_limiter is not None and tokens:
+            waited += self.token_limiter.acquire(tokens)
+        with lock:
+            report.requests += 1
+            report.estimated_tokens += tokens
+            report.waited_seconds += waited
+
+    def _analyze(self, batch: Dict[str, AnalyzerInput], report: AnalysisReport, lock: threading.Lock) -> Dict[str, Any]:
+        self._acquire(self.analyzer.estimate_batch_tokens(batch), report, lock)
+        start = time.perf_counter()
+        try:
+            return self.analyzer.analyze_batch(batch)
+        finally:
+            with lock:
+                report.llm_seconds += time.perf_counter() - start
+
+    def run(self,
+            inputs: Dict[str, AnalyzerInput],
+            on_result: Optional[Callable[[str, Any], None]] = None) -> tuple[Dict[str, Any], AnalysisReport]:
+        """
+        Analyses every {ticker: input}. `on_result(ticker, result)` is called on the calling
+        thread as results arrive (e.g. to checkpoint). A failing ticker is recorded in the
+        report and left out of the results; the others continue.
+        """
+        start = time.perf_counter()
+        report = AnalysisReport(total=len(inputs))
+        lock = threading.Lock()
+        results: Dict[str, Any] = {}
+        self.analyzer.rate_budget = lambda tokens: self._acquire(tokens, report, lock)
+
+        def _done(batch: Dict[str, AnalyzerInput], batch_results: Optional[Dict[str, Any]], error: str = "") -> None:
+            for ticker in batch:
+                if batch_results is not None and ticker in batch_results:
+                    results[ticker] = batch_results[ticker]
+                    report.succeeded += 1
+                    if on_result is not None:
+                        on_result(ticker, batch_results[ticker])
+                else:
+                    report.failed[ticker] = error or "No result returned by the analyzer"
+                    logging.error(f"Analysis of {ticker} failed: {report.failed[ticker]}")
+
+        try:
+            batches = [{ticker: inputs[ticker] for ticker in tickers} for tickers in self.analyzer.plan_batches(inputs)]
+            if self.max_workers == 1:
+                for batch in batches:
+                    logging.info(f">>> Analyzing {', '.join(batch)} with "
+                                 f"{sum(len(data.news_data) for data in batch.values())} news articles.")
+                    try:
+                        _done(batch, self._analyze(batch, report, lock))
+                    except Exception as e:
+                        _done(batch, None, str(e))
+            else:
+                logging.info(f">>> Analyzing {len(inputs)} tickers in {len(batches)} requests with {self.max_workers} workers...")
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {executor.submit(self._analyze, batch, report, lock): batch for batch in batches}
+                    for future in as_completed(futures):
+                        batch = futures[future]
+                        try:
+                            _done(batch, future.result())
+                        except Exception as e:
+                            _done(batch, None, str(e))
+        finally:
+            self.analyzer.rate_budget = None
+        report.elapsed_seconds = time.perf_counter() - start
+        # Input order regardless of completion order
+        return {ticker: results[ticker] for ticker in inputs if ticker in results}, report
@@ -1,21 +1,39 @@
 from abc import ABC, abstractmethod 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 
 from nifty_500_momentum.data.config import DataConfig
 from nifty_500_momentum.data.manager import DataManager
+from nifty_500_momentum.llm import BaseLLM, BatchEndpoint
 
 from .state import AnalystState
+from .analyzers.cascade import CascadeConfig
 
 
 class BaseWorkflowConfig(BaseModel):
     data_config: DataConfig
+    llm_max_workers: int = 1              # > 1 analyses tickers concurrently
+    llm_requests_per_minute: float = 0.0  # provider request budget shared by all workers, 0 = unlimited
+    llm_tokens_per_minute: float = 0.0    # provider token budget (estimated per request), 0 = unlimited
+    llm_batch_tokens: int = 0             # > 0 packs several tickers per request up to this many tokens
+    llm_batch_size: int = 10              # most tickers in one batched request
+    llm_offline_batch: bool = False       # submit all analyses as one provider batch job and poll for it
+    llm_batch_poll_seconds: float = 60.0
+    llm_batch_timeout_hours: float = 24.0 # give up waiting (re-run to resume the same job)
+    llm_cascade: Optional[CascadeConfig] = None  # escalate ambiguous tickers to a larger model (online only)
 
 
 class BaseWorkflow(ABC):
-    def __init__(self, config: BaseWorkflowConfig):
+    def __init__(self,
+                 config: BaseWorkflowConfig,
+                 llm_client: Optional[BaseLLM] = None,
+                 batch_endpoint: Optional[BatchEndpoint] = None):
         self.config = config
         self.data_manager = DataManager(config=config.data_config)
+        # None: the default client of `nifty_500_momentum.llm`
+        self.llm = llm_client
+        # None: the provider's own endpoint (`BaseLLM.batch_endpoint()`), used with `llm_offline_batch`
+        self.batch_endpoint = batch_endpoint
         
         
     @abstractmethod
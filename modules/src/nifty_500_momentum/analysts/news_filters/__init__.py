@@ -52,6 +52,20 @@ class NewsFilterEngine:
             else:
                 print(f"Warning: Strategy '{strat_name}' not found in registry.")
 
+    def store_filters(self) -> Dict[str, Any]:
+        """
+        Storage-side conditions of all strategies, for `StorageBackend.load_news_many`.
+        They only pre-narrow the load; `run` still applies every strategy.
+        """
+        combined: Dict[str, Any] = {}
+        for strategy in self.strategies:
+            for key, value in strategy.store_filter().items():
+                if key == "published_since":
+                    combined[key] = max(combined.get(key, value), value)
+                elif key == "exclude_sources":
+                    combined[key] = combined.get(key, []) + list(value)
+        return combined
+
     def run(self, raw_data: List[dict]) -> List[NewsArticle]:
         # 1. Convert raw dicts to Pydantic Models (Validation Layer)
         articles = [NewsArticle(**item) for item in raw_data] if raw_data else []
@@ -12,6 +12,13 @@ class NewsFilterStrategy(ABC):
     @abstractmethod
     def apply(self, articles: List[NewsArticle]) -> List[NewsArticle]:
         pass
+    
+    def store_filter(self) -> Dict[str, Any]:
+        """
+        Equivalent conditions the news storage can apply while loading
+        (`published_since`, `exclude_sources`), or {} if the filter only runs in Python.
+        """
+        return {}
 
 
 
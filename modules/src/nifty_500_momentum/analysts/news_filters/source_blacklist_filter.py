@@ -29,4 +29,7 @@ class SourceBlacklistFilter(NewsFilterStrategy):
                 filtered.append(article)
                 
         logging.info(f"  [Source Filter] Kept {len(filtered)}/{len(articles)} articles")
-        return filtered
\ No newline at end of file
+        return filtered
+    
+    def store_filter(self) -> dict:
+        return {"exclude_sources": list(self.blacklist)}
\ No newline at end of file
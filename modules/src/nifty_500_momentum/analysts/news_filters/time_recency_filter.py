@@ -28,4 +28,7 @@ class TimeRecencyFilter(NewsFilterStrategy):
                     logging.warning(f"Article '{article.title}' has no published_dt ({article.published_dt}); excluding from time filter.")
         
         logging.info(f"  [Time Filter] Kept {len(filtered)}/{len(articles)} articles (Last {self.hours}h)")
-        return filtered
\ No newline at end of file
+        return filtered
+    
+    def store_filter(self) -> dict:
+        return {"published_since": datetime.now() - timedelta(hours=self.hours)}
\ No newline at end of file
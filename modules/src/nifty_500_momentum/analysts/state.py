@@ -1,7 +1,7 @@
-from pydantic import BaseModel 
+from pydantic import BaseModel, field_validator
 from typing import List, Dict, Any
 
-from nifty_500_momentum.static.shortlister import Strategies
+from nifty_500_momentum.static.shortlister import StrategyKey, as_strategy_key
 from .news_filters import SelectNewsFilterStrategy
 from .news_model import NewsArticle
 
@@ -9,7 +9,7 @@ from .news_model import NewsArticle
 class AnalystState(BaseModel):
     run_id: str
     analysis_id: str
-    shortlisting_strategy: Strategies
+    shortlisting_strategy: StrategyKey
     NEWS_QUERY_PREFIX: str 
     NEWS_QUERY_SUFFIX: str 
     news_filters: List[SelectNewsFilterStrategy]
@@ -20,4 +20,6 @@ class AnalystState(BaseModel):
     
     filtered_news: Dict[str, List[NewsArticle]] = {}  # ticker -> list of news article dicts
     analysis_results: Dict[str, Any] = {}  # ticker -> analysis result
-    final_shortlist: Dict[int, str] = {}  # rank -> ticker
\ No newline at end of file
+    final_shortlist: Dict[int, str] = {}  # rank -> ticker
+
+    _strategy_key = field_validator("shortlisting_strategy", mode="before")(as_strategy_key)
\ No newline at end of file
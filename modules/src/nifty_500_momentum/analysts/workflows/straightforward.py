@@ -1,10 +1,15 @@
 from typing import Dict, List
 
+from nifty_500_momentum.llm import llm as default_llm, BatchJob, BatchRequest
+
 from ..base_workflow import BaseWorkflow 
 from ..news_filters import NewsFilterEngine, NewsArticle
 
-from nifty_500_momentum.static.shortlister import StaticShortlistResult
-from nifty_500_momentum.analysts.analyzers import ComprehensiveAnalyzer, ComprehensiveMomentumAnalysis, AnalyzerInput
+from nifty_500_momentum.static.shortlister import StaticShortlistResult, strategy_name
+from nifty_500_momentum.analysts.analyzers import (
+    ComprehensiveAnalyzer, ComprehensiveMomentumAnalysis, AnalyzerInput, AnalysisRunner, BatchedComprehensiveAnalyzer,
+    CascadeAnalyzer,
+)
 from nifty_500_momentum.analysts.final_shortlist.comprehensive import ComprehensiveFinalShortlist
 
 import logging
@@ -14,21 +19,21 @@ class StraightforwardWorkflow(BaseWorkflow):
     def _run(self, state):
         
         # Step-0: Fetch Data
-        shortlist_data = self.data_manager.storage.load_shortlist(state.shortlisting_strategy.value)
+        shortlist_data = self.data_manager.storage.load_shortlist(strategy_name(state.shortlisting_strategy))
         tickers_company_names = self.data_manager.storage.load_tickers()
         shortlist_data = StaticShortlistResult(**shortlist_data)
         tickers = shortlist_data.shortlisted_tickers
-        tickers_news_data = {}
+        news_filter_engine = NewsFilterEngine(state.news_filters)
         logging.info(f">>> Fetching news data for {len(tickers)} shortlisted tickers...")
+        queries = {}
         for ticker in tickers:
             company_name = tickers_company_names[ticker]
-            query = f"{state.NEWS_QUERY_PREFIX} {company_name} {state.NEWS_QUERY_SUFFIX}".strip()
-            news_data = self.data_manager.storage.load_news(query)
-            tickers_news_data[ticker] = news_data
+            queries[ticker] = f"{state.NEWS_QUERY_PREFIX} {company_name} {state.NEWS_QUERY_SUFFIX}".strip()
+        # One bulk load; indexed news backends also pre-apply the filters' date/source conditions
+        tickers_news_data = self.data_manager.storage.load_news_many(queries, **news_filter_engine.store_filters())
         
         # Step-1: Apply news filters 
         logging.info(">>> Applying news filters...")
-        news_filter_engine = NewsFilterEngine(state.news_filters)
         tickers_filtered_news: Dict[str, List[NewsArticle]] = {}
         for ticker, news_articles in tickers_news_data.items():
             filtered_articles = news_filter_engine.run(news_articles)
@@ -36,14 +41,51 @@ class StraightforwardWorkflow(BaseWorkflow):
         state.filtered_news = tickers_filtered_news
         
         # Step-2: Run the Analysis
-        analyzer = ComprehensiveAnalyzer()
-        for ticker, news_articles in tickers_filtered_news.items():
-            logging.info(f">>> Analyzing ticker: {ticker} with {len(news_articles)} news articles.")
-            inp = AnalyzerInput(static_results=shortlist_data.tickers_results[ticker], 
-                                news_data=news_articles)
-            results = analyzer.analyze(inp)
+        offline = self.config.llm_offline_batch
+        if offline and self.batch_endpoint is None and (self.llm or default_llm).batch_endpoint() is None:
+            logging.warning(f"{(self.llm or default_llm).provider_name} has no batch endpoint; running the analysis online.")
+            offline = False
+        # The cascade routes on each ticker's small-model result: one ticker per request, online only
+        if self.config.llm_cascade is not None and offline:
+            logging.warning("llm_cascade is ignored with llm_offline_batch: the batch job runs every ticker on one model.")
+        if self.config.llm_cascade is not None and not offline:
+            analyzer = CascadeAnalyzer(self.config.llm_cascade,
+                                       conviction_threshold=state.conviction_threshold,
+                                       sentiment_threshold=state.sentiment_threshold,
+                                       top_n=state.top_n_final_shortlist,
+                                       llm_client=self.llm)
+        elif self.config.llm_batch_tokens > 0:
+            analyzer = BatchedComprehensiveAnalyzer(self.llm, max_batch_tokens=self.config.llm_batch_tokens,
+                                                    max_batch_size=self.config.llm_batch_size)
+        else:
+            analyzer = ComprehensiveAnalyzer(self.llm)
+        runner = AnalysisRunner(
+            analyzer,
+            max_workers=self.config.llm_max_workers,
+            requests_per_minute=self.config.llm_requests_per_minute,
+            tokens_per_minute=self.config.llm_tokens_per_minute,
+        )
+        inputs = {ticker: AnalyzerInput(static_results=shortlist_data.tickers_results[ticker],
+                                        news_data=news_articles)
+                  for ticker, news_articles in tickers_filtered_news.items()}
+
+        def _checkpoint(ticker: str, results: ComprehensiveMomentumAnalysis) -> None:
             state.analysis_results[ticker] = results
             self._save_state(state)
+
+        if offline:
+            state.analysis_results = self._run_batch_job(state.analysis_id, analyzer, inputs)
+            self._save_state(state)
+        else:
+            if isinstance(analyzer, CascadeAnalyzer):
+                analysis_results, report = analyzer.run(runner, inputs, on_result=_checkpoint)
+            else:
+                analysis_results, report = runner.run(inputs, on_result=_checkpoint)
+            # Ticker order, whatever order the analyses completed in
+            state.analysis_results = analysis_results
+            logging.info(f">>> {report.summary()}")
+            if isinstance(analyzer, CascadeAnalyzer):
+                analyzer.log_stats()
         
         # Step-3: Final Shortlisting 
         logging.info(">>> Creating final shortlist...")
@@ -59,4 +101,22 @@ class StraightforwardWorkflow(BaseWorkflow):
         
         # TODO: Step-4: Summary creation (For UI display)
         
-        return state
\ No newline at end of file
+        return state
+
+    def _run_batch_job(self,
+                       analysis_id: str,
+                       analyzer: ComprehensiveAnalyzer,
+                       inputs: Dict[str, AnalyzerInput]) -> Dict[str, ComprehensiveMomentumAnalysis]:
+        """One provider batch job (one request per ticker), resumed if this analysis already submitted it."""
+        job = BatchJob(self.llm or default_llm, self.config.data_config.llm_batch_dir / analysis_id,
+                       endpoint=self.batch_endpoint)
+        requests = [BatchRequest(custom_id=ticker, messages=analyzer.build_input(data).messages)
+                    for ticker, data in inputs.items()]
+        logging.info(f">>> Analyzing {len(requests)} tickers as an offline batch job in {job.job_dir}...")
+        results, errors = job.run(requests, ComprehensiveMomentumAnalysis,
+                                  poll_seconds=self.config.llm_batch_poll_seconds,
+                                  timeout_seconds=self.config.llm_batch_timeout_hours * 3600)
+        for ticker, error in errors.items():
+            logging.error(f"Analysis of {ticker} failed: {error}")
+        logging.info(f">>> Batch job: {len(results)}/{len(requests)} analysed (failed {len(errors)})")
+        return {ticker: results[ticker] for ticker in inputs if ticker in results}
\ No newline at end of file
@@ -0,0 +1,185 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+import pandas as pd
+from pydantic import BaseModel
+
+"""
+STOCK CATALOG
+-------------
+JSON manifest describing every stored ticker (row count, date range, schema, checksum,
+fetch time), kept alongside the parquet files. `save_stock` records entries in memory;
+the manifest is written once per collection by `flush` (and at exit for stray saves).
+An entry is only trusted while its file still has the recorded size and mtime.
+Planning and staleness checks read the manifest instead of opening parquet payloads.
+"""
+
+
+class StockCatalogEntry(BaseModel):
+    ticker: str
+    rows: int
+    first_date: Optional[datetime] = None
+    last_date: Optional[datetime] = None
+    columns: Dict[str, str] = {}  # column -> dtype
+    tz: Optional[str] = None      # timezone of the stored index
+    checksum: str                 # sha256 of the stored file
+    fetched_at: datetime
+    file_size: int
+    file_mtime_ns: Optional[int] = None
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """False when the file was replaced outside `save_stock` (entries without an mtime are not trusted)."""
+        return stat.st_size == self.file_size and stat.st_mtime_ns == self.file_mtime_ns
+
+    def first_timestamp(self) -> Optional[pd.Timestamp]:
+        return self._as_index_ts(self.first_date)
+
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        return self._as_index_ts(self.last_date)
+
+    def _as_index_ts(self, value: Optional[datetime]) -> Optional[pd.Timestamp]:
+        """Timestamp in the same timezone as the stored index (JSON only keeps the UTC offset)."""
+        if value is None:
+            return None
+        ts = pd.Timestamp(value)
+        return ts.tz_convert(self.tz) if self.tz is not None and ts.tz is not None else ts
+
+    def is_current(self, as_of: pd.Timestamp) -> bool:
+        """
+        True when the last stored bar is dated on/after `as_of` and was fetched on a later
+        day than that bar (so it is a completed session, not an intraday snapshot).
+        """
+        last = self.last_timestamp()
+        if last is None:
+            return False
+        last_day = last.tz_localize(None).normalize()
+        return last_day >= pd.Timestamp(as_of).tz_localize(None).normalize() and \
+            pd.Timestamp(self.fetched_at).tz_localize(None).normalize() > last_day
+
+
+class StockCatalog:
+    """
+    Thread-safe manifest for one stock directory, keyed by stored file stem. Use `StockCatalog.for_path` so every
+    storage instance of a process shares one in-memory copy; changes made by other
+    processes are picked up through the manifest's mtime.
+    """
+    _instances: Dict[str, "StockCatalog"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._entries: Dict[str, StockCatalogEntry] = {}
+        self._raw: Dict[str, dict] = {}  # serialized entries, so a save does not re-dump the whole catalog
+        self._pending: Dict[str, dict] = {}  # recorded since the last write
+        self._seen_mtime_ns: Optional[int] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_path(cls, path: Path) -> "StockCatalog":
+        key = str(Path(path).resolve())
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(Path(path))
+            return cls._instances[key]
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._instances_lock:
+            catalogs = list(cls._instances.values())
+        for catalog in catalogs:
+            if not catalog.path.parent.exists():  # e.g. a temporary data dir already removed
+                continue
+            try:
+                catalog.flush()
+            except OSError as e:
+                logging.warning(f"Could not write stock catalog {catalog.path}: {e}")
+
+    # --- Persistence ---
+    def _refresh(self) -> None:
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime_ns == self._seen_mtime_ns:
+            return
+        with self.path.open('r') as f:
+            raw = json.load(f)
+        raw.update(self._pending)  # not written yet: ours are newer than the file
+        self._raw = raw
+        self._entries = {key: StockCatalogEntry(**entry) for key, entry in raw.items()}
+        self._seen_mtime_ns = mtime_ns
+
+    def _write(self) -> None:
+        staging = self.path.with_suffix(self.path.suffix + f".{os.getpid()}.tmp")
+        with staging.open('w') as f:
+            # json.dumps (C encoder) is several times faster than json.dump's streaming encoder
+            f.write(json.dumps(self._raw))
+        os.replace(staging, self.path)
+        self._seen_mtime_ns = self.path.stat().st_mtime_ns
+        self._pending = {}
+
+    def flush(self) -> None:
+        """Writes the manifest if entries were recorded since the last write."""
+        with self._lock:
+            if self._pending:
+                self._refresh()
+                self._write()
+
+    # --- Queries ---
+    def get(self, key: str) -> Optional[StockCatalogEntry]:
+        with self._lock:
+            self._refresh()
+            return self._entries.get(key)
+
+    def entries(self) -> Dict[str, StockCatalogEntry]:
+        with self._lock:
+            self._refresh()
+            return dict(self._entries)
+
+    # --- Updates ---
+    @staticmethod
+    def describe(ticker: str, df: pd.DataFrame, payload: bytes, stat: os.stat_result,
+                 fetched_at: Optional[datetime] = None) -> StockCatalogEntry:
+        """Builds the entry for a stored file from the bytes written to it (`df` is the frame they hold)."""
+        tz = getattr(df.index, "tz", None)
+        return StockCatalogEntry(
+            ticker=ticker,
+            rows=len(df),
+            first_date=df.index[0] if len(df) else None,
+            last_date=df.index[-1] if len(df) else None,
+            columns={str(c): str(t) for c, t in df.dtypes.items()},
+            tz=str(tz) if tz is not None else None,
+            checksum=hashlib.sha256(payload).hexdigest(),
+            fetched_at=fetched_at or datetime.now(),
+            file_size=len(payload),
+            file_mtime_ns=stat.st_mtime_ns,
+        )
+
+    def record(self, key: str, entry: StockCatalogEntry) -> None:
+        self.record_many({key: entry})
+
+    def record_many(self, entries: Dict[str, StockCatalogEntry]) -> None:
+        """Merges entries (keyed by file stem) into the manifest; `flush` persists them."""
+        raw = {key: entry.model_dump(mode="json") for key, entry in entries.items()}
+        with self._lock:
+            self._refresh()
+            self._entries.update(entries)
+            self._raw.update(raw)
+            self._pending.update(raw)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._refresh()
+            if self._entries.pop(key, None) is not None:
+                self._raw.pop(key, None)
+                self._write()
+
+
+# Saves made outside a collection run (no `flush`) still reach the manifest
+atexit.register(StockCatalog.flush_all)
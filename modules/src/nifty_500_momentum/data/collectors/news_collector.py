@@ -17,6 +17,10 @@ class NewsDataCollectorInputs(BaseModel):
 class NewsDataCollector(DataCollector):
     def collect(self, inputs: NewsDataCollectorInputs) -> None:
         company_names = self.data_manager.storage.load_tickers()
+        
+        if self.data_config.news_max_workers > 1:
+            self._collect_concurrently(inputs, company_names)
+            return
             
         for ticker in inputs.tickers:
             try:
@@ -29,4 +33,14 @@ class NewsDataCollector(DataCollector):
                 custom_query=f"{inputs.query_prefix} {company_name} {inputs.query_postfix}".strip(),
                 force_refresh=inputs.force_refresh
             )
-            time.sleep(self.data_config.news_api_sleep + np.random.uniform(0, 4))
\ No newline at end of file
+            time.sleep(self.data_config.news_api_sleep + np.random.uniform(0, 4))
+
+    def _collect_concurrently(self, inputs: NewsDataCollectorInputs, company_names: Dict[str, str]) -> None:
+        queries = {}
+        for ticker in inputs.tickers:
+            try:
+                company_name = company_names[ticker]
+            except KeyError:
+                raise ValueError(f"Ticker {ticker} not found in tickers.json")
+            queries[ticker] = f"{inputs.query_prefix} {company_name} {inputs.query_postfix}".strip()
+        self.data_manager.collect_news(queries, force_refresh=inputs.force_refresh)
\ No newline at end of file
@@ -57,12 +57,10 @@ class RunManager:
         # 2. Select DataCollector class based on pipeline
         collector = None
         print(Path(self.base_data_dir) / run_config.run_id)
-        data_config = DataConfig(data_dir=Path(self.base_data_dir) / run_config.run_id,
-                                 stock_api_sleep=run_config.data_config.stock_api_sleep,
-                                 news_api_sleep=run_config.data_config.news_api_sleep,
-                                 cache_expiry_hours=run_config.data_config.cache_expiry_hours,
-                                 stock_file_ext=run_config.data_config.stock_file_ext,
-                                 news_file_ext=run_config.data_config.news_file_ext)
+        # Carry over every tunable (sleeps, concurrency, caching, ...) and only relocate the data dir
+        data_config = run_config.data_config.model_copy(
+            update={"data_dir": Path(self.base_data_dir) / run_config.run_id}
+        )
         data_config.setup_directories()
         if run_config.pipeline == PipelineType.STOCK:
             collector = StocksDataCollector(data_config=data_config)
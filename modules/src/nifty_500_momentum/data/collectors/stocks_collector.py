@@ -10,13 +10,14 @@ class StocksDataCollectorInputs(BaseModel):
     tickers: Dict[str, str] = {}
     period: str = "2y"
     force_refresh: bool = False
+    incremental: bool = False   # append new bars to stored tickers instead of skipping them
 
 
 class StocksDataCollector(DataCollector):
     def collect(self, inputs: StocksDataCollectorInputs) -> None:
         if inputs.all_tickers:
             from nifty_500_momentum.data.nifty_500_tickers import get_nifty500_tickers
-            tickers = get_nifty500_tickers()
+            tickers = get_nifty500_tickers(client=self.data_manager.http_client)
         else:
             tickers = inputs.tickers
         
@@ -28,5 +29,11 @@ class StocksDataCollector(DataCollector):
         self.data_manager.collect_stock_universe(
             tickers=tickers,
             period=period,
-            force_refresh=force_refresh
-        )
\ No newline at end of file
+            force_refresh=force_refresh,
+            incremental=inputs.incremental
+        )
+
+        if self.data_config.stock_features:
+            # Optional stage: precompute the strategy indicators for the shortlister
+            from nifty_500_momentum.static.feature_store import update_strategy_features
+            update_strategy_features(self.data_manager, list(tickers.keys()))
\ No newline at end of file
@@ -1,7 +1,18 @@
 from pathlib import Path
+from enum import Enum
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
+class StockLayout(str, Enum):
+    FILES = "files"   # one parquet file per ticker
+    PANEL = "panel"   # per-ticker files compacted into one universe-wide dataset for bulk reads
+
+
+class NewsBackend(str, Enum):
+    JSON = "json"       # one JSON file per query
+    SQLITE = "sqlite"   # one indexed SQLite database, articles deduplicated by link
+
+
 class DataConfig(BaseModel):
     """Centralized paths and tunable data settings."""
 
@@ -9,19 +20,74 @@ class DataConfig(BaseModel):
 
     data_dir: Path = Field(default_factory=Path.cwd)
     stock_api_sleep: float = 1.0
+    stock_max_workers: int = 1            # > 1 enables concurrent collection
+    stock_rate_limit: float = 1.0         # requests/second shared by all workers
+    stock_rate_burst: int = 1             # tokens that may be spent back-to-back
+    stock_fetch_timeout: float = 60.0     # seconds before a single fetch is abandoned
+    stock_batch_timeout: float = 300.0    # seconds before a batched fetch is abandoned (its tickers are retried one by one)
+    stock_batch_size: int = 40            # tickers per request for sources that support batching
+    stock_update_overlap_days: int = 7    # calendar days re-fetched to verify incremental updates
     news_api_sleep: float = 2.0
+    news_max_workers: int = 1             # > 1 enables concurrent news collection
+    news_per_host: int = 4                # news requests in flight per host
+    news_rate_limit: float = 1.0          # news requests/second shared by all workers
+    news_rate_burst: int = 1
+    news_fetch_timeout: float = 30.0      # seconds before a single news request is abandoned
     cache_expiry_hours: int = 24
     stock_file_ext: str = ".parquet"
+    stock_layout: StockLayout = StockLayout.FILES
+    stock_cube: bool = False              # build/read the memory-mapped OHLCV cube (see data/cube.py)
+    stock_cache_mb: int = 256             # process-wide LRU of decoded stock frames, 0 disables
+    stock_features: bool = False          # persist strategy indicators after collection and read them when shortlisting
     news_file_ext: str = ".json"
+    http_cache_max_mb: int = 64           # response bodies kept for conditional requests, 0 disables the bound
+    http_cache_max_age_days: float = 30.0 # entries not revalidated for this long are dropped, 0 disables
+    news_backend: NewsBackend = NewsBackend.JSON
 
     @computed_field(return_type=Path)
     def stock_data_dir(self) -> Path:
         return self.data_dir / "stocks"
 
+    @computed_field(return_type=Path)
+    def stock_panel_dir(self) -> Path:
+        return self.stock_data_dir / "_panel"
+
+    @computed_field(return_type=Path)
+    def stock_cube_dir(self) -> Path:
+        return self.stock_data_dir / "_cube"
+
+    @computed_field(return_type=Path)
+    def stock_catalog_path(self) -> Path:
+        return self.stock_data_dir / "_catalog.json"
+
+    @computed_field(return_type=Path)
+    def stock_features_dir(self) -> Path:
+        # Precomputed strategy indicators, one versioned subdirectory per feature set (see static/feature_store.py)
+        return self.stock_data_dir / "_features"
+
+    @computed_field(return_type=Path)
+    def stock_signals_dir(self) -> Path:
+        # Historical pass/metric matrices of the strategies (see static/signal_history.py)
+        return self.stock_data_dir / "_signals"
+
     @computed_field(return_type=Path)
     def news_data_dir(self) -> Path:
         return self.data_dir / "news"
 
+    @computed_field(return_type=Path)
+    def news_db_path(self) -> Path:
+        return self.news_data_dir / "news.sqlite"
+
+    @computed_field(return_type=Path)
+    def llm_batch_dir(self) -> Path:
+        # Offline LLM batch jobs, one directory per analysis (see llm/batch.py)
+        return self.data_dir / "llm_batches"
+
+    @computed_field(return_type=Path)
+    def http_cache_dir(self) -> Path:
+        # ETag/Last-Modified validators and bodies for conditional HTTP requests
+        return self.data_dir / "http_cache"
+
     def setup_directories(self) -> None:
         """Ensure required directories exist before IO starts."""
         for path in (self.data_dir, self.stock_data_dir, self.news_data_dir):
@@ -31,4 +97,4 @@ class DataConfig(BaseModel):
 DATA_CONFIG = DataConfig()
 DATA_CONFIG.setup_directories()
 
-__all__ = ["DataConfig", "DATA_CONFIG"]
\ No newline at end of file
+__all__ = ["DataConfig", "DATA_CONFIG", "StockLayout", "NewsBackend"]
\ No newline at end of file
@@ -0,0 +1,175 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from nifty_500_momentum.data.interfaces import StorageBackend, align_tz
+from nifty_500_momentum.data.panel import StockPanel, OHLCV_FIELDS
+
+import logging
+
+"""
+OHLCV CUBE
+----------
+Optional binary cache of the stored universe: a (tickers x trading-days x fields)
+float64 array in one file, opened with `numpy.memmap`, plus a small JSON sidecar
+mapping tickers, dates and fields to offsets.
+
+Readers get views into the mapping instead of decoded copies, so several worker
+processes opening the same cube share one page-cached copy of the data.
+
+The sidecar also records each ticker's `StorageBackend.stock_signature` at build time;
+`stale_tickers` compares them with storage so data saved after the build (e.g. an update
+run without the cube enabled) is never served from the cube.
+"""
+
+
+class OHLCVCube:
+    DATA_FILE = "cube.f8"
+    INDEX_FILE = "cube_index.json"
+
+    def __init__(self, cube_dir: Path) -> None:
+        self.cube_dir = Path(cube_dir)
+        with (self.cube_dir / self.INDEX_FILE).open('r') as f:
+            meta = json.load(f)
+        self.tickers: List[str] = meta["tickers"]
+        self.fields: List[str] = meta["fields"]
+        self.dates = pd.DatetimeIndex(pd.to_datetime(meta["dates"], utc=meta["tz"] is not None), name="Date")
+        if meta["tz"] is not None:
+            self.dates = self.dates.tz_convert(meta["tz"])
+        # ticker -> [first_row, last_row, has_gaps]; None when the ticker has no data
+        self.rows: Dict[str, Optional[list]] = meta["rows"]
+        self.built_at: str = meta["built_at"]
+        # ticker -> stored data signature at build time (cubes built before signatures: {})
+        self.sources: Dict[str, Optional[list]] = meta.get("sources", {})
+        self._positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._field_positions = {name: i for i, name in enumerate(self.fields)}
+        shape = tuple(meta["shape"])
+        # An empty file cannot be mapped
+        self.data = np.memmap(self.cube_dir / self.DATA_FILE, dtype=np.float64, mode="r", shape=shape) \
+            if all(shape) else np.empty(shape)
+
+    @classmethod
+    def exists(cls, cube_dir: Path) -> bool:
+        return (Path(cube_dir) / cls.INDEX_FILE).exists() and (Path(cube_dir) / cls.DATA_FILE).exists()
+
+    @classmethod
+    def build(cls,
+              storage: StorageBackend,
+              cube_dir: Path,
+              tickers: Optional[List[str]] = None,
+              fields: Optional[List[str]] = None) -> "OHLCVCube":
+        """Writes the cube from stored data (one `load_panel` call) and opens it read-only."""
+        fields = fields or OHLCV_FIELDS
+        panel = storage.load_panel(tickers=tickers, fields=fields)
+        cube_dir = Path(cube_dir)
+        cube_dir.mkdir(parents=True, exist_ok=True)
+
+        shape = (len(panel.tickers), len(panel.dates), len(fields))
+        staging = cube_dir / (cls.DATA_FILE + ".tmp")
+        array = np.memmap(staging, dtype=np.float64, mode="w+", shape=shape) if all(shape) else None
+        if array is not None:
+            for f, name in enumerate(fields):
+                array[:, :, f] = panel.field(name).T
+            array.flush()
+            del array
+        else:
+            staging.touch()
+
+        # A bar exists when any field is present; rows outside [first, last] are padding
+        present = np.zeros((len(panel.dates), len(panel.tickers)), dtype=bool)
+        for name in fields:
+            present |= ~np.isnan(panel.field(name))
+        rows: Dict[str, Optional[list]] = {}
+        for t, ticker in enumerate(panel.tickers):
+            valid = np.flatnonzero(present[:, t])
+            if len(valid) == 0:
+                rows[ticker] = None
+            else:
+                first, last = int(valid[0]), int(valid[-1])
+                rows[ticker] = [first, last, bool(last - first + 1 != len(valid))]
+
+        meta = {
+            "shape": list(shape),
+            "tickers": panel.tickers,
+            "fields": fields,
+            "dates": [d.isoformat() for d in panel.dates],
+            "tz": str(panel.dates.tz) if panel.dates.tz is not None else None,
+            "rows": rows,
+            "built_at": pd.Timestamp.now().isoformat(),
+            "sources": {ticker: storage.stock_signature(ticker) for ticker in panel.tickers},
+        }
+        # The index is written last: its presence marks a complete cube
+        os.replace(staging, cube_dir / cls.DATA_FILE)
+        with (cube_dir / cls.INDEX_FILE).open('w') as f:
+            json.dump(meta, f)
+        logging.info(f"Built OHLCV cube {shape} at {cube_dir}")
+        return cls(cube_dir)
+
+    def stale_tickers(self, storage: StorageBackend, tickers: Optional[List[str]] = None) -> List[str]:
+        """
+        Tickers (default: the cube's) whose stored data no longer matches the cube: changed,
+        removed, or stored since the build. Every ticker of a cube without signatures is stale.
+        """
+        stale = []
+        for ticker in (tickers if tickers is not None else self.tickers):
+            signature = storage.stock_signature(ticker)
+            if ticker not in self.sources:
+                if signature is not None or ticker in self:
+                    stale.append(ticker)
+            elif signature != self.sources[ticker]:
+                stale.append(ticker)
+        return stale
+
+    def __contains__(self, ticker: str) -> bool:
+        return self.rows.get(ticker) is not None
+
+    def slice(self, ticker: str) -> np.ndarray:
+        """(days x fields) view of one ticker over its listed date range. No copy."""
+        first, last, _ = self.rows[ticker]
+        return self.data[self._positions[ticker], first:last + 1, :]
+
+    def frame(self, ticker: str) -> pd.DataFrame:
+        """
+        Per-ticker DataFrame backed by the memory map (read-only).
+        Only tickers with missing bars inside their range need a (compacting) copy.
+        """
+        if ticker not in self:
+            return pd.DataFrame()
+        first, last, has_gaps = self.rows[ticker]
+        df = pd.DataFrame(self.slice(ticker), index=self.dates[first:last + 1], columns=self.fields, copy=False)
+        return df.dropna(how="all") if has_gaps else df
+
+    def field(self, name: str) -> np.ndarray:
+        """(dates x tickers) view of one field across the universe. No copy."""
+        return self.data[:, :, self._field_positions[name]].T
+
+    def panel(self,
+              tickers: Optional[List[str]] = None,
+              fields: Optional[List[str]] = None,
+              start: Optional[pd.Timestamp] = None,
+              end: Optional[pd.Timestamp] = None) -> StockPanel:
+        """
+        `StockPanel` over the cube. Views when `tickers` is None or matches the cube order;
+        an arbitrary ticker selection is gathered into new arrays.
+        """
+        fields = fields or self.fields
+        rows = slice(
+            self.dates.searchsorted(align_tz(pd.Timestamp(start), self.dates)) if start is not None else None,
+            self.dates.searchsorted(align_tz(pd.Timestamp(end), self.dates), side="right") if end is not None else None,
+        )
+        if tickers is None or list(tickers) == self.tickers:
+            return StockPanel(dates=self.dates[rows], tickers=list(self.tickers),
+                              fields={name: self.field(name)[rows] for name in fields})
+
+        tickers = list(tickers)
+        cols = np.array([self._positions.get(t, -1) for t in tickers], dtype=np.int64)
+        arrays = {}
+        for name in fields:
+            source = self.field(name)[rows]
+            grid = np.full((source.shape[0], len(tickers)), np.nan)
+            grid[:, cols >= 0] = source[:, cols[cols >= 0]]
+            arrays[name] = grid
+        return StockPanel(dates=self.dates[rows], tickers=tickers, fields=arrays)
@@ -0,0 +1,204 @@
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Optional
+import pandas as pd
+from pydantic import BaseModel, computed_field
+
+from nifty_500_momentum.data.interfaces import StockDataSource, StorageBackend
+from nifty_500_momentum.data.rate_limiter import TokenBucket
+
+"""
+FETCH POOL
+----------
+Concurrent stock collection engine used by `DataManager.collect_stock_universe`.
+A pool of worker threads shares a single token bucket, so the request rate towards
+the provider stays bounded no matter how many workers are configured.
+"""
+
+
+class CollectionReport(BaseModel):
+    """Outcome and throughput of one stock collection run."""
+    total: int
+    succeeded: int = 0
+    skipped: int = 0
+    updated: int = 0    # incrementally appended
+    refetched: int = 0  # incremental update fell back to a full refetch
+    failed: Dict[str, str] = {}  # ticker -> error message
+    bytes_fetched: int = 0
+    elapsed_seconds: float = 0.0
+
+    @computed_field(return_type=float)
+    def tickers_per_second(self) -> float:
+        fetched = self.succeeded - self.skipped
+        return fetched / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @computed_field(return_type=float)
+    def bytes_per_second(self) -> float:
+        return self.bytes_fetched / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"Success: {self.succeeded}/{self.total} (skipped {self.skipped}, updated {self.updated}, "
+                f"refetched {self.refetched}, failed {len(self.failed)}) | "
+                f"{self.tickers_per_second:.2f} tickers/s | {self.bytes_per_second / 1024:.1f} KB/s | "
+                f"{self.elapsed_seconds:.1f}s")
+
+
+class StockFetchPool:
+    """
+    Fetches tickers on a thread pool through any `StockDataSource`.
+    - Batching: sources with `supports_batch` receive chunks of `batch_size` tickers
+      through `fetch_history_many`; others are called once per ticker.
+    - Incremental updates: tickers listed in `since` only fetch bars from that date and are
+      combined with the stored history by `merge`; when `merge` returns None (the
+      overlap was re-adjusted) the full `period` is refetched instead.
+    - Rate limiting: every request takes a token from the shared bucket.
+    - Error isolation: a failing request is recorded in the report, the others continue.
+    - Timeouts: a request still fetching after `timeout` seconds (`batch_timeout` for a
+      batch) is abandoned and its late result discarded (the worker thread itself cannot
+      be killed). Single tickers are then marked as failed; the tickers of an abandoned
+      batch are retried one by one. Once a request's data is being saved it can no longer
+      be abandoned, so no file is written for a ticker reported as timed out.
+    """
+    def __init__(self,
+                 source: StockDataSource,
+                 storage: StorageBackend,
+                 max_workers: int = 8,
+                 limiter: TokenBucket | None = None,
+                 timeout: float = 60.0,
+                 batch_size: int = 1,
+                 batch_timeout: Optional[float] = None) -> None:
+        self.source = source
+        self.storage = storage
+        self.max_workers = max(1, max_workers)
+        self.limiter = limiter
+        self.timeout = timeout
+        self.batch_timeout = batch_timeout or timeout
+        self.batch_size = max(1, batch_size) if source.supports_batch else 1
+
+    def _fetch(self, chunk: List[str], period: str, start: Optional[pd.Timestamp]) -> Dict[str, pd.DataFrame]:
+        if start is not None:
+            if len(chunk) == 1:
+                return {chunk[0]: self.source.fetch_history_since(chunk[0], start)}
+            return self.source.fetch_history_many_since(chunk, start)
+        if len(chunk) == 1:
+            return {chunk[0]: self.source.fetch_history(chunk[0], period)}
+        return self.source.fetch_history_many(chunk, period)
+
+    def _chunk(self, tickers: List[str], since: Dict[str, pd.Timestamp]) -> List[tuple]:
+        """Groups tickers sharing a start date (None = full history) into batches."""
+        groups: Dict[Optional[pd.Timestamp], List[str]] = {}
+        for ticker in tickers:
+            groups.setdefault(since.get(ticker), []).append(ticker)
+        return [(start, group[i:i + self.batch_size])
+                for start, group in groups.items()
+                for i in range(0, len(group), self.batch_size)]
+
+    def run(self,
+            tickers: List[str],
+            period: str = "2y",
+            since: Optional[Dict[str, pd.Timestamp]] = None,
+            merge: Optional[Callable[[str, pd.DataFrame], Optional[pd.DataFrame]]] = None) -> CollectionReport:
+        report = CollectionReport(total=len(tickers))
+        since = since or {}
+        chunks = self._chunk(tickers, since)
+        started_at: Dict[int, float] = {}
+        abandoned: set[int] = set()
+        saving: set[int] = set()  # fetched: no longer abandoned on timeout
+        lock = threading.Lock()
+
+        def _work(chunk_id: int) -> Dict[str, int | Exception]:
+            start, chunk = chunks[chunk_id]
+            if self.limiter is not None:
+                self.limiter.acquire()
+            with lock:
+                started_at[chunk_id] = time.monotonic()
+            frames = self._fetch(chunk, period, start)
+            with lock:
+                if chunk_id in abandoned:
+                    return {}
+                saving.add(chunk_id)
+            outcome: Dict[str, int | Exception] = {}
+            for ticker in chunk:
+                df = frames.get(ticker)
+                if df is None or df.empty:
+                    outcome[ticker] = ValueError("Empty Data")
+                    continue
+                try:
+                    nbytes = int(df.memory_usage(deep=True).sum())
+                    if start is not None and merge is not None:
+                        merged = merge(ticker, df)
+                        if merged is None:
+                            logging.info(f"{ticker}: stored bars were re-adjusted, refetching full history.")
+                            if self.limiter is not None:
+                                self.limiter.acquire()
+                            merged = self.source.fetch_history(ticker, period)
+                            nbytes += int(merged.memory_usage(deep=True).sum())
+                            if merged.empty:
+                                raise ValueError("Empty Data")
+                            with lock:
+                                report.refetched += 1
+                        else:
+                            with lock:
+                                report.updated += 1
+                        df = merged
+                    self.storage.save_stock(ticker, df)
+                    outcome[ticker] = nbytes
+                except Exception as e:
+                    outcome[ticker] = e
+            return outcome
+
+        def _record(ticker: str, result: int | Exception) -> None:
+            if isinstance(result, Exception):
+                report.failed[ticker] = str(result)
+                logging.error(f"{ticker} Failed: {result}")
+            else:
+                report.bytes_fetched += result
+                report.succeeded += 1
+                logging.info(f"[{report.succeeded + len(report.failed)}/{report.total}] {ticker} Done.")
+
+        start = time.perf_counter()
+        poll_interval = min(1.0, self.timeout / 4)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stock-fetch")
+        try:
+            futures = {executor.submit(_work, chunk_id): chunk_id for chunk_id in range(len(chunks))}
+            pending = set(futures)
+            retries = []
+            while pending:
+                done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk_id = futures[future]
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        outcome = {ticker: e for ticker in chunks[chunk_id][1]}
+                    for ticker, result in outcome.items():
+                        _record(ticker, result)
+
+                now = time.monotonic()
+                with lock:
+                    for future in list(pending):
+                        chunk_id = futures[future]
+                        chunk_start, chunk = chunks[chunk_id]
+                        timeout = self.timeout if len(chunk) == 1 else self.batch_timeout
+                        if chunk_id in started_at and chunk_id not in saving and now - started_at[chunk_id] > timeout:
+                            abandoned.add(chunk_id)
+                            pending.discard(future)
+                            if len(chunk) == 1:
+                                _record(chunk[0], TimeoutError(f"Timed out after {timeout}s"))
+                            else:
+                                logging.warning(f"Batch of {len(chunk)} tickers timed out after {timeout}s; retrying them one by one.")
+                                retries.extend((chunk_start, [ticker]) for ticker in chunk)
+                for retry in retries:
+                    chunks.append(retry)
+                    future = executor.submit(_work, len(chunks) - 1)
+                    futures[future] = len(chunks) - 1
+                    pending.add(future)
+                retries.clear()
+        finally:
+            # Do not block on abandoned (timed out) requests
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
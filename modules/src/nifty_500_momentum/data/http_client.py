@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from pydantic import BaseModel
+
+from nifty_500_momentum.data.config import DATA_CONFIG, DataConfig
+
+"""
+HTTP CLIENT
+-----------
+Shared HTTP layer for the data sources (news RSS, NSE index CSV).
+- One `requests.Session` with pooled keep-alive connections per host.
+- gzip/deflate negotiated by default and decoded transparently.
+- Conditional GET: the ETag / Last-Modified of every successful response is stored with
+  its body (in memory and, with `cache_dir`, on disk), so an unchanged resource costs a 304.
+  On disk, entries not stored or revalidated for `max_age_days` expire, and the least
+  recently used ones are pruned beyond `max_bytes` of bodies.
+- Per-host counters for requests, 304s, latency and bytes.
+"""
+
+
+class HostStats(BaseModel):
+    requests: int = 0
+    not_modified: int = 0
+    errors: int = 0
+    latency_seconds: float = 0.0
+    bytes_received: int = 0   # on the wire (compressed when the server compresses)
+    bytes_decoded: int = 0    # after decompression (304s count the cached body)
+
+    @property
+    def mean_latency_ms(self) -> float:
+        return self.latency_seconds / self.requests * 1000 if self.requests else 0.0
+
+
+class HttpResponse(BaseModel):
+    url: str
+    status: int
+    content: bytes
+    from_cache: bool = False  # True when the server answered 304 and the cached body was used
+
+
+class HttpClient:
+    def __init__(self,
+                 cache_dir: Optional[Path] = None,
+                 pool_maxsize: int = 16,
+                 timeout: float = 20.0,
+                 headers: Optional[Dict[str, str]] = None,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 max_age_days: float = 30.0) -> None:
+        """`max_bytes` / `max_age_days` of 0 disable that bound of the disk cache."""
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        if headers:
+            self.session.headers.update(headers)
+        self._validators: Dict[str, dict] = {}  # url -> {"etag", "last_modified", "content"}
+        self._stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+        self._disk_bytes = 0  # bodies on disk, recounted by `prune`
+        if self.cache_dir is not None:
+            self.prune()
+
+    # --- Validator cache ---
+    def _cache_path(self, url: str) -> Path:
+        return self.cache_dir / hashlib.md5(url.encode()).hexdigest()
+
+    def _cached(self, url: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._validators.get(url)
+        if entry is not None or self.cache_dir is None:
+            return entry
+        meta_path = self._cache_path(url).with_suffix(".json")
+        body_path = self._cache_path(url).with_suffix(".body")
+        if not (meta_path.exists() and body_path.exists()) or self._expired(body_path.stat().st_mtime):
+            return None
+        with meta_path.open('r') as f:
+            entry = json.load(f)
+        entry["content"] = body_path.read_bytes()
+        with self._lock:
+            self._validators[url] = entry
+        return entry
+
+    def _store(self, url: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+        entry = {"etag": etag, "last_modified": last_modified, "content": response.content}
+        with self._lock:
+            self._validators[url] = entry
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            body_path = self._cache_path(url).with_suffix(".body")
+            replaced = body_path.stat().st_size if body_path.exists() else 0
+            body_path.write_bytes(response.content)
+            # The metadata is written last: its presence marks a complete entry
+            with self._cache_path(url).with_suffix(".json").open('w') as f:
+                json.dump({"url": url, "etag": etag, "last_modified": last_modified}, f)
+            with self._lock:
+                self._disk_bytes += len(response.content) - replaced
+                over = bool(self.max_bytes) and self._disk_bytes > self.max_bytes
+            if over:
+                self.prune()
+
+    def _touch(self, url: str) -> None:
+        """Marks a revalidated disk entry as fresh (age and LRU order)."""
+        if self.cache_dir is not None:
+            try:
+                os.utime(self._cache_path(url).with_suffix(".body"))
+            except FileNotFoundError:
+                pass
+
+    def _expired(self, mtime: float) -> bool:
+        return bool(self.max_age_days) and time.time() - mtime > self.max_age_days * 86400
+
+    def prune(self) -> int:
+        """Drops expired disk entries, then least recently used ones beyond `max_bytes`. Returns the count."""
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return 0
+        entries = []
+        for body_path in self.cache_dir.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, body_path))
+        kept_bytes = removed = 0
+        for mtime, size, body_path in sorted(entries, reverse=True):  # most recently used first
+            if not self._expired(mtime) and (not self.max_bytes or kept_bytes + size <= self.max_bytes):
+                kept_bytes += size
+                continue
+            # Metadata first, so a concurrent reader never sees a complete-looking entry without its body
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            removed += 1
+        with self._lock:
+            self._disk_bytes = kept_bytes
+        if removed:
+            logging.info(f"HTTP cache: pruned {removed} entries, {kept_bytes / 1024:.1f} KB kept in {self.cache_dir}")
+        return removed
+
+    # --- Requests ---
+    def get(self,
+            url: str,
+            params: Optional[Dict[str, str]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None) -> HttpResponse:
+        """
+        GET with conditional revalidation. Returns the body (cached on 304).
+        Raises `requests.HTTPError` for error statuses and `requests.RequestException` on network failure.
+        """
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        host = urlparse(full_url).netloc
+        request_headers = dict(headers or {})
+        cached = self._cached(full_url)
+        if cached is not None:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        start = time.perf_counter()
+        try:
+            response = self.session.get(full_url, headers=request_headers, timeout=timeout or self.timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException:
+            self._count(host, time.perf_counter() - start, error=True)
+            raise
+        elapsed = time.perf_counter() - start
+
+        if response.status_code == 304 and cached is not None:
+            self._touch(full_url)
+            self._count(host, elapsed, wire=len(response.content), decoded=len(cached["content"]), not_modified=True)
+            return HttpResponse(url=full_url, status=304, content=cached["content"], from_cache=True)
+
+        self._store(full_url, response)
+        wire = int(response.headers.get("Content-Length", len(response.content)))
+        self._count(host, elapsed, wire=wire, decoded=len(response.content))
+        return HttpResponse(url=full_url, status=response.status_code, content=response.content)
+
+    # --- Counters ---
+    def _count(self, host: str, elapsed: float, wire: int = 0, decoded: int = 0,
+               not_modified: bool = False, error: bool = False) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(host, HostStats())
+            stats.requests += 1
+            stats.latency_seconds += elapsed
+            stats.bytes_received += wire
+            stats.bytes_decoded += decoded
+            stats.not_modified += int(not_modified)
+            stats.errors += int(error)
+
+    def stats(self) -> Dict[str, HostStats]:
+        with self._lock:
+            return {host: stats.model_copy() for host, stats in self._stats.items()}
+
+    def log_stats(self) -> None:
+        for host, s in self.stats().items():
+            logging.info(f"HTTP {host}: {s.requests} requests ({s.not_modified} not modified, {s.errors} errors) | "
+                         f"{s.mean_latency_ms:.0f} ms avg | {s.bytes_received / 1024:.1f} KB received "
+                         f"({s.bytes_decoded / 1024:.1f} KB decoded)")
+
+
+_SHARED_CLIENTS: Dict[Tuple[Path, int, float], HttpClient] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_http_client(config: DataConfig = DATA_CONFIG) -> HttpClient:
+    """The client shared by all data sources of this process using `config`'s HTTP cache (one per cache dir and bounds)."""
+    key = (config.http_cache_dir, config.http_cache_max_mb, config.http_cache_max_age_days)
+    with _SHARED_LOCK:
+        if key not in _SHARED_CLIENTS:
+            _SHARED_CLIENTS[key] = HttpClient(cache_dir=config.http_cache_dir,
+                                              max_bytes=config.http_cache_max_mb * 1024 * 1024,
+                                              max_age_days=config.http_cache_max_age_days)
+        return _SHARED_CLIENTS[key]
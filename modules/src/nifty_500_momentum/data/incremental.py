@@ -0,0 +1,45 @@
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+"""
+INCREMENTAL UPDATES
+-------------------
+Helpers for appending freshly fetched bars to stored OHLCV history.
+Yahoo prices are back-adjusted: a split or dividend after the last update rewrites
+every earlier bar. The overlap between stored and fresh bars is therefore compared
+first, and a mismatch means the stored history must be refetched in full.
+"""
+
+
+def update_start(last_date: pd.Timestamp, overlap_days: int) -> pd.Timestamp:
+    """First date to request so the fetched window overlaps the stored history."""
+    return (last_date - pd.Timedelta(days=overlap_days)).normalize()
+
+
+def merge_incremental(stored: pd.DataFrame,
+                      fresh: pd.DataFrame,
+                      rtol: float = 1e-4) -> Optional[pd.DataFrame]:
+    """
+    Appends the bars of `fresh` that are newer than `stored`.
+    The last stored bar is always replaced (it may have been a partial, intraday bar);
+    the bars before it must match the fresh download within `rtol`.
+    Returns None when no verifiable overlap exists or when the overlap differs
+    (split/dividend re-adjustment), signalling a full refetch.
+    """
+    if stored.empty or fresh.empty:
+        return None
+    last = stored.index[-1]
+    common = stored.index.intersection(fresh.index)
+    check = common[common < last]
+    if len(check) == 0:
+        return None
+
+    columns = [c for c in stored.columns if c in fresh.columns]
+    old = stored.loc[check, columns].to_numpy(dtype=float)
+    new = fresh.loc[check, columns].to_numpy(dtype=float)
+    if not np.allclose(old, new, rtol=rtol, equal_nan=True):
+        return None
+
+    appended = fresh.loc[fresh.index >= last].reindex(columns=stored.columns)
+    return pd.concat([stored[stored.index < last], appended])
@@ -1,14 +1,83 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from nifty_500_momentum.data.panel import StockPanel
+from nifty_500_momentum.data.catalog import StockCatalogEntry
 
 class StockDataSource(ABC):
     """Interface for fetching stock market data."""
     
+    # Sources with a native multi-symbol endpoint set this and override `fetch_history_many`
+    supports_batch: bool = False
+    
     @abstractmethod
     def fetch_history(self, ticker: str, period: str = "1y") -> pd.DataFrame:
         """Should return a DataFrame with Index=Date, Cols=[Open, High, Low, Close, Volume]"""
         pass
+    
+    def fetch_history_many(self, tickers: List[str], period: str = "1y") -> Dict[str, pd.DataFrame]:
+        """
+        Batch variant of `fetch_history`. Returns {ticker: DataFrame}; tickers without data may be missing.
+        The default falls back to one call per ticker.
+        """
+        return {ticker: self.fetch_history(ticker, period) for ticker in tickers}
+    
+    def fetch_history_since(self, ticker: str, start: pd.Timestamp) -> pd.DataFrame:
+        """
+        Fetches bars dated on/after `start` (used for incremental updates).
+        The default fetches the smallest `period` that covers `start` and trims it.
+        """
+        df = self.fetch_history(ticker, period_covering(start))
+        return df[df.index >= align_tz(start, df.index)] if not df.empty else df
+    
+    def fetch_history_many_since(self, tickers: List[str], start: pd.Timestamp) -> Dict[str, pd.DataFrame]:
+        """Batch variant of `fetch_history_since`."""
+        return {ticker: self.fetch_history_since(ticker, start) for ticker in tickers}
+
+def period_covering(start: pd.Timestamp) -> str:
+    """Smallest yfinance-style `period` string reaching back to `start`."""
+    days = (pd.Timestamp.now(tz=start.tz) - start).days + 1
+    for period, span in (("5d", 5), ("1mo", 30), ("3mo", 90), ("6mo", 180),
+                         ("1y", 365), ("2y", 730), ("5y", 1826), ("10y", 3652)):
+        if days <= span:
+            return period
+    return "max"
+
+
+def align_tz(ts: pd.Timestamp, like) -> pd.Timestamp:
+    """Converts `ts` to the timezone (or naivety) of `like` (a DatetimeIndex or Arrow timestamp type)."""
+    tz = getattr(like, "tz", None)
+    if tz is None:
+        return ts.tz_localize(None) if ts.tz is not None else ts
+    return ts.tz_convert(tz) if ts.tz is not None else ts.tz_localize(tz)
+
+
+def select_stock_window(df: pd.DataFrame,
+                        columns: Optional[List[str]] = None,
+                        last_n: Optional[int] = None,
+                        start: Optional[pd.Timestamp] = None,
+                        end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """Applies the column / row selection of `StorageBackend.load_stock` to an already loaded frame."""
+    check_stock_window(last_n, start, end)
+    if not df.empty and start is not None:
+        df = df[df.index >= align_tz(pd.Timestamp(start), df.index)]
+    if not df.empty and end is not None:
+        df = df[df.index <= align_tz(pd.Timestamp(end), df.index)]
+    if last_n is not None:
+        df = df.iloc[len(df) - min(last_n, len(df)):]
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
+def check_stock_window(last_n: Optional[int], start, end) -> None:
+    if last_n is not None and (start is not None or end is not None):
+        raise ValueError("Select rows either by last_n or by start/end, not both")
+    if last_n is not None and last_n < 0:
+        raise ValueError(f"last_n must be >= 0, got {last_n}")
+
 
 class NewsDataSource(ABC):
     """Interface for fetching news data."""
@@ -17,6 +86,10 @@ class NewsDataSource(ABC):
     def fetch_news(self, query: str, lookback_days: int = 7) -> List[Dict]:
         """Should return a list of dicts: [{'title':..., 'link':..., 'pubDate':...}]"""
         pass
+    
+    def host(self, query: str) -> str:
+        """Host serving `query`; concurrent collection bounds the requests in flight per host."""
+        return type(self).__name__
 
 class StorageBackend(ABC):
     """Interface for saving/loading data."""
@@ -26,17 +99,86 @@ class StorageBackend(ABC):
         pass
         
     @abstractmethod
-    def load_stock(self, ticker: str) -> pd.DataFrame:
+    def load_stock(self,
+                   ticker: str,
+                   columns: Optional[List[str]] = None,
+                   last_n: Optional[int] = None,
+                   start: Optional[pd.Timestamp] = None,
+                   end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """
+        Stored history of `ticker`, optionally restricted to `columns` (unknown ones are
+        ignored) and to the last `last_n` bars or the bars dated within [start, end].
+        Backends should read only what is selected; see `select_stock_window` for the semantics.
+        Raises FileNotFoundError when nothing is stored.
+        """
+        pass
+    
+    def stock_info(self, ticker: str) -> Optional[StockCatalogEntry]:
+        """
+        Catalog entry (rows, date range, schema, checksum, fetch time) of a stored ticker,
+        answered without reading its data. None when unknown; backends without a catalog
+        always return None and callers fall back to loading.
+        """
+        return None
+    
+    def stock_signature(self, ticker: str) -> Optional[List[int]]:
+        """
+        Cheap fingerprint of a ticker's stored data (e.g. file [mtime_ns, size]) that changes
+        whenever the data does, so derived caches can tell they are stale. None when nothing is
+        stored, or when the backend cannot tell (then derived caches are trusted).
+        """
+        return None
+    
+    def last_stock_date(self, ticker: str) -> Optional[pd.Timestamp]:
+        """Date of the last stored bar, or None if nothing is stored. Backends should override with a cheaper lookup."""
+        try:
+            df = self.load_stock(ticker, columns=[], last_n=1)
+        except FileNotFoundError:
+            return None
+        return df.index[-1] if not df.empty else None
+    
+    def load_panel(self,
+                   tickers: Optional[List[str]] = None,
+                   fields: Optional[List[str]] = None,
+                   start: Optional[pd.Timestamp] = None,
+                   end: Optional[pd.Timestamp] = None) -> StockPanel:
+        """
+        Loads many tickers at once as aligned (dates x tickers) arrays.
+        `tickers` defaults to the stored universe (`load_tickers`). The default assembles the
+        panel from `load_stock` calls; columnar backends override it with a single read.
+        """
+        tickers = list(tickers) if tickers is not None else list(self.load_tickers() or {})
+        frames = {}
+        for ticker in tickers:
+            try:
+                frames[ticker] = self.load_stock(ticker, columns=fields, start=start, end=end)
+            except FileNotFoundError:
+                frames[ticker] = pd.DataFrame()
+        return StockPanel.from_frames(frames, fields)
+    
+    def flush(self) -> None:
+        """Called after a bulk write (e.g. a collection run). Backends that stage writes persist them here."""
         pass
 
     @abstractmethod
-    def save_news(self, query: str, news_items: List[Dict]):
+    def save_news(self, query: str, news_items: List[Dict], ticker: Optional[str] = None):
         pass
     
     @abstractmethod
     def load_news(self, query: str) -> List[Dict]:
         pass
     
+    def load_news_many(self,
+                       queries: Dict[str, str],
+                       published_since: Optional[datetime] = None,
+                       exclude_sources: Optional[List[str]] = None) -> Dict[str, Optional[List[Dict]]]:
+        """
+        Bulk variant of `load_news` for {ticker: query}, returning {ticker: articles or None}.
+        The filters are pushdown hints: indexed backends apply them in the query, others may
+        ignore them, so callers still apply their own filters to the result.
+        """
+        return {ticker: self.load_news(query) for ticker, query in queries.items()}
+    
     @abstractmethod
     def save_tickers(self, tickers: Dict[str, str]):
         pass
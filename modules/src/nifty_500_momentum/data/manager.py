@@ -2,11 +2,18 @@ import time
 import pandas as pd
 import logging
 import numpy as np
-from typing import List, Optional
-from nifty_500_momentum.data.config import DATA_CONFIG, DataConfig
-from nifty_500_momentum.data.interfaces import StockDataSource, NewsDataSource, StorageBackend
+from typing import Callable, Dict, List, Optional, Set
+from nifty_500_momentum.data.config import DATA_CONFIG, DataConfig, StockLayout
+from nifty_500_momentum.data.interfaces import StockDataSource, NewsDataSource, StorageBackend, select_stock_window
 from nifty_500_momentum.data.sources import YFinanceSource, GoogleNewsRSSSource
-from nifty_500_momentum.data.storage import LocalStorage
+from nifty_500_momentum.data.http_client import HttpClient, shared_http_client
+from nifty_500_momentum.data.storage import LocalStorage, PanelStorage
+from nifty_500_momentum.data.panel import StockPanel
+from nifty_500_momentum.data.cube import OHLCVCube
+from nifty_500_momentum.data.fetch_pool import StockFetchPool, CollectionReport
+from nifty_500_momentum.data.news_pool import NewsFetchPool
+from nifty_500_momentum.data.rate_limiter import TokenBucket
+from nifty_500_momentum.data.incremental import merge_incremental, update_start
 
 class DataManager:
     def __init__(
@@ -18,34 +25,52 @@ class DataManager:
         storage: Optional[StorageBackend] = None,
     ) -> None:
         self.config = config
-        self.stock_api: StockDataSource = stock_api or YFinanceSource()
-        self.news_api: NewsDataSource = news_api or GoogleNewsRSSSource()
-        self.storage: StorageBackend = storage or LocalStorage(config)
+        self.http_client: HttpClient = shared_http_client(config)
+        self.stock_api: StockDataSource = stock_api or YFinanceSource(batch_size=config.stock_batch_size)
+        self.news_api: NewsDataSource = news_api or GoogleNewsRSSSource(timeout=config.news_fetch_timeout,
+                                                                        client=self.http_client)
+        self.storage: StorageBackend = storage or (
+            PanelStorage(config) if config.stock_layout == StockLayout.PANEL else LocalStorage(config)
+        )
+        self._cube: Optional[OHLCVCube] = None
+        self._cube_stale: Set[str] = set()  # cube tickers whose stored data changed since the build
         logging.basicConfig(level=logging.INFO)
 
     # --- Pipeline 1: Stock Data Collection ---
     def collect_stock_universe(self, 
                                tickers: List[str], 
                                period: str = "2y",
-                               force_refresh: bool = False) -> None:
+                               force_refresh: bool = False,
+                               incremental: bool = False,
+                               max_workers: Optional[int] = None) -> CollectionReport:
         """
         Iterates through list of tickers, fetches data, and saves to storage.
         Includes Rate Limiting.
+        With `max_workers` (or `config.stock_max_workers`) > 1, or a source that supports
+        batch downloads, the tickers are fetched through a worker pool (in chunks of
+        `config.stock_batch_size` when batching) throttled by a shared token bucket
+        instead of per-ticker sleeps.
+        With `incremental`, tickers already in storage are brought up to date by fetching
+        only the bars since their last stored date (see `data/incremental.py`); tickers the
+        storage catalog reports as current are skipped.
         """
+        tickers = list(tickers)
+        max_workers = max_workers or self.config.stock_max_workers
         logging.info(f"Starting collection for {len(tickers)} stocks...")
         
-        success_count = 0
+        if max_workers > 1 or self.stock_api.supports_batch or incremental:
+            return self._collect_with_pool(tickers, period, force_refresh, incremental, max_workers)
+        
+        report = CollectionReport(total=len(tickers))
+        start = time.perf_counter()
         
         for i, ticker in enumerate(tickers):
             try:
-                if not force_refresh:
-                    try:
-                        _ = self.storage.load_stock(ticker)
-                        logging.info(f"[{i+1}/{len(tickers)}] {ticker} already exists. Skipping.")
-                        success_count += 1
-                        continue
-                    except FileNotFoundError:
-                        pass
+                if not force_refresh and self.storage.last_stock_date(ticker) is not None:
+                    logging.info(f"[{i+1}/{len(tickers)}] {ticker} already exists. Skipping.")
+                    report.succeeded += 1
+                    report.skipped += 1
+                    continue
                 logging.info(f"[{i+1}/{len(tickers)}] Fetching {ticker}...")
                 
                 df = self.stock_api.fetch_history(ticker, period)
@@ -53,32 +78,204 @@ class DataManager:
                 if not df.empty:
                     self.storage.save_stock(ticker, df)
                     logging.info("Done.")
-                    success_count += 1
+                    report.succeeded += 1
+                    report.bytes_fetched += int(df.memory_usage(deep=True).sum())
                 else:
                     logging.warning("Empty Data.")
+                    report.failed[ticker] = "Empty Data"
                 
                 # Rate Limiting
                 time.sleep(self.config.stock_api_sleep + np.random.uniform(0, 3))
                 
             except Exception as e:
                 logging.error(f"Failed: {e}")
-                
-        logging.info(f"Collection Complete. Success: {success_count}/{len(tickers)}")
+                report.failed[ticker] = str(e)
+        
+        report.elapsed_seconds = time.perf_counter() - start
+        self._finish_collection(tickers)
+        logging.info(f"Collection Complete. {report.summary()}")
+        return report
+
+    def _collect_with_pool(self,
+                           tickers: List[str],
+                           period: str,
+                           force_refresh: bool,
+                           incremental: bool,
+                           max_workers: int) -> CollectionReport:
+        to_fetch = []
+        since = {}
+        as_of = self.last_session_date()
+        for ticker in tickers:
+            if not force_refresh:
+                # Planning reads the storage catalog, not the stored files
+                info = self.storage.stock_info(ticker)
+                last_date = info.last_timestamp() if info is not None else self.storage.last_stock_date(ticker)
+                if last_date is not None:
+                    if not incremental or (info is not None and info.is_current(as_of)):
+                        continue
+                    since[ticker] = update_start(last_date, self.config.stock_update_overlap_days)
+            to_fetch.append(ticker)
+        skipped = len(tickers) - len(to_fetch)
+        logging.info(f"{skipped} stocks already exist. Fetching {len(to_fetch) - len(since)} in full and "
+                     f"updating {len(since)} with {max_workers} workers...")
+        
+        pool = StockFetchPool(
+            source=self.stock_api,
+            storage=self.storage,
+            max_workers=max_workers,
+            limiter=TokenBucket(rate=self.config.stock_rate_limit, capacity=self.config.stock_rate_burst),
+            timeout=self.config.stock_fetch_timeout,
+            batch_size=self.config.stock_batch_size,
+            batch_timeout=self.config.stock_batch_timeout,
+        )
+        report = pool.run(to_fetch, period, since=since, merge=self._merge_with_stored)
+        report.total = len(tickers)
+        report.succeeded += skipped
+        report.skipped = skipped
+        self._finish_collection(tickers)
+        logging.info(f"Collection Complete. {report.summary()}")
+        return report
+
+    def _finish_collection(self, tickers: List[str]) -> None:
+        self.storage.flush()
+        if self.config.stock_cube:
+            self.build_stock_cube(list(self.storage.load_tickers() or tickers))
+
+    @staticmethod
+    def last_session_date() -> pd.Timestamp:
+        """The most recent weekday before today: the latest session that is surely complete."""
+        return pd.Timestamp.now().normalize() - pd.offsets.BDay(1)
+
+    def stale_tickers(self, tickers: List[str], as_of: Optional[pd.Timestamp] = None) -> List[str]:
+        """
+        Tickers whose stored history does not reach `as_of` (default: `last_session_date`),
+        answered from the storage catalog. Uncatalogued tickers count as stale.
+        """
+        as_of = as_of if as_of is not None else self.last_session_date()
+        stale = []
+        for ticker in tickers:
+            info = self.storage.stock_info(ticker)
+            if info is None or not info.is_current(as_of):
+                stale.append(ticker)
+        return stale
+
+    def tickers_with_data_since(self, tickers: List[str], start: pd.Timestamp) -> List[str]:
+        """
+        Tickers whose stored history extends to `start` or later, per the storage catalog.
+        Tickers the catalog does not know are kept (the caller loads them to find out).
+        """
+        selected = []
+        for ticker in tickers:
+            info = self.storage.stock_info(ticker)
+            if info is None:
+                selected.append(ticker)
+            elif info.last_date is not None and \
+                    info.last_timestamp().tz_localize(None) >= pd.Timestamp(start).tz_localize(None):
+                selected.append(ticker)
+        return selected
+
+    def rebuild_stock_catalog(self) -> int:
+        """Catalogues stock files stored before the catalog existed. Returns the catalog size."""
+        rebuild = getattr(self.storage, "rebuild_catalog", None)
+        return len(rebuild()) if rebuild is not None else 0
+
+    def _merge_with_stored(self, ticker: str, fresh: pd.DataFrame) -> Optional[pd.DataFrame]:
+        return merge_incremental(self.storage.load_stock(ticker), fresh)
 
     # --- Pipeline 2: Stock Data Retrieval ---
-    def get_stock_data(self, ticker: str) -> pd.DataFrame:
+    @property
+    def stock_cube(self) -> Optional[OHLCVCube]:
+        """
+        The memory-mapped OHLCV cube, if enabled in the config and built. Tickers saved since
+        the build are read from storage instead (see `OHLCVCube.stale_tickers`).
+        """
+        if self._cube is None and self.config.stock_cube and OHLCVCube.exists(self.config.stock_cube_dir):
+            self._cube = OHLCVCube(self.config.stock_cube_dir)
+            self._cube_stale = set(self._cube.stale_tickers(self.storage))
+            if self._cube_stale:
+                logging.warning(f"OHLCV cube built at {self._cube.built_at} is stale for {len(self._cube_stale)} tickers; "
+                                f"reading them from storage. Run build_stock_cube() to refresh it.")
+        return self._cube
+
+    def build_stock_cube(self, tickers: Optional[List[str]] = None) -> OHLCVCube:
+        """(Re)builds the memory-mapped cube from storage. Runs after collection when `config.stock_cube` is set."""
+        self._cube = OHLCVCube.build(self.storage, self.config.stock_cube_dir, tickers)
+        self._cube_stale = set()
+        return self._cube
+
+    def _cube_stale_among(self, tickers: Optional[List[str]] = None) -> Set[str]:
+        """
+        Requested tickers (default: the cube's) the cube must not serve: stale at load or
+        build, plus tickers outside the cube that were stored since the build.
+        """
+        if tickers is None:
+            return set(self._cube_stale)
+        return self._cube_stale.intersection(tickers) | \
+            set(self._cube.stale_tickers(self.storage, [t for t in tickers if t not in self._cube.sources]))
+
+    def _cube_serves(self, ticker: str) -> bool:
+        return ticker in self._cube and not self._cube_stale_among([ticker])
+
+    def get_stock_data(self,
+                       ticker: str,
+                       columns: Optional[List[str]] = None,
+                       last_n: Optional[int] = None,
+                       start: Optional[pd.Timestamp] = None,
+                       end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """
         Fetches stock data from LOCAL STORAGE.
         Raises error if data is missing (forcing user to run collection).
+        `columns` and `last_n` or `start`/`end` restrict what is read (see `StorageBackend.load_stock`).
+        With the OHLCV cube enabled, the frame is a read-only view of the memory map.
         """
+        cube = self.stock_cube
+        if cube is not None and self._cube_serves(ticker):
+            return select_stock_window(cube.frame(ticker), columns, last_n, start, end)
         try:
-            return self.storage.load_stock(ticker)
+            return self.storage.load_stock(ticker, columns=columns, last_n=last_n, start=start, end=end)
         except FileNotFoundError:
             # Custom error handling or re-raising
             logging.error(f"ERROR: Data for {ticker} not found locally.")
             logging.info(f"Tip: Run 'collect_stock_universe(['{ticker}'])' first.")
             return pd.DataFrame()
 
+    def get_stock_panel(self,
+                        tickers: Optional[List[str]] = None,
+                        fields: Optional[List[str]] = None,
+                        start: Optional[pd.Timestamp] = None,
+                        end: Optional[pd.Timestamp] = None) -> StockPanel:
+        """
+        Bulk retrieval from LOCAL STORAGE: aligned (dates x tickers) arrays for many tickers.
+        Tickers without stored data come back as all-NaN columns.
+        """
+        cube = self.stock_cube
+        if cube is not None:
+            stale = self._cube_stale_among(tickers)
+            if not stale:
+                return cube.panel(tickers=tickers, fields=fields, start=start, end=end)
+            # Stale tickers may have bars past the cube's dates: one storage read keeps the panel aligned
+            logging.info(f"Reading the panel from storage: {len(stale)} requested tickers changed since the cube was built.")
+            tickers = tickers if tickers is not None else cube.tickers
+        return self.storage.load_panel(tickers=tickers, fields=fields, start=start, end=end)
+
+    def stock_frames(self, tickers: List[str]) -> Callable[[str], pd.DataFrame]:
+        """
+        Per-ticker frame accessor for bulk passes over the universe: zero-copy views of the
+        cube when enabled, otherwise frames of one panel read covering `tickers`.
+        """
+        cube = self.stock_cube
+        if cube is None:
+            return self.get_stock_panel(tickers).frame
+        stale = self._cube_stale_among(tickers)
+        if not stale and all(ticker in cube.sources for ticker in tickers):
+            return cube.frame
+        return lambda ticker: cube.frame(ticker) if ticker in cube and ticker not in stale else self.get_stock_data(ticker)
+
+    def stock_cache_stats(self) -> dict:
+        """Hit/miss statistics of the process-wide stock read cache ({} when storage has none)."""
+        cache = getattr(self.storage, "read_cache", None)
+        return cache.stats() if cache is not None else {}
+
     # --- Pipeline 3: News Data (Fetch + Cache) ---
     def get_news_for_stock(self, 
                            ticker: str, 
@@ -105,10 +302,40 @@ class DataManager:
         
         # 3. Save to Cache
         if news_items:
-            self.storage.save_news(query, news_items)
+            self.storage.save_news(query, news_items, ticker=ticker)
             
         return news_items
 
+    def collect_news(self,
+                     queries: Dict[str, str],
+                     force_refresh: bool = False,
+                     max_workers: Optional[int] = None) -> CollectionReport:
+        """
+        Fetches news for many {ticker: query} pairs concurrently and caches each result as
+        it arrives (see `data/news_pool.py`). Queries with a valid cache entry are skipped
+        unless `force_refresh`.
+        """
+        cached = {} if force_refresh else self.storage.load_news_many(queries)
+        to_fetch = {ticker: query for ticker, query in queries.items() if not cached.get(ticker)}
+        skipped = len(queries) - len(to_fetch)
+        max_workers = max_workers or self.config.news_max_workers
+        logging.info(f"{skipped} news queries cached. Fetching {len(to_fetch)} with {max_workers} workers...")
+
+        pool = NewsFetchPool(
+            source=self.news_api,
+            storage=self.storage,
+            max_workers=max_workers,
+            per_host=self.config.news_per_host,
+            limiter=TokenBucket(rate=self.config.news_rate_limit, capacity=self.config.news_rate_burst),
+            timeout=self.config.news_fetch_timeout,
+        )
+        report = pool.run(to_fetch)
+        report.total = len(queries)
+        report.succeeded += skipped
+        report.skipped = skipped
+        logging.info(f"News Collection Complete. {report.summary()}")
+        return report
+
 """
 # --- Example Usage (If running this file directly) ---
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List
+
+from nifty_500_momentum.data.interfaces import NewsDataSource, StorageBackend
+from nifty_500_momentum.data.rate_limiter import TokenBucket
+from nifty_500_momentum.data.fetch_pool import CollectionReport
+
+"""
+NEWS POOL
+---------
+Concurrent news collection engine used by `DataManager.collect_news`.
+Worker threads share one token bucket (overall request rate) and a semaphore per
+host (requests in flight towards one server), and each result is written to the
+news cache as soon as it arrives.
+"""
+
+
+class NewsFetchPool:
+    """
+    Fetches news queries on a thread pool through any `NewsDataSource`.
+    - Per-host concurrency: at most `per_host` requests to one `source.host(query)` at a time.
+    - Rate limiting: every request takes a token from the shared bucket.
+    - Error isolation: a failing query is recorded in the report, the others continue.
+    - Timeouts: a request running longer than `timeout` seconds is marked as failed and
+      its late result is discarded (sources should also enforce their own timeout).
+    """
+    def __init__(self,
+                 source: NewsDataSource,
+                 storage: StorageBackend,
+                 max_workers: int = 8,
+                 per_host: int = 4,
+                 limiter: TokenBucket | None = None,
+                 timeout: float = 30.0) -> None:
+        self.source = source
+        self.storage = storage
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+        self.limiter = limiter
+        self.timeout = timeout
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def run(self, queries: Dict[str, str], lookback_days: int = 7) -> CollectionReport:
+        """
+        Fetches and caches news for {ticker: query}.
+        Queries returning no articles are reported as failed and not cached.
+        """
+        report = CollectionReport(total=len(queries))
+        jobs: List[tuple] = list(queries.items())
+        started_at: Dict[int, float] = {}
+        abandoned: set[int] = set()
+        lock = threading.Lock()
+
+        def _work(job_id: int) -> int:
+            ticker, query = jobs[job_id]
+            with self._slot(self.source.host(query)):
+                if self.limiter is not None:
+                    self.limiter.acquire()
+                with lock:
+                    started_at[job_id] = time.monotonic()
+                news_items = self.source.fetch_news(query, lookback_days)
+            with lock:
+                if job_id in abandoned:
+                    return 0
+            if not news_items:
+                raise ValueError("No articles")
+            self.storage.save_news(query, news_items, ticker=ticker)
+            return len(json.dumps(news_items))
+
+        def _record(ticker: str, result: int | Exception) -> None:
+            if isinstance(result, Exception):
+                report.failed[ticker] = str(result)
+                logging.warning(f"News for {ticker} failed: {result}")
+            else:
+                report.bytes_fetched += result
+                report.succeeded += 1
+                logging.info(f"[{report.succeeded + len(report.failed)}/{report.total}] News for {ticker} cached.")
+
+        start = time.perf_counter()
+        poll_interval = min(1.0, self.timeout / 4)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="news-fetch")
+        try:
+            futures = {executor.submit(_work, job_id): job_id for job_id in range(len(jobs))}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job_id = futures[future]
+                    try:
+                        _record(jobs[job_id][0], future.result())
+                    except Exception as e:
+                        _record(jobs[job_id][0], e)
+
+                now = time.monotonic()
+                with lock:
+                    for future in list(pending):
+                        job_id = futures[future]
+                        if job_id in started_at and now - started_at[job_id] > self.timeout:
+                            abandoned.add(job_id)
+                            pending.discard(future)
+                            _record(jobs[job_id][0], TimeoutError(f"Timed out after {self.timeout}s"))
+        finally:
+            # Do not block on abandoned (timed out) requests
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
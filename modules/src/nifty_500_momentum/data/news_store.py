@@ -0,0 +1,173 @@
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+from dateutil import parser as date_parser
+
+"""
+NEWS STORE
+----------
+SQLite-backed news cache (the `NewsBackend.SQLITE` option of `LocalStorage`).
+- articles:       one row per link (articles shared by overlapping queries are stored once)
+- queries:        one row per search query with its ticker and fetch time (cache expiry)
+- query_articles: which articles a query returned, in feed order
+Indexed on ticker, query and published date so the news of a whole shortlist can be
+selected, and filtered by date/source, in a single query.
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    link TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    published TEXT NOT NULL,      -- as delivered by the feed
+    published_at TEXT             -- parsed, naive ISO timestamp (NULL when unparseable)
+);
+CREATE TABLE IF NOT EXISTS queries (
+    query TEXT PRIMARY KEY,
+    ticker TEXT,
+    fetched_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS query_articles (
+    query TEXT NOT NULL REFERENCES queries(query),
+    link TEXT NOT NULL REFERENCES articles(link),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (query, link)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at);
+CREATE INDEX IF NOT EXISTS idx_queries_ticker ON queries(ticker);
+CREATE INDEX IF NOT EXISTS idx_query_articles_link ON query_articles(link);
+"""
+
+
+def parse_published(raw: str) -> Optional[str]:
+    """Same parsing as `NewsArticle.published_dt` (timezone dropped, not converted)."""
+    if not raw:
+        return None
+    try:
+        return date_parser.parse(raw).replace(tzinfo=None).isoformat()
+    except Exception:
+        return None
+
+
+class SQLiteNewsStore:
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()  # sqlite3 connections are per thread
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # --- Writes ---
+    def save(self, query: str, articles: List[Dict], ticker: Optional[str] = None) -> None:
+        self.save_many({query: (ticker, articles)})
+
+    def save_many(self, results: Dict[str, tuple]) -> None:
+        """Stores {query: (ticker, articles)} in one transaction, replacing earlier results of those queries."""
+        fetched_at = datetime.now().isoformat()
+        article_rows, query_rows, link_rows = [], [], []
+        for query, (ticker, articles) in results.items():
+            query_rows.append((query, ticker, fetched_at))
+            seen = set()
+            for position, item in enumerate(articles):
+                if item["link"] in seen:
+                    continue
+                seen.add(item["link"])
+                article_rows.append((item["link"], item["title"], item["source"], item["published"],
+                                     parse_published(item["published"])))
+                link_rows.append((query, item["link"], position))
+
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO articles (link, title, source, published, published_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(link) DO UPDATE SET title = excluded.title, source = excluded.source, "
+                "published = excluded.published, published_at = excluded.published_at",
+                article_rows,
+            )
+            conn.executemany("DELETE FROM query_articles WHERE query = ?", [(row[0],) for row in query_rows])
+            conn.executemany(
+                "INSERT INTO queries (query, ticker, fetched_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(query) DO UPDATE SET ticker = COALESCE(excluded.ticker, queries.ticker), "
+                "fetched_at = excluded.fetched_at",
+                query_rows,
+            )
+            conn.executemany("INSERT INTO query_articles (query, link, position) VALUES (?, ?, ?)", link_rows)
+
+    # --- Reads ---
+    def select(self,
+               queries: Optional[List[str]] = None,
+               tickers: Optional[List[str]] = None,
+               fetched_since: Optional[datetime] = None,
+               published_since: Optional[datetime] = None,
+               published_until: Optional[datetime] = None,
+               exclude_sources: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Articles matching all given conditions, in (query, feed) order. Each row carries
+        `query` and `ticker` besides the article fields. `exclude_sources` matches case-insensitive
+        substrings of the source name; articles with an unparseable date pass date conditions.
+        """
+        sql = ["SELECT q.query, q.ticker, a.title, a.link, a.published, a.source",
+               "FROM queries q JOIN query_articles qa ON qa.query = q.query JOIN articles a ON a.link = qa.link",
+               "WHERE 1 = 1"]
+        params: list = []
+        if queries is not None:
+            sql.append(f"AND q.query IN ({', '.join('?' * len(queries))})")
+            params.extend(queries)
+        if tickers is not None:
+            sql.append(f"AND q.ticker IN ({', '.join('?' * len(tickers))})")
+            params.extend(tickers)
+        if fetched_since is not None:
+            sql.append("AND q.fetched_at >= ?")
+            params.append(fetched_since.isoformat())
+        if published_since is not None:
+            sql.append("AND (a.published_at IS NULL OR a.published_at >= ?)")
+            params.append(published_since.isoformat())
+        if published_until is not None:
+            sql.append("AND (a.published_at IS NULL OR a.published_at <= ?)")
+            params.append(published_until.isoformat())
+        for term in exclude_sources or []:
+            sql.append("AND instr(lower(a.source), ?) = 0")
+            params.append(term.lower())
+        sql.append("ORDER BY q.query, qa.position")
+
+        cursor = self._connection().execute(" ".join(sql), params)
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def fresh_queries(self, queries: List[str], max_age_hours: float) -> List[str]:
+        """Queries fetched within the last `max_age_hours`."""
+        if not queries:
+            return []
+        cutoff = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
+        rows = self._connection().execute(
+            f"SELECT query FROM queries WHERE fetched_at >= ? AND query IN ({', '.join('?' * len(queries))})",
+            [cutoff, *queries],
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def load_many(self,
+                  queries: Dict[str, str],
+                  max_age_hours: float,
+                  **filters) -> Dict[str, Optional[List[Dict]]]:
+        """
+        {ticker: query} -> {ticker: articles} in one select; None for queries that are
+        missing or older than `max_age_hours` (same contract as `load_news`).
+        """
+        fresh = set(self.fresh_queries(list(set(queries.values())), max_age_hours))
+        by_query: Dict[str, List[Dict]] = {query: [] for query in fresh}
+        if fresh:
+            for row in self.select(queries=list(fresh), **filters):
+                by_query[row["query"]].append(
+                    {"title": row["title"], "link": row["link"], "published": row["published"], "source": row["source"]}
+                )
+        return {ticker: by_query.get(query) for ticker, query in queries.items()}
@@ -1,7 +1,9 @@
 import pandas as pd
-import requests
 import io
 import logging
+from typing import Optional
+
+from nifty_500_momentum.data.http_client import HttpClient, shared_http_client
 
 """
 UNIVERSE MODULE
@@ -9,9 +11,9 @@ UNIVERSE MODULE
 Fetches the official list of Nifty 500 stocks from NSE website.
 """
 
-def get_nifty500_tickers() -> dict:
+def get_nifty500_tickers(client: Optional[HttpClient] = None) -> dict:
     """
-    Fetches the latest Nifty 500 ticker list from NSE Archives.
+    Fetches the latest Nifty 500 ticker list from NSE Archives (through `client`, default the shared one).
     Returns a dictionary: {'Company Name': 'TICKER.NS'}
     Example: {'Reliance Industries Ltd.': 'RELIANCE.NS'}
     """
@@ -23,8 +25,8 @@ def get_nifty500_tickers() -> dict:
 
     try:
         logging.info("Fetching Nifty 500 list from NSE...")
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        # Conditional GET through the shared client: an unchanged list costs a 304
+        response = (client or shared_http_client()).get(url, headers=headers, timeout=10)
         
         # Read CSV from memory
         df = pd.read_csv(io.StringIO(response.content.decode('utf-8')))
@@ -56,7 +58,7 @@ def get_nifty500_tickers() -> dict:
         return get_fallback_tickers()
 
 
-def get_full_index_info() -> pd.DataFrame:
+def get_full_index_info(client: Optional[HttpClient] = None) -> pd.DataFrame:
     """Fetches the full Nifty 500 index information as a DataFrame."""
     url = "https://nsearchives.nseindia.com/content/indices/ind_nifty500list.csv"
     
@@ -66,8 +68,7 @@ def get_full_index_info() -> pd.DataFrame:
 
     try:
         logging.info("Fetching full Nifty 500 index information from NSE...")
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response = (client or shared_http_client()).get(url, headers=headers, timeout=10)
         
         df = pd.read_csv(io.StringIO(response.content.decode('utf-8')))
         logging.info(f"Successfully loaded full index info with {len(df)} entries.")
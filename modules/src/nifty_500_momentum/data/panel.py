@@ -0,0 +1,91 @@
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+"""
+STOCK PANEL
+-----------
+Universe-wide view of OHLCV data: one (dates x tickers) float array per field,
+aligned on the union of trading dates. Missing bars (before listing, suspensions,
+tickers without data) are NaN.
+"""
+
+OHLCV_FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class StockPanel(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    dates: pd.DatetimeIndex
+    tickers: List[str]
+    fields: Dict[str, np.ndarray]  # field -> array of shape (len(dates), len(tickers))
+
+    _positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        self._positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._positions
+
+    def field(self, name: str) -> np.ndarray:
+        """2-D (dates x tickers) array of one field."""
+        return self.fields[name]
+
+    def frame(self, ticker: str) -> pd.DataFrame:
+        """
+        Per-ticker DataFrame in the same shape `StorageBackend.load_stock` returns,
+        restricted to the dates the ticker actually traded. Empty if the ticker has no data.
+        """
+        col = self._positions.get(ticker)
+        if col is None:
+            return pd.DataFrame()
+        data = {name: values[:, col] for name, values in self.fields.items()}
+        df = pd.DataFrame(data, index=self.dates)
+        return df.dropna(how="all")
+
+    @classmethod
+    def from_long(cls,
+                  dates: np.ndarray,
+                  columns: np.ndarray,
+                  values: Dict[str, np.ndarray],
+                  tickers: List[str],
+                  tz=None) -> "StockPanel":
+        """
+        Pivots long-format rows into aligned 2-D arrays.
+        `columns` holds each row's position in `tickers` (-1 drops the row).
+        """
+        unique_dates, row = np.unique(dates, return_inverse=True)
+        keep = columns >= 0
+        row, col = row[keep], columns[keep]
+
+        fields = {}
+        for name, column in values.items():
+            grid = np.full((len(unique_dates), len(tickers)), np.nan)
+            grid[row, col] = column[keep]
+            fields[name] = grid
+
+        index = pd.DatetimeIndex(unique_dates, name="Date")
+        if tz is not None:
+            index = index.tz_localize("UTC").tz_convert(tz) if index.tz is None else index.tz_convert(tz)
+        return cls(dates=index, tickers=list(tickers), fields=fields)
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame], fields: Optional[List[str]] = None) -> "StockPanel":
+        """Aligns per-ticker DataFrames (the slow path, used when no panel store exists)."""
+        fields = fields or OHLCV_FIELDS
+        non_empty = {t: df for t, df in frames.items() if not df.empty}
+        if not non_empty:
+            return cls(dates=pd.DatetimeIndex([], name="Date"), tickers=list(frames),
+                       fields={name: np.empty((0, len(frames))) for name in fields})
+        index = pd.DatetimeIndex(sorted(set().union(*(df.index for df in non_empty.values()))), name="Date")
+        arrays = {}
+        for name in fields:
+            grid = np.full((len(index), len(frames)), np.nan)
+            for i, ticker in enumerate(frames):
+                df = non_empty.get(ticker)
+                if df is not None and name in df.columns:
+                    grid[index.get_indexer(df.index), i] = df[name].to_numpy(dtype=float)
+            arrays[name] = grid
+        return cls(dates=index, tickers=list(frames), fields=arrays)
@@ -0,0 +1,127 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+import pandas as pd
+
+"""
+READ CACHE
+----------
+Process-wide LRU cache of decoded stock frames in front of `LocalStorage.load_stock`.
+Entries are keyed by file path and validated against the file's (mtime, size), so a
+file rewritten by a collection run (in this or another process) is re-read on next access.
+"""
+
+
+class StockReadCache:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], pd.DataFrame, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_load(self, path: Path, loader: Callable[[Path], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Returns the cached frame for `path` if the file is unchanged, else loads and caches it.
+        Raises FileNotFoundError for missing files (like the loader would).
+        Callers get a shallow copy, so re-assigning the index/columns never leaks into the cache.
+        """
+        stat = path.stat()
+        key, signature = str(path), (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == signature:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1].copy(deep=False)
+                self._drop(key)
+                self.invalidations += 1
+            self.misses += 1
+
+        df = loader(path)
+        nbytes = int(df.memory_usage(deep=True).sum())
+        if self.max_bytes > 0 and nbytes <= self.max_bytes:
+            with self._lock:
+                if key in self._entries:
+                    self._drop(key)
+                self._entries[key] = (signature, df, nbytes)
+                self._bytes += nbytes
+                self._evict()
+        return df.copy(deep=False)
+
+    def peek(self, path: Path) -> Optional[pd.DataFrame]:
+        """The cached frame for `path` if present and current, without loading on a miss (not counted)."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry is None or entry[0] != (stat.st_mtime_ns, stat.st_size):
+                return None
+            self._entries.move_to_end(str(path))
+            return entry[1].copy(deep=False)
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            if str(path) in self._entries:
+                self._drop(str(path))
+                self.invalidations += 1
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _drop(self, key: str) -> None:
+        _, _, nbytes = self._entries.pop(key)
+        self._bytes -= nbytes
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._drop(key)
+            self.evictions += 1
+
+
+_SHARED_CACHE: Optional[StockReadCache] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_stock_cache(max_mb: int) -> StockReadCache:
+    """
+    The cache shared by every `LocalStorage` (and so every `DataManager`) in this process.
+    Its budget is the largest one requested so far.
+    """
+    global _SHARED_CACHE
+    max_bytes = max_mb * 1024 * 1024
+    with _SHARED_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = StockReadCache(max_bytes)
+        elif max_bytes > _SHARED_CACHE.max_bytes:
+            _SHARED_CACHE.resize(max_bytes)
+        return _SHARED_CACHE
@@ -1,16 +1,28 @@
 import feedparser
 import urllib.parse
+from typing import Optional
 from nifty_500_momentum.data.interfaces import NewsDataSource
+from nifty_500_momentum.data.http_client import HttpClient, shared_http_client
 
 import logging
 
 class GoogleNewsRSSSource(NewsDataSource):
+    def __init__(self,
+                 base_url: str = "https://news.google.com/rss/search",
+                 timeout: float = 20.0,
+                 client: Optional[HttpClient] = None) -> None:
+        # `base_url` can point at a local RSS stub for load tests
+        self.base_url = base_url
+        self.timeout = timeout
+        self.client = client or shared_http_client()
+
+    def host(self, query: str) -> str:
+        return urllib.parse.urlparse(self.base_url).netloc
+
     def fetch_news(self, query: str, lookback_days: int = 7) -> list:
         """
         Fetches news from Google News RSS.
         """
-        base_url = "https://news.google.com/rss/search"
-        
         # Build search query params
         # ceid=IN:en sets region to India, Language to English
         params = {
@@ -20,11 +32,11 @@ class GoogleNewsRSSSource(NewsDataSource):
             "ceid": "IN:en"
         }
         
-        encoded_query = urllib.parse.urlencode(params)
-        final_url = f"{base_url}?{encoded_query}"
-        
         try:
-            feed = feedparser.parse(final_url)
+            # Pooled, conditional download (an unchanged feed costs a 304); feedparser only parses the bytes
+            response = self.client.get(self.base_url, params=params,
+                                       headers={"User-Agent": feedparser.USER_AGENT}, timeout=self.timeout)
+            feed = feedparser.parse(response.content)
             news_items = []
             
             for entry in feed.entries:
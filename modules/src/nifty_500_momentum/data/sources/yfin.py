@@ -1,18 +1,32 @@
 import yfinance as yf
 import pandas as pd
+from typing import Dict, List
 from nifty_500_momentum.data.interfaces import StockDataSource
 import logging
 
 
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
 class YFinanceSource(StockDataSource):
+    supports_batch = True
+
+    def __init__(self, batch_size: int = 40) -> None:
+        self.batch_size = batch_size
+
+    @staticmethod
+    def _to_symbol(ticker: str) -> str:
+        # Auto-append .NS for Indian stocks if not present
+        if not ticker.endswith(".NS") and not ticker.endswith(".BO"):
+            return f"{ticker}.NS"
+        return ticker
+
     def fetch_history(self, ticker: str, period: str = "2y") -> pd.DataFrame:
         """
         Fetches data from Yahoo Finance.
         Handles the '.NS' suffix logic for Indian markets if missing.
         """
-        # Auto-append .NS for Indian stocks if not present
-        if not ticker.endswith(".NS") and not ticker.endswith(".BO"):
-            ticker = f"{ticker}.NS"
+        ticker = self._to_symbol(ticker)
             
         try:
             # group_by='ticker' ensures we get a flat dataframe for a single ticker
@@ -23,9 +37,70 @@ class YFinanceSource(StockDataSource):
                 raise ValueError(f"No data found for {ticker}")
                 
             # Clean up columns (Remove Dividends/Splits if not needed)
-            df = df[['Open', 'High', 'Low', 'Close', 'Volume']]
+            df = df[OHLCV_COLUMNS]
             return df
             
         except Exception as e:
             logging.error(f"Error fetching {ticker} from YFinance: {e}")
-            return pd.DataFrame()
\ No newline at end of file
+            return pd.DataFrame()
+
+    def fetch_history_since(self, ticker: str, start: pd.Timestamp) -> pd.DataFrame:
+        """Fetches only the bars dated on/after `start`."""
+        symbol = self._to_symbol(ticker)
+        try:
+            df = yf.Ticker(symbol).history(start=start.strftime("%Y-%m-%d"))
+            return df[OHLCV_COLUMNS] if not df.empty else pd.DataFrame()
+        except Exception as e:
+            logging.error(f"Error fetching {symbol} since {start.date()} from YFinance: {e}")
+            return pd.DataFrame()
+
+    def fetch_history_many(self, tickers: List[str], period: str = "2y") -> Dict[str, pd.DataFrame]:
+        """
+        Fetches several tickers with one multi-symbol download per chunk of `batch_size`.
+        Returns {ticker: OHLCV DataFrame} keyed by the tickers as passed in. Tickers of a
+        failed chunk, or missing from a successful one, are retried one by one; tickers
+        Yahoo returns nothing for even then are left out.
+        """
+        return self._download_many(tickers, period=period)
+
+    def fetch_history_many_since(self, tickers: List[str], start: pd.Timestamp) -> Dict[str, pd.DataFrame]:
+        """Batch variant of `fetch_history_since`."""
+        return self._download_many(tickers, start=start.strftime("%Y-%m-%d"))
+
+    def _download_many(self, tickers: List[str], **window) -> Dict[str, pd.DataFrame]:
+        frames: Dict[str, pd.DataFrame] = {}
+        for i in range(0, len(tickers), self.batch_size):
+            chunk = tickers[i:i + self.batch_size]
+            symbols = {self._to_symbol(t): t for t in chunk}
+            try:
+                # Same adjustment and timezone handling as Ticker.history, so stored frames stay comparable
+                data = yf.download(
+                    list(symbols),
+                    group_by="ticker",
+                    auto_adjust=True,
+                    actions=False,
+                    ignore_tz=False,
+                    threads=False,
+                    progress=False,
+                    multi_level_index=True,
+                    **window,
+                )
+            except Exception as e:
+                logging.error(f"Error fetching batch of {len(chunk)} tickers from YFinance: {e}; retrying one by one.")
+                data = None
+
+            available = set(data.columns.get_level_values(0)) if data is not None and not data.empty else set()
+            for symbol, ticker in symbols.items():
+                if symbol in available:
+                    # Dates the ticker did not trade (or predate its listing) come back as all-NaN rows
+                    df = data[symbol][OHLCV_COLUMNS].dropna(how="all")
+                    df.columns.name = None
+                else:
+                    df = pd.DataFrame()
+                if df.empty:
+                    # One bad symbol or a transient error must not cost the rest of the chunk
+                    df = self.fetch_history_since(ticker, pd.Timestamp(window["start"])) if "start" in window \
+                        else self.fetch_history(ticker, window.get("period", "2y"))
+                if not df.empty:
+                    frames[ticker] = df
+        return frames
@@ -1,15 +1,37 @@
 from pathlib import Path
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import io
 import json
 import hashlib
-from nifty_500_momentum.data.interfaces import StorageBackend
-from nifty_500_momentum.data.config import DATA_CONFIG, DataConfig
+import shutil
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from nifty_500_momentum.data.interfaces import StorageBackend, align_tz, check_stock_window, select_stock_window
+from nifty_500_momentum.data.config import DATA_CONFIG, DataConfig, NewsBackend
+from nifty_500_momentum.data.panel import StockPanel, OHLCV_FIELDS
+from nifty_500_momentum.data.read_cache import StockReadCache, shared_stock_cache
+from nifty_500_momentum.data.catalog import StockCatalog, StockCatalogEntry
+from nifty_500_momentum.data.news_store import SQLiteNewsStore
 
 import logging
 
+STOCK_ROW_GROUP_SIZE = 256  # bars per parquet row group in per-ticker files (about a trading year)
+
 class LocalStorage(StorageBackend):
     def __init__(self, config: DataConfig = DATA_CONFIG) -> None:
         self.config = config
+        self.read_cache: Optional[StockReadCache] = (
+            shared_stock_cache(config.stock_cache_mb) if config.stock_cache_mb > 0 else None
+        )
+        self.catalog = StockCatalog.for_path(config.stock_catalog_path)
+        self.news_store: Optional[SQLiteNewsStore] = (
+            SQLiteNewsStore(config.news_db_path) if config.news_backend == NewsBackend.SQLITE else None
+        )
     
     def _get_stock_path(self, ticker: str) -> Path:
         safe_ticker = ticker.replace(".NS", "").replace(".BO", "")
@@ -23,21 +45,138 @@ class LocalStorage(StorageBackend):
     # --- Stock Methods ---
     def save_stock(self, ticker: str, df: pd.DataFrame):
         path = self._get_stock_path(ticker)
-        # Parquet preserves index (dates) and types better than CSV
-        df.to_parquet(path)
+        # Parquet preserves index (dates) and types better than CSV.
+        # Row groups of about a year let tail / date-range reads skip older years.
+        payload = df.to_parquet(row_group_size=STOCK_ROW_GROUP_SIZE)
+        path.write_bytes(payload)
+        if self.read_cache is not None:
+            self.read_cache.invalidate(path)
+        self.catalog.record(path.stem, StockCatalog.describe(ticker, df, payload, path.stat()))
         logging.info(f"Saved {ticker} to {path}")
 
-    def load_stock(self, ticker: str) -> pd.DataFrame:
+    def load_stock(self,
+                   ticker: str,
+                   columns: Optional[List[str]] = None,
+                   last_n: Optional[int] = None,
+                   start: Optional[pd.Timestamp] = None,
+                   end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         path = self._get_stock_path(ticker)
         if not path.exists():
             raise FileNotFoundError(f"No stored data for {ticker}. Run collection first.")
-        return pd.read_parquet(path)
+        if columns is None and last_n is None and start is None and end is None:
+            if self.read_cache is not None:
+                return self.read_cache.get_or_load(path, pd.read_parquet)
+            return pd.read_parquet(path)
+
+        check_stock_window(last_n, start, end)
+        # A decoded full frame is cheaper to slice than any read
+        cached = self.read_cache.peek(path) if self.read_cache is not None else None
+        if cached is not None:
+            return select_stock_window(cached, columns, last_n, start, end)
+        return self._read_stock_window(path, columns, last_n, start, end)
+
+    @staticmethod
+    def _read_stock_window(path: Path,
+                           columns: Optional[List[str]],
+                           last_n: Optional[int],
+                           start: Optional[pd.Timestamp],
+                           end: Optional[pd.Timestamp]) -> pd.DataFrame:
+        """Projected read: only the selected columns and the row groups that can hold selected rows."""
+        parquet = pq.ParquetFile(path)
+        schema = parquet.schema_arrow
+        index_columns = [c for c in (schema.pandas_metadata or {}).get("index_columns", []) if isinstance(c, str)]
+        read_columns = None if columns is None else \
+            index_columns + [c for c in columns if c in schema.names and c not in index_columns]
+
+        if (start is not None or end is not None) and index_columns:
+            # Row-group statistics on the date column skip groups outside [start, end]
+            date_field = schema.field(index_columns[0])
+            filters = []
+            if start is not None:
+                filters.append((date_field.name, ">=", pa.scalar(align_tz(pd.Timestamp(start), date_field.type), type=date_field.type)))
+            if end is not None:
+                filters.append((date_field.name, "<=", pa.scalar(align_tz(pd.Timestamp(end), date_field.type), type=date_field.type)))
+            return pq.read_table(path, columns=read_columns, filters=filters).to_pandas()
+
+        groups = list(range(parquet.num_row_groups))
+        if last_n is not None:
+            # Only the trailing row groups holding the last `last_n` rows
+            rows, first = 0, len(groups)
+            while first > 0 and rows < last_n:
+                first -= 1
+                rows += parquet.metadata.row_group(first).num_rows
+            groups = groups[first:]
+        df = parquet.read_row_groups(groups, columns=read_columns, use_pandas_metadata=True).to_pandas()
+        if start is not None or end is not None:
+            # Files without a stored date index
+            df = select_stock_window(df, start=start, end=end)
+        return df.iloc[len(df) - min(last_n, len(df)):] if last_n is not None else df
+
+    def stock_info(self, ticker: str) -> Optional[StockCatalogEntry]:
+        path = self._get_stock_path(ticker)
+        entry = self.catalog.get(path.stem)
+        if entry is None:
+            return None
+        # A file replaced or removed outside `save_stock` makes its entry unreliable
+        try:
+            if not entry.matches(path.stat()):
+                return None
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def flush(self) -> None:
+        self.catalog.flush()
+
+    def stock_signature(self, ticker: str) -> Optional[List[int]]:
+        try:
+            stat = self._get_stock_path(ticker).stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def last_stock_date(self, ticker: str) -> Optional[pd.Timestamp]:
+        entry = self.stock_info(ticker)
+        if entry is not None:
+            return entry.last_timestamp()
+        path = self._get_stock_path(ticker)
+        if not path.exists():
+            return None
+        # Uncatalogued file: only the index column is decoded, not the OHLCV payload
+        index = pd.read_parquet(path, columns=[]).index
+        return index[-1] if len(index) else None
+
+    def rebuild_catalog(self) -> Dict[str, StockCatalogEntry]:
+        """
+        Catalogues stored files that have no (valid) entry, e.g. data collected before the
+        catalog existed. Reads each such file once; their fetch time is the file's mtime.
+        """
+        entries = {}
+        for path in sorted(self.config.stock_data_dir.glob(f"*{self.config.stock_file_ext}")):
+            entry = self.catalog.get(path.stem)
+            stat = path.stat()
+            if entry is not None and entry.matches(stat):
+                continue
+            payload = path.read_bytes()
+            entries[path.stem] = StockCatalog.describe(
+                path.stem, pd.read_parquet(io.BytesIO(payload)), payload, stat,
+                fetched_at=datetime.fromtimestamp(stat.st_mtime),
+            )
+        if entries:
+            self.catalog.record_many(entries)
+            self.catalog.flush()
+            logging.info(f"Catalogued {len(entries)} stored stock files")
+        return self.catalog.entries()
 
     # --- News Methods ---
-    def save_news(self, query: str, news_items: list):
+    def save_news(self, query: str, news_items: list, ticker: Optional[str] = None):
+        if self.news_store is not None:
+            self.news_store.save(query, news_items, ticker=ticker)
+            return
         path = self._get_news_path(query)
         data = {
             "query": query,
+            "ticker": ticker,
             "timestamp": pd.Timestamp.now().isoformat(),
             "articles": news_items
         }
@@ -45,6 +184,8 @@ class LocalStorage(StorageBackend):
             json.dump(data, f, indent=4)
 
     def load_news(self, query: str) -> list:
+        if self.news_store is not None:
+            return self.news_store.load_many({query: query}, self.config.cache_expiry_hours)[query]
         path = self._get_news_path(query)
         if not path.exists():
             return None
@@ -58,6 +199,15 @@ class LocalStorage(StorageBackend):
             return None # Cache expired
             
         return data['articles']
+
+    def load_news_many(self,
+                       queries: Dict[str, str],
+                       published_since: Optional[datetime] = None,
+                       exclude_sources: Optional[List[str]] = None) -> Dict[str, Optional[list]]:
+        if self.news_store is None:
+            return super().load_news_many(queries, published_since, exclude_sources)
+        return self.news_store.load_many(queries, self.config.cache_expiry_hours,
+                                         published_since=published_since, exclude_sources=exclude_sources)
     
     
     #--- Tickers Methods ---
@@ -102,4 +252,189 @@ class LocalStorage(StorageBackend):
         if not path.exists():
             return None
         with path.open('r') as f:
-            return json.load(f)
\ No newline at end of file
+            return json.load(f)
+
+
+class PanelStorage(LocalStorage):
+    """
+    Stock storage for bulk readers.
+    Per-ticker parquet files stay the write path (collection saves one ticker at a time),
+    and `flush` compacts them into one universe-wide dataset under `stock_panel_dir`:
+    long format (Date, Ticker, OHLCV), hive-partitioned by year, sorted by ticker/date.
+    `load_panel` serves a whole-universe request from that dataset with a single scan.
+    Saved tickers are listed in the dirty marker, so `flush` only rewrites the year
+    partitions they touch (a daily update rewrites the current year, not the history).
+    """
+    DIRTY_MARKER = ".dirty"
+
+    def _panel_is_stale(self) -> bool:
+        panel_dir = self.config.stock_panel_dir
+        return not panel_dir.exists() or (panel_dir / self.DIRTY_MARKER).exists()
+
+    def _safe_ticker(self, ticker: str) -> str:
+        return self._get_stock_path(ticker).stem
+
+    def save_stock(self, ticker: str, df: pd.DataFrame):
+        super().save_stock(ticker, df)
+        if self.config.stock_panel_dir.exists():
+            with (self.config.stock_panel_dir / self.DIRTY_MARKER).open('a') as f:
+                f.write(self._safe_ticker(ticker) + "\n")
+
+    @staticmethod
+    def _long_frame(path: Path, tz: Optional[str]) -> Tuple[pd.DataFrame, str]:
+        """The ticker file as panel rows, with its dates aligned to `tz` (None: the file's own)."""
+        df = pd.read_parquet(path) if path.exists() else pd.DataFrame()
+        if df.empty:
+            return pd.DataFrame(), tz
+        index = pd.DatetimeIndex(df.index)
+        # A dataset column has a single timezone: align every ticker to the first one seen
+        if tz is None:
+            tz = str(index.tz) if index.tz is not None else "naive"
+        if tz == "naive":
+            index = index.tz_localize(None) if index.tz is not None else index
+        else:
+            index = index.tz_convert(tz) if index.tz is not None else index.tz_localize(tz)
+        long = pd.DataFrame({"Date": index, "Ticker": path.stem})
+        for name in OHLCV_FIELDS:
+            long[name] = df[name].to_numpy(dtype=float) if name in df.columns else np.nan
+        long["year"] = index.year
+        return long, tz
+
+    @staticmethod
+    def _write_panel(panel: pd.DataFrame, target_dir: Path) -> None:
+        panel = panel.sort_values(["year", "Ticker", "Date"], kind="stable")
+        panel["Ticker"] = panel["Ticker"].astype("category")
+        # Few, large row groups: the scan cost is dominated by per-row-group overhead otherwise
+        ds.write_dataset(
+            pa.Table.from_pandas(panel, preserve_index=False),
+            target_dir,
+            format="parquet",
+            partitioning=["year"],
+            partitioning_flavor="hive",
+            min_rows_per_group=1 << 16,
+            max_rows_per_group=1 << 18,
+        )
+
+    def _dirty_tickers(self) -> Optional[List[str]]:
+        """Tickers saved since the last flush; None when unknown (no panel yet, or an unlisted marker)."""
+        marker = self.config.stock_panel_dir / self.DIRTY_MARKER
+        if not marker.exists():
+            return None if not self.config.stock_panel_dir.exists() else []
+        tickers = sorted({line.strip() for line in marker.read_text().splitlines() if line.strip()})
+        return tickers or None
+
+    def flush(self) -> None:
+        """Writes the catalog and brings the panel dataset up to date with the per-ticker files."""
+        super().flush()
+        dirty = self._dirty_tickers()
+        if dirty is None:
+            self._rebuild_panel()
+        elif dirty:
+            self._update_panel(dirty)
+
+    def _rebuild_panel(self) -> None:
+        tables = []
+        tz = None
+        for path in sorted(self.config.stock_data_dir.glob(f"*{self.config.stock_file_ext}")):
+            long, tz = self._long_frame(path, tz)
+            if not long.empty:
+                tables.append(long)
+        if not tables:
+            return
+
+        panel = pd.concat(tables, ignore_index=True)
+        panel_dir = self.config.stock_panel_dir
+        staging_dir = panel_dir.with_name(panel_dir.name + ".tmp")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        self._write_panel(panel, staging_dir)
+        shutil.rmtree(panel_dir, ignore_errors=True)
+        staging_dir.rename(panel_dir)
+        logging.info(f"Compacted {len(tables)} tickers ({len(panel)} bars) into {panel_dir}")
+
+    @staticmethod
+    def _year_digests(panel: pd.DataFrame) -> pd.Series:
+        """(Ticker, year) -> digest of its rows, to find the partitions a save actually changed."""
+        if panel.empty:
+            return pd.Series(dtype="uint64")
+        rows = panel[["Date", *OHLCV_FIELDS]].assign(Date=pd.to_datetime(panel["Date"]).dt.as_unit("ns"))
+        hashes = pd.util.hash_pandas_object(rows, index=False)
+        return hashes.groupby([panel["Ticker"].astype(str).to_numpy(), panel["year"].astype(int).to_numpy()]).sum()
+
+    def _update_panel(self, dirty: List[str]) -> None:
+        """Rewrites the year partitions in which the rows of the `dirty` tickers changed."""
+        panel_dir = self.config.stock_panel_dir
+        marker = panel_dir / self.DIRTY_MARKER
+        dataset = ds.dataset(panel_dir, format="parquet", partitioning="hive")
+        date_type = dataset.schema.field("Date").type
+        tz = str(date_type.tz) if getattr(date_type, "tz", None) else "naive"
+
+        fresh = [self._long_frame(self.config.stock_data_dir / f"{ticker}{self.config.stock_file_ext}", tz)[0]
+                 for ticker in dirty]
+        fresh = pd.concat([long for long in fresh if not long.empty] or [pd.DataFrame(columns=["Ticker", "year"])],
+                          ignore_index=True)
+        stored = dataset.to_table(columns=["Date", "Ticker", *OHLCV_FIELDS, "year"],
+                                  filter=ds.field("Ticker").isin(dirty)).to_pandas()
+        new_digests, old_digests = self._year_digests(fresh).align(self._year_digests(stored))
+        changed = new_digests.index[new_digests.ne(old_digests)]
+        years = sorted({int(year) for _, year in changed})
+        if years:
+            # Unchanged tickers of the touched years, plus the current rows of the dirty ones
+            kept = dataset.to_table(filter=ds.field("year").isin(years) & ~ds.field("Ticker").isin(dirty)).to_pandas()
+            kept["Ticker"] = kept["Ticker"].astype(str)
+            fresh = fresh[fresh["year"].isin(years)]
+            parts = [part for part in (kept, fresh) if not part.empty]
+            staging_dir = panel_dir.with_name(panel_dir.name + ".tmp")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if parts:
+                panel = pd.concat(parts, ignore_index=True)
+                panel["year"] = panel["year"].astype(int)
+                self._write_panel(panel, staging_dir)
+            for year in years:
+                partition = panel_dir / f"year={year}"
+                shutil.rmtree(partition, ignore_errors=True)
+                if (staging_dir / f"year={year}").exists():
+                    (staging_dir / f"year={year}").rename(partition)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        marker.unlink(missing_ok=True)
+        logging.info(f"Updated {len(dirty)} tickers in {panel_dir}: rewrote year partitions {years or 'none'}")
+
+    def load_panel(self,
+                   tickers: Optional[List[str]] = None,
+                   fields: Optional[List[str]] = None,
+                   start: Optional[pd.Timestamp] = None,
+                   end: Optional[pd.Timestamp] = None) -> StockPanel:
+        if self._panel_is_stale():
+            self.flush()
+        if not self.config.stock_panel_dir.exists():
+            return super().load_panel(tickers, fields, start, end)
+
+        fields = fields or OHLCV_FIELDS
+        tickers = list(tickers) if tickers is not None else list(self.load_tickers() or {})
+        safe = {self._safe_ticker(t): t for t in tickers}
+
+        dataset = ds.dataset(self.config.stock_panel_dir, format="parquet", partitioning="hive")
+        date_type = dataset.schema.field("Date").type
+        expr = ds.field("Ticker").isin(list(safe))
+        if start is not None:
+            start = pd.Timestamp(start)
+            expr &= (ds.field("year") >= start.year) & (ds.field("Date") >= pa.scalar(align_tz(start, date_type), type=date_type))
+        if end is not None:
+            end = pd.Timestamp(end)
+            expr &= (ds.field("year") <= end.year) & (ds.field("Date") <= pa.scalar(align_tz(end, date_type), type=date_type))
+        table = dataset.to_table(columns=["Date", "Ticker", *fields], filter=expr)
+
+        # Map the (dictionary-encoded) Ticker column to panel columns without a per-row Python loop
+        encoded = table.column("Ticker").combine_chunks().dictionary_encode()
+        positions = {t: i for i, t in enumerate(tickers)}
+        # (the dictionary can hold tickers the filter excluded: they map to -1)
+        lookup = np.array([positions.get(safe.get(t), -1) for t in encoded.dictionary.to_pylist()] or [-1],
+                          dtype=np.int64)
+        columns = lookup[encoded.indices.to_numpy(zero_copy_only=False)] if len(table) else np.empty(0, dtype=np.int64)
+
+        return StockPanel.from_long(
+            dates=table.column("Date").to_numpy(),
+            columns=columns,
+            values={name: table.column(name).to_numpy() for name in fields},
+            tickers=tickers,
+            tz=getattr(date_type, "tz", None),
+        )
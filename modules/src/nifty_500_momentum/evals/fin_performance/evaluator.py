@@ -1,8 +1,9 @@
 import pandas as pd 
-from typing import List, Dict
+from typing import List, Dict, Optional
 import numpy as np
 
 from nifty_500_momentum.data.manager import DataManager
+from nifty_500_momentum.data.panel import StockPanel
 from .base_criteria import WinCriteria
 from .simple_criteria import SimpleReturnCriteria
 from .nuanced_criteria import MomentumContinuationCriteria
@@ -12,15 +13,27 @@ class PerformanceEvaluator:
     def __init__(self, dm: DataManager):
         self.dm = dm
 
-    def _fetch_future_data(self, ticker: str, start_date: str, days: int = 5) -> pd.Series:
+    def _fetch_future_data(self, 
+                           ticker: str, 
+                           start_date: str, 
+                           days: int = 5,
+                           panel: Optional[StockPanel] = None) -> pd.Series:
         """
         Fetches stock data for the [start_date, start_date + days] window.
         Uses DataManager but forces a fresh fetch if needed or queries specific dates.
         Note: DataManager usually fetches 'history'. We assume it has the data.
+        When a preloaded `panel` is given the ticker is sliced from it instead of storage.
         """
-        # Load the full dataframe from storage
         try:
-            df = self.dm.get_stock_data(ticker)
+            start_dt = pd.to_datetime(start_date)
+            # Add business days buffer roughly
+            end_dt = start_dt + pd.Timedelta(days=days + 5)
+
+            # Slice the preloaded panel, or read only the window's closes from storage
+            if panel is not None:
+                df = panel.frame(ticker)
+            else:
+                df = self.dm.get_stock_data(ticker, columns=['Close'], start=start_dt, end=end_dt)
             if df.empty: return pd.Series()
             
             # Filter for the specific date window
@@ -28,10 +41,6 @@ class PerformanceEvaluator:
             if not isinstance(df.index, pd.DatetimeIndex):
                 df.index = pd.to_datetime(df.index)
             
-            start_dt = pd.to_datetime(start_date)
-            # Add business days buffer roughly
-            end_dt = start_dt + pd.Timedelta(days=days + 5)
-            
             # Localize timestamps to match df.index timezone if needed
             if df.index.tz is not None:
                 start_dt = start_dt.tz_localize(df.index.tz)
@@ -60,13 +69,23 @@ class PerformanceEvaluator:
             'metrics': {}
         }
         
+        # 0. Load the evaluation window of every ticker in one bulk read
+        #    (tickers the storage catalog shows ending before the pick date are not read at all)
+        start_dt = pd.to_datetime(pick_date)
+        panel = self.dm.get_stock_panel(
+            tickers=self.dm.tickers_with_data_since(list(selected_tickers) + list(rejected_tickers), start_dt),
+            fields=['Close'],
+            start=start_dt,
+            end=start_dt + pd.Timedelta(days=horizon_days + 5),
+        )
+        
         # 1. Evaluate Selected (The "Alpha")
         sel_returns = []
         sel_wins = 0
         
         print(f"--- Evaluating Selected ({len(selected_tickers)}) ---")
         for ticker in selected_tickers:
-            prices = self._fetch_future_data(ticker, pick_date, horizon_days)
+            prices = self._fetch_future_data(ticker, pick_date, horizon_days, panel)
             res = criteria.evaluate(prices)
             
             results['selected_performance'].append({
@@ -83,7 +102,7 @@ class PerformanceEvaluator:
         
         print(f"--- Evaluating Rejected ({len(rejected_tickers)}) ---")
         for ticker in rejected_tickers:
-            prices = self._fetch_future_data(ticker, pick_date, horizon_days)
+            prices = self._fetch_future_data(ticker, pick_date, horizon_days, panel)
             res = criteria.evaluate(prices)
             
             results['rejected_performance'].append({
@@ -1,6 +1,9 @@
-from typing import Type
+from pathlib import Path
+from typing import Optional, Type
 import os
-from .base import BaseLLM, StructuredLLMInput
+from .base import BaseLLM, StructuredLLMInput, estimate_tokens
+from .cache import LLMResponseCache, CachedLLM
+from .batch import BatchJob, BatchRequest, BatchResult, BatchStatus, BatchEndpoint, LocalBatchEndpoint
 from .openai import OpenAILLM
 # from your_anthropic_impl import AnthropicLLM
 # from your_groq_impl import GroqLLM
@@ -14,17 +17,30 @@ class LLMFactory:
     }
 
     @staticmethod
-    def create(provider: str, **kwargs) -> BaseLLM:
+    def create(provider: str, cache: Optional[LLMResponseCache] = None, **kwargs) -> BaseLLM:
+        """With a `cache`, structured responses are served from / stored in it."""
         provider = provider.lower()
         if provider not in LLMFactory._registry:
             raise ValueError(f"Unknown LLM provider: {provider}")
-        return LLMFactory._registry[provider](**kwargs)
+        client = LLMFactory._registry[provider](**kwargs)
+        return CachedLLM(client, cache) if cache is not None else client
 
 
 DEFAULT_LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
 DEFAULT_LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4.1-nano")
-    
+# Response cache, off unless a path is set (e.g. data/cache/llm_cache.sqlite)
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH")
+LLM_CACHE_TTL_HOURS = float(os.getenv("LLM_CACHE_TTL_HOURS", 24 * 7))
+LLM_CACHE_MAX_MB = float(os.getenv("LLM_CACHE_MAX_MB", 256))
+
+llm_cache: Optional[LLMResponseCache] = LLMResponseCache(
+    Path(LLM_CACHE_PATH),
+    ttl_hours=LLM_CACHE_TTL_HOURS,
+    max_bytes=int(LLM_CACHE_MAX_MB * 1024 * 1024),
+) if LLM_CACHE_PATH else None
+
 llm: BaseLLM = LLMFactory.create(
     provider=DEFAULT_LLM_PROVIDER,
-    model=DEFAULT_LLM_MODEL
+    model=DEFAULT_LLM_MODEL,
+    cache=llm_cache,
 )
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Type, Generic, TypeVar
+from typing import List, Dict, Any, Optional, Type, Generic, TypeVar, TYPE_CHECKING
 from pydantic import BaseModel
 import time
 
 from .logger import LLMLogger
 
+if TYPE_CHECKING:
+    from .batch import BatchEndpoint
+
 
 class SimpleLLMInput(BaseModel):
     system_prompt: str
@@ -19,6 +22,14 @@ class StructuredLLMInput(BaseModel):
     messages: List[Dict[str, str]]  # [{"role": "...", "content": "..."}]
 
 
+CHARS_PER_TOKEN = 4  # rough average for English prose / JSON
+
+
+def estimate_tokens(messages: List[Dict[str, str]]) -> int:
+    """Rough prompt size in tokens (for rate budgets, not billing)."""
+    return sum(len(m.get("content", "")) for m in messages) // CHARS_PER_TOKEN + 4 * len(messages)
+
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -54,14 +65,15 @@ class BaseLLM(ABC):
     # ------------------------------------------------------
     # Logging utility
     # ------------------------------------------------------
-    def _log(self, *, interaction_type, input_data, output_data, usage=None):
+    def _log(self, *, interaction_type, input_data, output_data, usage=None, cache_hit=False):
         self.logger.log({
             "provider": self.provider_name,
             "model": self.model,
             "interaction_type": interaction_type,
             "input": input_data,
             "output": output_data,
-            "usage": usage or {},
+            "usage": usage or {},  # empty on cache hits: nothing was sent
+            "cache_hit": cache_hit,
         })
 
     # ------------------------------------------------------
@@ -74,3 +86,10 @@ class BaseLLM(ABC):
     @abstractmethod
     def generate_structured(self, inp: BaseModel, output_model: Type[T]) -> T:
         pass
+
+    # ------------------------------------------------------
+    # Offline batch mode (see batch.py)
+    # ------------------------------------------------------
+    def batch_endpoint(self) -> Optional["BatchEndpoint"]:
+        """The provider's batch API; None when the provider has none."""
+        return None
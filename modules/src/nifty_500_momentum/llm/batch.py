@@ -0,0 +1,279 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+
+from .base import BaseLLM, StructuredLLMInput
+
+"""
+LLM BATCH JOBS
+--------------
+Offline mode for runs where latency does not matter: every structured request is written
+to a JSONL job file, submitted once through a provider batch endpoint, polled until the
+provider finishes, and the validated outputs are read back by `custom_id`.
+
+A job lives in its own directory:
+- requests.jsonl  one {"custom_id", "model", "messages"} per line (provider neutral)
+- manifest.json   provider batch id, last known status and the sha256 of requests.jsonl
+- results.jsonl   the provider results, downloaded once
+Running a job whose directory already has a submitted manifest resumes polling instead
+of submitting again, so a crashed or interrupted nightly run never pays twice. Resuming
+with different requests (ids, model or messages) raises instead of returning stale results.
+
+`BatchEndpoint` is the provider side (`BaseLLM.batch_endpoint()`); `LocalBatchEndpoint`
+is a file-based stand-in that answers with any `BaseLLM` and needs no network.
+"""
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class BatchStatus(str, Enum):
+    SUBMITTED = "submitted"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    EXPIRED = "expired"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        return self not in (BatchStatus.SUBMITTED, BatchStatus.IN_PROGRESS)
+
+
+class BatchRequest(BaseModel):
+    custom_id: str
+    messages: List[Dict[str, str]]
+
+
+class BatchResult(BaseModel):
+    custom_id: str
+    content: Optional[str] = None   # the structured output as JSON text
+    error: Optional[str] = None
+    usage: Dict[str, int] = {}
+
+
+class BatchManifest(BaseModel):
+    provider: str
+    model: str
+    output_model: str
+    custom_ids: List[str]
+    requests_sha256: Optional[str] = None   # of requests.jsonl
+    batch_id: Optional[str] = None
+    status: BatchStatus = BatchStatus.SUBMITTED
+    submitted_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+# --- Provider interface ---
+class BatchEndpoint(ABC):
+    @abstractmethod
+    def submit(self, job_file: Path, output_model: Type[BaseModel]) -> str:
+        """Submits the requests of a job file; returns the provider batch id."""
+        pass
+
+    @abstractmethod
+    def status(self, batch_id: str) -> BatchStatus:
+        pass
+
+    @abstractmethod
+    def results(self, batch_id: str) -> List[BatchResult]:
+        """
+        Results of a finished batch, including those an expired or cancelled batch completed
+        before it stopped (requests without a result are missing).
+        """
+        pass
+
+
+def read_requests(job_file: Path) -> List[dict]:
+    with open(job_file, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class LocalBatchEndpoint(BatchEndpoint):
+    """
+    File-based stand-in for a provider batch API. `submit` answers every request with
+    `responder` right away, but the batch only reports COMPLETED after `polls_to_complete`
+    status calls. State is kept under `root_dir`, so a new process can resume polling.
+    """
+
+    def __init__(self, responder: BaseLLM, root_dir: Path, polls_to_complete: int = 1) -> None:
+        self.responder = responder
+        self.root_dir = Path(root_dir)
+        self.polls_to_complete = polls_to_complete
+
+    def _state_path(self, batch_id: str) -> Path:
+        return self.root_dir / batch_id / "state.json"
+
+    def submit(self, job_file: Path, output_model: Type[BaseModel]) -> str:
+        batch_id = f"local_{uuid.uuid4().hex[:12]}"
+        batch_dir = self.root_dir / batch_id
+        batch_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(job_file, batch_dir / "input.jsonl")
+        with open(batch_dir / "output.jsonl", "w", encoding="utf-8") as f:
+            for request in read_requests(job_file):
+                try:
+                    output = self.responder.generate_structured(
+                        inp=StructuredLLMInput(messages=request["messages"]), output_model=output_model)
+                    result = BatchResult(custom_id=request["custom_id"], content=output.model_dump_json())
+                except Exception as e:
+                    result = BatchResult(custom_id=request["custom_id"], error=str(e))
+                f.write(result.model_dump_json() + "\n")
+        self._state_path(batch_id).write_text(json.dumps({"polls": 0}))
+        return batch_id
+
+    def status(self, batch_id: str) -> BatchStatus:
+        path = self._state_path(batch_id)
+        if not path.exists():
+            return BatchStatus.FAILED
+        state = json.loads(path.read_text())
+        state["polls"] += 1
+        path.write_text(json.dumps(state))
+        return BatchStatus.COMPLETED if state["polls"] >= self.polls_to_complete else BatchStatus.IN_PROGRESS
+
+    def results(self, batch_id: str) -> List[BatchResult]:
+        output = self.root_dir / batch_id / "output.jsonl"
+        if not output.exists():
+            return []
+        with open(output, encoding="utf-8") as f:
+            return [BatchResult.model_validate_json(line) for line in f if line.strip()]
+
+
+# --- Job ---
+class BatchJob:
+    def __init__(self, llm: BaseLLM, job_dir: Path, endpoint: Optional[BatchEndpoint] = None) -> None:
+        self.llm = llm
+        self.job_dir = Path(job_dir)
+        self.endpoint = endpoint or llm.batch_endpoint()
+        if self.endpoint is None:
+            raise ValueError(f"{llm.provider_name} has no batch endpoint; pass `endpoint` or run the analysis online.")
+        self.requests_path = self.job_dir / "requests.jsonl"
+        self.manifest_path = self.job_dir / "manifest.json"
+        self.results_path = self.job_dir / "results.jsonl"
+
+    def load_manifest(self) -> Optional[BatchManifest]:
+        if not self.manifest_path.exists():
+            return None
+        return BatchManifest.model_validate_json(self.manifest_path.read_text(encoding="utf-8"))
+
+    def _save_manifest(self, manifest: BatchManifest) -> None:
+        staging = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+        staging.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
+        os.replace(staging, self.manifest_path)
+
+    def _job_file(self, requests: List[BatchRequest]) -> bytes:
+        return "".join(json.dumps({"custom_id": request.custom_id, "model": self.llm.model,
+                                   "messages": request.messages}, ensure_ascii=False) + "\n"
+                       for request in requests).encode("utf-8")
+
+    def submit(self, requests: List[BatchRequest], output_model: Type[BaseModel]) -> BatchManifest:
+        """
+        Writes the job file and submits it, unless this job was already submitted with the
+        same requests (then resumes). Raises ValueError if it was submitted with others.
+        """
+        job_file = self._job_file(requests)
+        requests_sha256 = hashlib.sha256(job_file).hexdigest()
+        manifest = self.load_manifest()
+        if manifest is not None and manifest.batch_id is not None:
+            submitted_sha256 = manifest.requests_sha256
+            if submitted_sha256 is None and self.requests_path.exists():  # manifest written before the hash was stored
+                submitted_sha256 = hashlib.sha256(self.requests_path.read_bytes()).hexdigest()
+            if manifest.custom_ids != [r.custom_id for r in requests] or submitted_sha256 != requests_sha256:
+                raise ValueError(f"Batch job {self.job_dir} was submitted (batch {manifest.batch_id}) with different "
+                                 f"requests; use a new job directory or remove this one to resubmit.")
+            logging.info(f"Resuming batch {manifest.batch_id} ({manifest.status.value}).")
+            return manifest
+
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        self.requests_path.write_bytes(job_file)
+        manifest = BatchManifest(provider=self.llm.provider_name, model=self.llm.model,
+                                 output_model=output_model.__name__, custom_ids=[r.custom_id for r in requests],
+                                 requests_sha256=requests_sha256)
+        manifest.batch_id = self.endpoint.submit(self.requests_path, output_model)
+        manifest.submitted_at = datetime.now()
+        self._save_manifest(manifest)
+        logging.info(f"Submitted batch {manifest.batch_id} with {len(requests)} requests.")
+        return manifest
+
+    def poll(self, poll_seconds: float = 60.0, timeout_seconds: float = 24 * 3600) -> BatchManifest:
+        """Waits until the batch finishes (or `timeout_seconds`, then returns the last status)."""
+        manifest = self.load_manifest()
+        if manifest is None or manifest.batch_id is None:
+            raise RuntimeError(f"No submitted batch in {self.job_dir}")
+        deadline = time.monotonic() + timeout_seconds
+        while not manifest.status.finished:
+            status = self.endpoint.status(manifest.batch_id)
+            if status != manifest.status:
+                logging.info(f"Batch {manifest.batch_id}: {manifest.status.value} -> {status.value}")
+                manifest.status = status
+                if status.finished:
+                    manifest.finished_at = datetime.now()
+                self._save_manifest(manifest)
+            if status.finished or time.monotonic() + poll_seconds > deadline:
+                break
+            time.sleep(poll_seconds)
+        return manifest
+
+    def collect(self, output_model: Type[T]) -> Tuple[Dict[str, T], Dict[str, str]]:
+        """({custom_id: output}, {custom_id: error}) of a finished batch, in request order."""
+        manifest = self.load_manifest()
+        if manifest is None or not manifest.status.finished:
+            raise RuntimeError(f"Batch in {self.job_dir} has not finished")
+        downloaded = not self.results_path.exists()
+        if downloaded:
+            # Expired / cancelled batches still return the requests they completed
+            results = self.endpoint.results(manifest.batch_id)
+            staging = self.results_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(staging, "w", encoding="utf-8") as f:
+                for result in results:
+                    f.write(result.model_dump_json() + "\n")
+            os.replace(staging, self.results_path)
+
+        with open(self.results_path, encoding="utf-8") as f:
+            results = {r.custom_id: r for r in (BatchResult.model_validate_json(line) for line in f if line.strip())}
+        messages = {r["custom_id"]: r["messages"] for r in read_requests(self.requests_path)} \
+            if self.requests_path.exists() else {}
+
+        outputs: Dict[str, T] = {}
+        errors: Dict[str, str] = {}
+        for custom_id in manifest.custom_ids:
+            result = results.get(custom_id)
+            if result is None:
+                errors[custom_id] = f"No result (batch {manifest.status.value})"
+                continue
+            if result.error is not None or result.content is None:
+                errors[custom_id] = result.error or "Empty response"
+                continue
+            try:
+                outputs[custom_id] = output_model.model_validate_json(result.content)
+            except ValidationError as e:
+                errors[custom_id] = str(e)
+                continue
+            if downloaded:  # log each response once, not on every re-ingest
+                self.llm._log(
+                    interaction_type="batch",
+                    input_data={"messages": messages.get(custom_id, [])},
+                    output_data=outputs[custom_id].model_dump(mode="json"),
+                    usage=result.usage,
+                )
+        return outputs, errors
+
+    def run(self,
+            requests: List[BatchRequest],
+            output_model: Type[T],
+            poll_seconds: float = 60.0,
+            timeout_seconds: float = 24 * 3600) -> Tuple[Dict[str, T], Dict[str, str]]:
+        """Submit (or resume), poll, collect. Raises TimeoutError if the batch is still running."""
+        self.submit(requests, output_model)
+        manifest = self.poll(poll_seconds, timeout_seconds)
+        if not manifest.status.finished:
+            raise TimeoutError(f"Batch {manifest.batch_id} still {manifest.status.value}; run again to resume polling.")
+        return self.collect(output_model)
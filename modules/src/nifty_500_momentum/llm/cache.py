@@ -0,0 +1,181 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+
+from .base import BaseLLM, StructuredLLMInput
+
+"""
+LLM RESPONSE CACHE
+------------------
+Content-addressed on-disk cache of structured LLM responses (SQLite, one row per response).
+The key is a SHA-256 of provider, model, messages and the output model's JSON schema, so
+any change to the prompt, the model or the schema is a miss. Only outputs that validated
+against the schema are stored; entries expire after `ttl_hours` and the least recently
+used ones are evicted beyond `max_entries` / `max_bytes`.
+`CachedLLM` wraps any `BaseLLM` (see `LLMFactory.create(..., cache=...)`).
+"""
+
+T = TypeVar("T", bound=BaseModel)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    output_model TEXT NOT NULL,
+    output TEXT NOT NULL,          -- validated output, as JSON
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,      -- unix seconds (TTL)
+    last_used_at REAL NOT NULL     -- unix seconds (LRU eviction)
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used_at ON responses(last_used_at);
+"""
+
+
+def cache_key(provider: str, model: str, messages: List[Dict[str, str]], output_model: Type[BaseModel]) -> str:
+    payload = json.dumps({
+        "provider": provider,
+        "model": model,
+        "messages": messages,
+        "schema": output_model.model_json_schema(),
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(self,
+                 db_path: Path,
+                 ttl_hours: float = 24 * 7,
+                 max_entries: int = 100_000,
+                 max_bytes: int = 256 * 1024 * 1024) -> None:
+        """`ttl_hours` / `max_entries` / `max_bytes` of 0 disable that bound."""
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_hours = ttl_hours
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()  # sqlite3 connections are per thread
+        self._lock = threading.Lock()    # serializes eviction and the hit / miss counters
+        self.hits = self.misses = 0
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _expired(self, created_at: float) -> bool:
+        return bool(self.ttl_hours) and time.time() - created_at > self.ttl_hours * 3600
+
+    # --- Reads ---
+    def get(self, key: str, output_model: Type[T]) -> Optional[T]:
+        """The cached output, or None (missing, expired, or no longer valid for `output_model`)."""
+        conn = self._connection()
+        row = conn.execute("SELECT output, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None and not self._expired(row[1]):
+            try:
+                output = output_model.model_validate_json(row[0])
+            except ValidationError:
+                output = None
+            if output is not None:
+                with conn:
+                    conn.execute("UPDATE responses SET last_used_at = ? WHERE key = ?", (time.time(), key))
+                with self._lock:
+                    self.hits += 1
+                return output
+        if row is not None:
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        with self._lock:
+            self.misses += 1
+        return None
+
+    # --- Writes ---
+    def put(self, key: str, provider: str, model: str, output: BaseModel) -> None:
+        text = output.model_dump_json()
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, type(output).__name__, text, len(text.encode("utf-8")), now, now),
+            )
+        self.evict()
+
+    def evict(self) -> int:
+        """Drops expired entries, then least recently used ones beyond the size bounds. Returns the count."""
+        with self._lock, self._connection() as conn:
+            removed = 0
+            if self.ttl_hours:
+                removed += conn.execute("DELETE FROM responses WHERE created_at < ?",
+                                        (time.time() - self.ttl_hours * 3600,)).rowcount
+            count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            excess_entries = count - self.max_entries if self.max_entries else 0
+            excess_bytes = size - self.max_bytes if self.max_bytes else 0
+            if excess_entries <= 0 and excess_bytes <= 0:
+                return removed
+            keys = []
+            for key, entry_size in conn.execute("SELECT key, size FROM responses ORDER BY last_used_at"):
+                if excess_entries <= 0 and excess_bytes <= 0:
+                    break
+                keys.append((key,))
+                excess_entries -= 1
+                excess_bytes -= entry_size
+            conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+            return removed + len(keys)
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        count, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {"entries": count, "bytes": size, "hits": hits, "misses": misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0}
+
+
+class CachedLLM(BaseLLM):
+    """Serves `generate_structured` from the cache; `generate_simple` always goes to the provider."""
+
+    def __init__(self, inner: BaseLLM, cache: LLMResponseCache):
+        super().__init__(provider_name=inner.provider_name, model=inner.model, max_retries=inner.max_retries)
+        self.inner = inner
+        self.cache = cache
+
+    def generate_simple(self, inp: BaseModel) -> BaseModel:
+        return self.inner.generate_simple(inp)
+
+    def batch_endpoint(self):
+        return self.inner.batch_endpoint()
+
+    def generate_structured(self, inp: StructuredLLMInput, output_model: Type[T]) -> T:
+        key = cache_key(self.provider_name, self.model, inp.messages, output_model)
+        cached = self.cache.get(key, output_model)
+        if cached is not None:
+            self._log(
+                interaction_type="structured",
+                input_data=inp.model_dump(),
+                output_data=cached.model_dump(mode="json"),
+                cache_hit=True,
+            )
+            return cached
+        output = self.inner.generate_structured(inp=inp, output_model=output_model)
+        try:
+            self.cache.put(key, self.provider_name, self.model, output_model.model_validate(output))
+        except (ValidationError, sqlite3.Error) as e:
+            logging.warning(f"Not caching {output_model.__name__} response from {self.model}: {e}")
+        return output
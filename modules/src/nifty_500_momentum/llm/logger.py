@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from datetime import datetime
 from typing import Any, Dict
 
@@ -9,6 +10,7 @@ from anyio import Path
 
 class LLMLogger:
     LOG_FILE = Path(os.getenv("LLM_LOG_DIR", "logs/llm_logs.jsonl"))
+    _lock = threading.Lock()  # concurrent callers must not interleave lines
 
     def __init__(self):
         os.makedirs("logs", exist_ok=True)
@@ -16,5 +18,6 @@ class LLMLogger:
     def log(self, record: Dict[str, Any]):
         """Append one JSON log entry per line."""
         record["timestamp"] = datetime.utcnow().isoformat()
-        with open(self.LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock, open(self.LOG_FILE, "a", encoding="utf-8") as f:
+            f.write(line)
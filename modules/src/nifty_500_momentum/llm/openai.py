@@ -1,4 +1,6 @@
-from typing import Type, TypeVar
+import json
+from pathlib import Path
+from typing import Any, List, Type, TypeVar
 from pydantic import BaseModel
 from openai import OpenAI
 
@@ -8,10 +10,48 @@ from .base import (
     SimpleLLMOutput,
     StructuredLLMInput,
 )
+from .batch import BatchEndpoint, BatchResult, BatchStatus, read_requests
 
 T = TypeVar("T", bound=BaseModel)
 
 
+def strict_json_schema(output_model: Type[BaseModel]) -> dict:
+    """
+    `output_model`'s JSON schema in the form structured outputs accept in strict mode: every
+    object closed with all its properties required, no null defaults, and no `$ref` with siblings.
+    """
+    schema = output_model.model_json_schema()
+    defs = schema.get("$defs", {})
+
+    def _strict(node: Any) -> Any:
+        if isinstance(node, list):
+            return [_strict(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        strict = {}
+        for key, value in node.items():
+            if key == "default" and value is None:
+                continue
+            if key in ("properties", "$defs"):  # name -> schema maps
+                strict[key] = {name: _strict(child) for name, child in value.items()}
+            else:
+                strict[key] = _strict(value)
+        if "$ref" in strict and len(strict) > 1:
+            ref = strict.pop("$ref")
+            strict = {**_strict(defs[ref.split("/")[-1]]), **strict}
+        if strict.get("type") == "object" and "properties" in strict:
+            strict["additionalProperties"] = False
+            strict["required"] = list(strict["properties"])
+        return strict
+
+    return _strict(schema)
+
+
+def response_format(output_model: Type[BaseModel]) -> dict:
+    return {"type": "json_schema",
+            "json_schema": {"name": output_model.__name__, "schema": strict_json_schema(output_model), "strict": True}}
+
+
 
 class OpenAILLM(BaseLLM):
     """
@@ -77,4 +117,76 @@ class OpenAILLM(BaseLLM):
             usage=usage,
         )
 
-        return response.choices[0].message.parsed
\ No newline at end of file
+        return response.choices[0].message.parsed
+
+    # ----------------------------------------------------
+    # BATCH MODE
+    # ----------------------------------------------------
+    def batch_endpoint(self) -> "OpenAIBatchEndpoint":
+        return OpenAIBatchEndpoint(self.client)
+
+
+class OpenAIBatchEndpoint(BatchEndpoint):
+    """OpenAI Batch API over /v1/chat/completions (24h completion window)."""
+
+    STATUSES = {
+        "validating": BatchStatus.SUBMITTED,
+        "in_progress": BatchStatus.IN_PROGRESS,
+        "finalizing": BatchStatus.IN_PROGRESS,
+        "completed": BatchStatus.COMPLETED,
+        "failed": BatchStatus.FAILED,
+        "expired": BatchStatus.EXPIRED,
+        "cancelling": BatchStatus.IN_PROGRESS,   # not settled yet: results may still be written
+        "cancelled": BatchStatus.CANCELLED,
+    }
+
+    def __init__(self, client: OpenAI):
+        self.client = client
+
+    def submit(self, job_file: Path, output_model: Type[BaseModel]) -> str:
+        format_param = response_format(output_model)
+        provider_file = Path(job_file).with_name("openai_requests.jsonl")
+        with open(provider_file, "w", encoding="utf-8") as f:
+            for request in read_requests(job_file):
+                f.write(json.dumps({
+                    "custom_id": request["custom_id"],
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {"model": request["model"], "messages": request["messages"],
+                             "response_format": format_param},
+                }, ensure_ascii=False) + "\n")
+        with open(provider_file, "rb") as f:
+            uploaded = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(input_file_id=uploaded.id, endpoint="/v1/chat/completions",
+                                           completion_window="24h")
+        return batch.id
+
+    def status(self, batch_id: str) -> BatchStatus:
+        return self.STATUSES.get(self.client.batches.retrieve(batch_id).status, BatchStatus.IN_PROGRESS)
+
+    def results(self, batch_id: str) -> List[BatchResult]:
+        batch = self.client.batches.retrieve(batch_id)
+        results = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                body = response.get("body") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    error = record.get("error") or body.get("error") or f"HTTP {response.get('status_code')}"
+                    results.append(BatchResult(custom_id=record["custom_id"], error=json.dumps(error)))
+                    continue
+                message = body["choices"][0]["message"]
+                usage = body.get("usage") or {}
+                results.append(BatchResult(
+                    custom_id=record["custom_id"],
+                    content=message.get("content"),
+                    error=message.get("refusal"),
+                    usage={"input_tokens": usage.get("prompt_tokens", 0),
+                           "output_tokens": usage.get("completion_tokens", 0)},
+                ))
+        return results
@@ -0,0 +1,152 @@
+import threading
+import time
+import logging
+from enum import Enum
+from typing import Any, Dict, List, Optional
+import pandas as pd
+
+from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult
+from nifty_500_momentum.static.feature_cache import FeatureContext
+
+"""
+ENSEMBLE
+--------
+Evaluates several strategies on one ticker as a vote: ANY (1 of n), ALL (n of n) or
+k of n. The ticker's data and indicator context are shared by all strategies, the
+strategies run cheapest first (by measured time) and evaluation stops once the vote
+is decided. Metrics and reasons are merged in the declared strategy order, so the
+result does not depend on the evaluation order.
+"""
+
+
+class EnsembleMetrics(str, Enum):
+    NONE = "none"                # stop as soon as the outcome is decided
+    SHORTLISTED = "shortlisted"  # finish passing tickers: their metrics feed the analysts
+    ALL = "all"                  # always run every strategy (no short-circuit)
+
+
+class EnsembleEvaluator:
+    """
+    `strategies` is {name: strategy} in the order metrics and reasons are reported;
+    a ticker passes when at least `required` of them pass.
+    """
+    COST_SMOOTHING = 0.1  # weight of the latest run in the per-strategy cost estimate
+
+    def __init__(self,
+                 strategies: Dict[str, MomentumStrategy],
+                 required: int,
+                 metrics: EnsembleMetrics = EnsembleMetrics.SHORTLISTED) -> None:
+        if not 1 <= required <= len(strategies):
+            raise ValueError(f"required must be between 1 and {len(strategies)}, got {required}")
+        self.strategies = dict(strategies)
+        self.required = required
+        self.metrics = metrics
+        self._cost: Dict[str, Optional[float]] = {name: None for name in self.strategies}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def columns(self) -> List[str]:
+        """Price columns read by any member strategy."""
+        return list(dict.fromkeys(c for s in self.strategies.values() for c in s.columns))
+
+    @property
+    def lookback(self) -> Optional[int]:
+        """Trailing bars covering every member strategy (None: the full history)."""
+        lookbacks = [s.lookback for s in self.strategies.values()]
+        return None if None in lookbacks else max(lookbacks)
+
+    def reset_stats(self) -> None:
+        """Clears the reported counters (cost estimates used for ordering are kept)."""
+        with self._lock:
+            self.evaluations = 0
+            self.short_circuited = 0
+            self.skipped_runs = 0
+            self._runs = {name: 0 for name in self.strategies}
+            self._seconds = {name: 0.0 for name in self.strategies}
+
+    def evaluation_order(self) -> List[str]:
+        """Cheapest first; strategies not measured yet go first so they get measured."""
+        with self._lock:
+            return sorted(self.strategies, key=lambda name: self._cost[name] or 0.0)
+
+    def _run(self, name: str, df: pd.DataFrame, features: FeatureContext) -> StaticScoutResult:
+        start = time.perf_counter()
+        try:
+            result = self.strategies[name].analyze(df, features)
+        except Exception as e:
+            logging.error(f"Error analyzing momentum for {features.ticker} with strategy {name}: {e}")
+            result = StaticScoutResult(pass_filter=False, metrics={}, reason="Analysis error")
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._runs[name] += 1
+            self._seconds[name] += elapsed
+            cost = self._cost[name]
+            self._cost[name] = elapsed if cost is None else cost + self.COST_SMOOTHING * (elapsed - cost)
+        return result
+
+    def evaluate(self, df: pd.DataFrame, features: Optional[FeatureContext] = None) -> StaticScoutResult:
+        features = features or FeatureContext(df)
+        results: Dict[str, StaticScoutResult] = {}
+        passes = fails = 0
+        allowed_fails = len(self.strategies) - self.required
+        for name in self.evaluation_order():
+            result = self._run(name, df, features)
+            results[name] = result
+            passes += result.pass_filter
+            fails += not result.pass_filter
+            if passes >= self.required:
+                decided = True
+            elif fails > allowed_fails:
+                decided = False
+            else:
+                continue
+            if self.metrics == EnsembleMetrics.NONE or (self.metrics == EnsembleMetrics.SHORTLISTED and not decided):
+                break
+
+        skipped = len(self.strategies) - len(results)
+        with self._lock:
+            self.evaluations += 1
+            self.short_circuited += int(skipped > 0)
+            self.skipped_runs += skipped
+
+        metrics: Dict[str, float] = {}
+        reasons = ""
+        for name in self.strategies:
+            if name in results:
+                metrics.update(results[name].metrics)
+                reasons += results[name].reason + "; "
+        return StaticScoutResult(pass_filter=passes >= self.required, metrics=metrics, reason=reasons)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._summarize(self.evaluations, self.short_circuited, self.skipped_runs,
+                                   {name: (self._runs[name], self._seconds[name]) for name in self.strategies})
+
+    @staticmethod
+    def _summarize(evaluations: int, short_circuited: int, skipped_runs: int, timings: Dict[str, tuple]) -> Dict[str, Any]:
+        return {
+            "evaluations": evaluations,
+            "short_circuited": short_circuited,
+            "short_circuit_rate": round(short_circuited / evaluations, 4) if evaluations else 0.0,
+            "skipped_runs": skipped_runs,
+            "strategies": {
+                name: {"runs": runs, "seconds": round(seconds, 4),
+                       "mean_ms": round(seconds / runs * 1000, 3) if runs else 0.0}
+                for name, (runs, seconds) in timings.items()
+            },
+        }
+
+    @classmethod
+    def merge_stats(cls, stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combines `stats()` of several evaluators (e.g. one per worker process)."""
+        timings: Dict[str, list] = {}
+        for s in stats:
+            for name, t in s["strategies"].items():
+                total = timings.setdefault(name, [0, 0.0])
+                total[0] += t["runs"]
+                total[1] += t["seconds"]
+        return cls._summarize(sum(s["evaluations"] for s in stats),
+                              sum(s["short_circuited"] for s in stats),
+                              sum(s["skipped_runs"] for s in stats),
+                              {name: tuple(t) for name, t in timings.items()})
@@ -0,0 +1,174 @@
+import hashlib
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+"""
+FEATURE CACHE
+-------------
+Memoizes indicator series so strategies that need the same indicator (e.g. RSI for
+Explosive Breakout and Reversal Hunter, SMA 200 for Golden Momentum and Trend Surfer)
+compute it once per ticker and run.
+Entries are keyed by (ticker, indicator, params, data fingerprint): new or revised bars
+change the fingerprint, so a stale series is never served.
+"""
+
+_DATA = object()  # stands in for the price frame when binding indicator arguments
+
+
+def data_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a price frame (index, columns and values)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(df.index.asi8 if isinstance(df.index, pd.DatetimeIndex)
+                                       else df.index.to_numpy()).tobytes())
+    digest.update("|".join(map(str, df.columns)).encode())
+    digest.update(np.ascontiguousarray(df.to_numpy(dtype=float)).tobytes())
+    return digest.hexdigest()
+
+
+def indicator_key(func: Callable[..., Any], params: Dict[str, Any]) -> Tuple[str, Tuple]:
+    """
+    (qualified name, sorted params with defaults applied) identifying `func(df, **params)`,
+    so calculate_rsi(df) and calculate_rsi(df, length=14) are the same indicator.
+    """
+    bound = inspect.signature(func).bind(_DATA, **params)
+    bound.apply_defaults()
+    resolved = tuple(sorted((k, v) for k, v in bound.arguments.items() if v is not _DATA))
+    return f"{func.__module__}.{func.__name__}", resolved
+
+
+class FeatureSpec:
+    """An indicator a strategy depends on: `func(df, **params)`. Equal specs name the same series."""
+    def __init__(self, func: Callable[..., Any], **params) -> None:
+        self.func = func
+        self.params = params
+        self.name, self.resolved = indicator_key(func, params)
+
+    @property
+    def column(self) -> str:
+        """Readable, parameter-qualified name, e.g. `calculate_sma(length=200)`."""
+        args = ",".join(f"{k}={v!r}" for k, v in self.resolved)
+        return f"{self.func.__name__}({args})"
+
+    def compute(self, df: pd.DataFrame) -> Any:
+        return self.func(df, **self.params)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FeatureSpec) and (self.name, self.resolved) == (other.name, other.resolved)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.resolved))
+
+    def __repr__(self) -> str:
+        return f"FeatureSpec({self.column})"
+
+
+class IndicatorCache:
+    """Thread-safe memo of indicator results with hit/miss counters per indicator."""
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple, Tuple[Any, float]] = {}  # key -> (result, compute seconds)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+        self.preloaded = 0
+        self._by_indicator: Dict[str, Dict[str, int]] = {}
+
+    def get_or_compute(self, key: Tuple, indicator: str, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            counters = self._by_indicator.setdefault(indicator, {"hits": 0, "misses": 0})
+            if entry is not None:
+                self.hits += 1
+                self.seconds_saved += entry[1]
+                counters["hits"] += 1
+                return entry[0]
+            self.misses += 1
+            counters["misses"] += 1
+
+        start = time.perf_counter()
+        result = compute()
+        with self._lock:
+            self._entries[key] = (result, time.perf_counter() - start)
+        return result
+
+    def put(self, key: Tuple, result: Any) -> None:
+        """Stores a result computed elsewhere (e.g. read from the feature store)."""
+        with self._lock:
+            self._entries[key] = (result, 0.0)
+            self.preloaded += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "seconds_saved": round(self.seconds_saved, 3),
+                "entries": len(self._entries),
+                "preloaded": self.preloaded,
+                "by_indicator": {name: dict(c) for name, c in self._by_indicator.items()},
+            }
+
+    @staticmethod
+    def merge_stats(stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combines `stats()` of several caches (e.g. one per worker process)."""
+        merged: Dict[str, Any] = {"hits": 0, "misses": 0, "seconds_saved": 0.0, "entries": 0,
+                                  "preloaded": 0, "by_indicator": {}}
+        for s in stats:
+            for field in ("hits", "misses", "seconds_saved", "entries", "preloaded"):
+                merged[field] += s.get(field, 0)
+            for name, counters in s.get("by_indicator", {}).items():
+                total = merged["by_indicator"].setdefault(name, {"hits": 0, "misses": 0})
+                total["hits"] += counters["hits"]
+                total["misses"] += counters["misses"]
+        lookups = merged["hits"] + merged["misses"]
+        merged["hit_rate"] = round(merged["hits"] / lookups, 4) if lookups else 0.0
+        merged["seconds_saved"] = round(merged["seconds_saved"], 3)
+        return merged
+
+
+class FeatureContext:
+    """
+    Indicator access for one ticker's price history. Strategies request indicators
+    through `indicator(func, **params)` instead of calling `static/indicators.py` directly,
+    so every strategy analysing the same ticker shares one computation.
+    Without a shared `cache` the context memoizes for itself only.
+    """
+    def __init__(self, df: pd.DataFrame, ticker: str = "", cache: Optional[IndicatorCache] = None) -> None:
+        self.df = df
+        self.ticker = ticker
+        self.cache = cache if cache is not None else IndicatorCache()
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = data_fingerprint(self.df)
+        return self._fingerprint
+
+    def indicator(self, func: Callable[..., Any], **params) -> Any:
+        """`func(self.df, **params)`, computed once per (ticker, func, params, data). Treat results as read-only."""
+        return self.feature(FeatureSpec(func, **params))
+
+    def feature(self, spec: FeatureSpec) -> Any:
+        return self.cache.get_or_compute(self._key(spec), spec.func.__name__, lambda: spec.compute(self.df))
+
+    def seed(self, spec: FeatureSpec, result: Any) -> None:
+        """
+        Serves `result` for `spec` on this ticker's data without computing it. The feature
+        store seeds only the trailing bars strategies read, so seeded contexts are for
+        latest-bar evaluation, not for consumers that need the full series.
+        """
+        self.cache.put(self._key(spec), result)
+
+    def _key(self, spec: FeatureSpec) -> Tuple:
+        return (self.ticker, spec.name, spec.resolved, self.fingerprint)
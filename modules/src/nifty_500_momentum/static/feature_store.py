@@ -0,0 +1,264 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+from nifty_500_momentum.static import static_momentum_strategies
+from nifty_500_momentum.static.strategies.base import MomentumStrategy
+from nifty_500_momentum.static.feature_cache import FeatureSpec, data_fingerprint
+from nifty_500_momentum.static.streaming import streaming_counterpart
+from nifty_500_momentum.data.manager import DataManager
+
+"""
+FEATURE STORE
+-------------
+Indicator series precomputed after stock collection and persisted per ticker, so a
+shortlist run reads the latest feature rows instead of recomputing 200-day SMAs and
+Wilder smoothing from raw OHLCV.
+
+Layout (under `DataConfig.stock_features_dir`):
+    <version>/<TICKER>.parquet   full feature history of one ticker
+    <version>/_latest.parquet    the trailing rows of every ticker (what shortlisting reads)
+    <version>/_manifest.json     per ticker: rows, last date and fingerprint of the price data
+The version is a hash of the feature set (indicator + bound params), so changing e.g. a
+`length` moves the store to a new directory and the old one is dropped on the next update.
+"""
+
+FORMAT_VERSION = 2  # bump when the file layout or the feature computation changes
+
+LatestFeatures = Tuple[str, Dict[FeatureSpec, Any]]  # (price data fingerprint, {spec: trailing rows})
+
+
+def feature_version(specs: Iterable[FeatureSpec], latest_rows: int) -> str:
+    payload = json.dumps({
+        "format": FORMAT_VERSION,
+        "latest_rows": latest_rows,
+        "features": sorted([spec.name, repr(spec.resolved)] for spec in specs),
+    })
+    return hashlib.blake2b(payload.encode(), digest_size=6).hexdigest()
+
+
+class FeatureStoreEntry(BaseModel):
+    # NaN is a normal state value (e.g. ADX's DX after one bar): keep it through model_dump(mode="json")
+    model_config = ConfigDict(ser_json_inf_nan="constants")
+
+    rows: int
+    last_date: Optional[datetime] = None
+    fingerprint: str  # `data_fingerprint` of the price frame the features were computed from
+    states: Dict[str, dict] = {}  # streaming indicator states after the last bar, by spec column
+
+
+class FeatureUpdateReport(BaseModel):
+    unchanged: int = 0
+    appended: int = 0
+    rebuilt: int = 0
+    failed: Dict[str, str] = {}
+    elapsed_seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (f"{self.rebuilt} rebuilt, {self.appended} appended, {self.unchanged} unchanged, "
+                f"{len(self.failed)} failed in {self.elapsed_seconds:.2f}s")
+
+
+class FeatureStore:
+    def __init__(self, root: Path, specs: Iterable[FeatureSpec], latest_rows: int = 1) -> None:
+        self.specs = sorted(set(specs), key=lambda spec: spec.column)
+        self.latest_rows = max(1, latest_rows)
+        self.version = feature_version(self.specs, self.latest_rows)
+        self.root = Path(root)
+        self.dir = self.root / self.version
+        self.manifest_path = self.dir / "_manifest.json"
+        self.latest_path = self.dir / "_latest.parquet"
+
+    @classmethod
+    def for_strategies(cls, root: Path, strategies: Iterable[MomentumStrategy]) -> "FeatureStore":
+        """The store covering every feature the given strategies declare."""
+        strategies = list(strategies)
+        specs = [spec for strategy in strategies for spec in strategy.required_features]
+        return cls(root, specs, max((s.feature_rows for s in strategies), default=1))
+
+    def _path(self, ticker: str) -> Path:
+        safe_ticker = ticker.replace(".NS", "").replace(".BO", "")
+        return self.dir / f"{safe_ticker}.parquet"
+
+    # --- Computation ---
+    def compute(self,
+                df: pd.DataFrame,
+                start: int = 0,
+                states: Optional[Dict[str, dict]] = None) -> Tuple[pd.DataFrame, Dict[str, Optional[List[str]]], Dict[str, dict]]:
+        """
+        Feature rows for the bars of `df` from position `start` on, as columns (DataFrame
+        indicators contribute `<spec column>:<output>` columns), plus the output names of
+        each spec and the streaming states after the last bar.
+        Recursive indicators (see static/streaming.py) continue from `states` over the new
+        bars only; rolling-window indicators are recomputed over `df` and sliced.
+        """
+        columns: Dict[str, pd.Series] = {}
+        outputs: Dict[str, Optional[List[str]]] = {}
+        new_states: Dict[str, dict] = {}
+        for spec in self.specs:
+            streaming = streaming_counterpart(spec.func)
+            saved = (states or {}).get(spec.column)
+            if streaming is not None and start > 0 and saved is not None:
+                indicator = streaming.from_state(saved)
+                result = indicator.run(df.iloc[start:])
+                new_states[spec.column] = indicator.to_state()
+            elif streaming is not None:
+                indicator = streaming(**spec.params)
+                result = indicator.run(df).iloc[start:]
+                new_states[spec.column] = indicator.to_state()
+            else:
+                result = spec.compute(df).iloc[start:]
+
+            if isinstance(result, pd.DataFrame):
+                outputs[spec.column] = list(result.columns)
+                for name in result.columns:
+                    columns[f"{spec.column}:{name}"] = result[name]
+            else:
+                outputs[spec.column] = None
+                columns[spec.column] = result
+        return pd.DataFrame(columns, index=df.index[start:]), outputs, new_states
+
+    # --- Manifest ---
+    def _read_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {"version": self.version, "outputs": {}, "tickers": {}}
+        with self.manifest_path.open('r') as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: dict) -> None:
+        tmp = self.manifest_path.with_suffix(".json.tmp")
+        with tmp.open('w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp, self.manifest_path)
+
+    def _prune_other_versions(self) -> None:
+        """Removes stores of earlier feature sets (they can never be read again)."""
+        for path in self.root.iterdir():
+            if path.is_dir() and path.name != self.version and (path / "_manifest.json").exists():
+                shutil.rmtree(path, ignore_errors=True)
+                logging.info(f"Removed outdated feature store {path.name}")
+
+    # --- Update (collection stage) ---
+    def update(self, frames: Callable[[str], pd.DataFrame], tickers: List[str]) -> FeatureUpdateReport:
+        """
+        Brings the stored features of `tickers` in line with their price data (`frames(ticker)`):
+        - unchanged data (same fingerprint) is skipped,
+        - data that only gained bars at the end gets the new feature rows appended (recursive
+          indicators advance from their saved state, in constant time per bar),
+        - anything else (new ticker, revised history) is recomputed from scratch.
+        """
+        start = time.perf_counter()
+        report = FeatureUpdateReport()
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self._prune_other_versions()
+        manifest = self._read_manifest()
+        entries = manifest["tickers"]
+        tails: Dict[str, pd.DataFrame] = {}
+
+        for ticker in tickers:
+            df = frames(ticker)
+            if df.empty:
+                continue
+            try:
+                fingerprint = data_fingerprint(df)
+                path = self._path(ticker)
+                entry = FeatureStoreEntry(**entries[ticker]) if ticker in entries and path.exists() else None
+                if entry is not None and entry.fingerprint == fingerprint:
+                    report.unchanged += 1
+                    continue
+                if entry is not None and entry.rows < len(df) and \
+                        data_fingerprint(df.iloc[:entry.rows]) == entry.fingerprint:
+                    new_rows, outputs, states = self.compute(df, entry.rows, entry.states)
+                    features = pd.concat([pd.read_parquet(path), new_rows])
+                    report.appended += 1
+                else:
+                    features, outputs, states = self.compute(df)
+                    report.rebuilt += 1
+                features.to_parquet(path)
+                manifest["outputs"].update(outputs)
+                entries[ticker] = FeatureStoreEntry(
+                    rows=len(df), last_date=df.index[-1], fingerprint=fingerprint, states=states
+                ).model_dump(mode="json")
+                tails[ticker] = features.iloc[-self.latest_rows:]
+            except Exception as e:
+                entries.pop(ticker, None)
+                report.failed[ticker] = str(e)
+                logging.warning(f"Features for {ticker} failed: {e}")
+
+        if tails or report.failed:
+            self._write_latest(tails, drop=set(report.failed))
+            self._write_manifest(manifest)
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
+
+    def _write_latest(self, tails: Dict[str, pd.DataFrame], drop: set) -> None:
+        """Replaces the trailing rows of the updated tickers in `_latest.parquet`."""
+        parts = []
+        if self.latest_path.exists():
+            previous = pd.read_parquet(self.latest_path)
+            parts.append(previous[~previous["ticker"].isin(set(tails) | drop)])
+        for ticker, tail in tails.items():
+            part = tail.reset_index(names="date")
+            part.insert(0, "ticker", ticker)
+            parts.append(part)
+        latest = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        tmp = self.latest_path.with_suffix(".parquet.tmp")
+        latest.to_parquet(tmp, index=False)
+        os.replace(tmp, self.latest_path)
+
+    # --- Read (shortlist) ---
+    def load_latest(self, tickers: Optional[List[str]] = None) -> Dict[str, LatestFeatures]:
+        """
+        {ticker: (fingerprint, {spec: trailing rows})} from the single `_latest.parquet`.
+        Callers must compare the fingerprint with the price data they analyse.
+        """
+        if not (self.manifest_path.exists() and self.latest_path.exists()):
+            return {}
+        manifest = self._read_manifest()
+        # Chunks of a parallel shortlist read only their own rows
+        filters = [("ticker", "in", list(tickers))] if tickers is not None else None
+        latest = pd.read_parquet(self.latest_path, filters=filters)
+
+        result: Dict[str, LatestFeatures] = {}
+        for ticker, rows in latest.groupby("ticker", sort=False):
+            entry = manifest["tickers"].get(ticker)
+            if entry is None:
+                continue
+            rows = rows.set_index("date")
+            rows.index.name = None
+            features: Dict[FeatureSpec, Any] = {}
+            for spec in self.specs:
+                outputs = manifest["outputs"].get(spec.column)
+                if outputs is None:
+                    features[spec] = rows[spec.column]
+                else:
+                    features[spec] = rows[[f"{spec.column}:{name}" for name in outputs]].set_axis(outputs, axis=1)
+            result[ticker] = (entry["fingerprint"], features)
+        return result
+
+    def load(self, ticker: str) -> pd.DataFrame:
+        """The full stored feature history of one ticker (empty when not stored)."""
+        path = self._path(ticker)
+        return pd.read_parquet(path) if path.exists() else pd.DataFrame()
+
+
+def strategy_feature_store(data_manager: DataManager) -> FeatureStore:
+    """The store for the features of all registered `static_momentum_strategies`."""
+    return FeatureStore.for_strategies(data_manager.config.stock_features_dir, static_momentum_strategies.values())
+
+
+def update_strategy_features(data_manager: DataManager, tickers: Optional[List[str]] = None) -> FeatureUpdateReport:
+    """Post-collection stage: refreshes the features of `tickers` (default: the stored universe)."""
+    tickers = tickers if tickers is not None else list(data_manager.storage.load_tickers().keys())
+    store = strategy_feature_store(data_manager)
+    report = store.update(data_manager.stock_frames(tickers), tickers)
+    logging.info(f"Feature store {store.version}: {report.summary()}")
+    return report
@@ -0,0 +1,232 @@
+import functools
+import inspect
+from typing import Callable, Dict, Optional
+import numpy as np
+
+from nifty_500_momentum.data.panel import StockPanel
+
+"""
+PANEL INDICATORS
+----------------
+Universe-wide counterparts of `static/indicators.py`: every indicator is computed for
+all tickers at once on 2-D (dates x tickers) arrays and returned in the panel layout.
+
+A panel is aligned on the union of trading dates, but the per-ticker functions only see
+the bars a ticker actually has. The engine therefore first "compacts" every column so
+row k holds the ticker's k-th bar (padding at the bottom); shifts, diffs, rolling windows
+and the recursive (EMA / Wilder) smoothing then run on exactly the same sequence as the
+per-ticker functions, and the results are scattered back to the panel dates.
+
+The smoothing follows pandas' `ewm(adjust=False).mean()` step for step (including its
+NaN handling), so outputs match the per-ticker functions bit for bit; rolling means are
+computed from window sums and match within ~1e-15 relative.
+
+Indicator results are memoized per engine (by method and bound parameters) and returned
+read-only, so any number of strategies or rules asking for e.g. `rsi(14)` share one array.
+"""
+
+
+# --- Array kernels (axis 0 = bar, axis 1 = ticker) ---
+def ewm_mean(values: np.ndarray,
+             com: Optional[float] = None,
+             span: Optional[float] = None,
+             alpha: Optional[float] = None) -> np.ndarray:
+    """Column-wise `ewm(..., adjust=False).mean()`. Loops over bars, vectorized over tickers."""
+    if span is not None:
+        com = (span - 1) / 2.0
+    elif alpha is not None:
+        com = 1.0 / alpha - 1.0
+    alpha = 1.0 / (1.0 + com)
+    factor = 1.0 - alpha
+
+    out = np.empty(values.shape, dtype=float)
+    if len(values) == 0:
+        return out
+    weighted = values[0].astype(float)
+    old_wt = np.ones(values.shape[1:])
+    out[0] = weighted
+    with np.errstate(invalid="ignore"):
+        for i in range(1, len(values)):
+            cur = values[i]
+            is_obs = cur == cur
+            has_mean = weighted == weighted
+            # Without ignore_na the old weight decays on every bar once a mean exists
+            old_wt = np.where(has_mean, old_wt * factor, old_wt)
+            step = has_mean & is_obs
+            updated = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            weighted = np.where(step & (weighted != cur), updated, weighted)
+            old_wt = np.where(step, 1.0, old_wt)
+            weighted = np.where(~has_mean & is_obs, cur, weighted)
+            out[i] = weighted
+    return out
+
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    out = np.full(values.shape, np.nan)
+    if periods < len(values):
+        out[periods:] = values[:len(values) - periods]
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Column-wise `rolling(window).mean()` (NaN until a full window without gaps)."""
+    out = np.full(values.shape, np.nan)
+    if window > len(values):
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+    out[window - 1:] = windows.sum(axis=-1) / window
+    return out
+
+
+def _memoized(method: Callable) -> Callable:
+    """Caches an indicator method's result per bound parameters (defaults included)."""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, tuple(list(bound.arguments.items())[1:]))
+        if key not in self._results:
+            result = method(self, *args, **kwargs)
+            for values in (result.values() if isinstance(result, dict) else [result]):
+                values.flags.writeable = False
+            self._results[key] = result
+        result = self._results[key]
+        return dict(result) if isinstance(result, dict) else result
+    return wrapper
+
+
+# --- Engine ---
+class PanelIndicatorEngine:
+    """
+    Computes the indicators of `static/indicators.py` for every ticker of a `StockPanel`.
+    Methods return (dates x tickers) arrays in the panel layout (NaN where a ticker has
+    no bar); `latest` extracts the value at each ticker's last (or n-th last) bar.
+    """
+    def __init__(self, panel: StockPanel) -> None:
+        self.panel = panel
+        present = np.zeros((len(panel.dates), len(panel.tickers)), dtype=bool)
+        for values in panel.fields.values():
+            present |= ~np.isnan(values)
+        # (rows, cols): panel positions of every bar; ranks: the bar's index within its ticker
+        self._rows, self._cols = np.nonzero(present)
+        self._ranks = (np.cumsum(present, axis=0) - 1)[self._rows, self._cols]
+        self.present = present
+        self.bar_counts = present.sum(axis=0)
+        self._depth = int(self.bar_counts.max()) if len(panel.tickers) else 0
+        self._compact_fields: Dict[str, np.ndarray] = {}
+        self._results: Dict[tuple, object] = {}
+
+    # --- Layout ---
+    def compact(self, values: np.ndarray) -> np.ndarray:
+        """Panel layout -> bar layout (row k = k-th bar of each ticker)."""
+        out = np.full((self._depth, values.shape[1]), np.nan)
+        out[self._ranks, self._cols] = values[self._rows, self._cols]
+        return out
+
+    def expand(self, values: np.ndarray) -> np.ndarray:
+        """Bar layout -> panel layout."""
+        out = np.full((len(self.panel.dates), values.shape[1]), np.nan)
+        out[self._rows, self._cols] = values[self._ranks, self._cols]
+        return out
+
+    def field(self, name: str) -> np.ndarray:
+        """A panel field in bar layout (cached)."""
+        if name not in self._compact_fields:
+            self._compact_fields[name] = self.compact(self.panel.field(name))
+        return self._compact_fields[name]
+
+    def latest(self, values: np.ndarray, offset: int = 0) -> np.ndarray:
+        """
+        Per-ticker value at the last bar (`offset=1`: the bar before, like `iloc[-2]`).
+        NaN for tickers with fewer than `offset + 1` bars.
+        """
+        bar = self.bar_counts - 1 - offset
+        out = np.full(len(self.panel.tickers), np.nan)
+        valid = bar >= 0
+        out[valid] = self.compact(values)[bar[valid], np.flatnonzero(valid)]
+        return out
+
+    def previous(self, values: np.ndarray, periods: int = 1) -> np.ndarray:
+        """Panel values of each ticker's bar `periods` bars earlier (`shift` over the ticker's own bars)."""
+        return self.expand(shift(self.compact(values), periods))
+
+    def bar_number(self) -> np.ndarray:
+        """1-based position of every bar within its ticker's history (NaN where no bar)."""
+        numbers = np.broadcast_to(np.arange(1, self._depth + 1, dtype=float)[:, None], (self._depth, len(self.panel.tickers)))
+        return self.expand(numbers)
+
+    # --- Indicators (bar layout internally, panel layout out) ---
+    @_memoized
+    def rsi(self, length: int = 14) -> np.ndarray:
+        close = self.field("Close")
+        delta = close - shift(close)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gain = np.where(delta > 0, delta, 0.0)
+            loss = -np.where(delta < 0, delta, 0.0)
+            avg_gain = ewm_mean(gain, alpha=1 / length)
+            avg_loss = ewm_mean(loss, alpha=1 / length)
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        return self.expand(np.where(np.isnan(rsi), 0.0, rsi))
+
+    @_memoized
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+        close = self.field("Close")
+        macd_line = ewm_mean(close, span=fast) - ewm_mean(close, span=slow)
+        signal_line = ewm_mean(macd_line, span=signal)
+        return {
+            'MACD': self.expand(macd_line),
+            'Signal': self.expand(signal_line),
+            'Histogram': self.expand(macd_line - signal_line),
+        }
+
+    @_memoized
+    def sma(self, length: int = 50) -> np.ndarray:
+        return self.expand(rolling_mean(self.field("Close"), length))
+
+    @_memoized
+    def ema(self, length: int = 20) -> np.ndarray:
+        return self.expand(ewm_mean(self.field("Close"), span=length))
+
+    @_memoized
+    def roc(self, length: int = 10) -> np.ndarray:
+        close = self.field("Close")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.expand((close / shift(close, length) - 1) * 100)
+
+    @_memoized
+    def adx(self, length: int = 14) -> Dict[str, np.ndarray]:
+        high, low, close = self.field("High"), self.field("Low"), self.field("Close")
+        prev_close = shift(close)
+        # pandas' row-wise max skips NaN
+        tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+
+        up_move = high - shift(high)
+        down_move = shift(low) - low
+        with np.errstate(invalid="ignore", divide="ignore"):
+            plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+            minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+            tr_smooth = ewm_mean(tr, alpha=1 / length)
+            plus_di = 100 * (ewm_mean(plus_dm, alpha=1 / length) / tr_smooth)
+            minus_di = 100 * (ewm_mean(minus_dm, alpha=1 / length) / tr_smooth)
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+        adx = ewm_mean(dx, alpha=1 / length)
+        return {'ADX': self.expand(adx), '+DI': self.expand(plus_di), '-DI': self.expand(minus_di)}
+
+    @_memoized
+    def relative_volume(self, ma_length: int = 20) -> np.ndarray:
+        volume = self.field("Volume")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rvol = volume / rolling_mean(volume, ma_length)
+        return self.expand(np.where(np.isnan(rvol), 0.0, rvol))
+
+    @_memoized
+    def momentum_12m_1m(self) -> np.ndarray:
+        close = self.field("Close")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mom = shift(close, 21) / shift(close, 252) - 1
+        # Like the per-ticker function: undefined for tickers with less than a year of bars
+        mom[:, self.bar_counts < 252] = np.nan
+        return self.expand(mom)
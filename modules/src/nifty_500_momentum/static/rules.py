@@ -0,0 +1,352 @@
+import ast
+import json
+import math
+import logging
+import operator
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+import nifty_500_momentum.static.indicators as ind
+from nifty_500_momentum.static import static_momentum_strategies
+from nifty_500_momentum.static.feature_cache import FeatureContext, FeatureSpec
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
+from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult, StaticSignals
+
+"""
+RULE STRATEGIES
+---------------
+Strategies defined in config as boolean rules over named indicators instead of
+`MomentumStrategy` subclasses:
+
+    RuleConfig(name="vol_spike", rule="rvol_20 > 2 and roc_10 > 10 and rsi_14 < 85")
+    RuleConfig(name="dip_buy", rule="close > sma_200 and rsi_low < rsi_14 < rsi_high",
+               params={"rsi_low": 30, "rsi_high": 45})
+
+A rule is compiled once into a `RulePlan`: its clauses (one comparison each; chained
+comparisons are split), the indicators they reference and the and / or / not structure.
+The same plan evaluates a ticker's latest bar (shortlisting, through the shared
+`FeatureContext`) or every date of a panel at once (signal history, sweeps, through the
+`PanelIndicatorEngine`); in both cases an indicator used by several rules is computed once.
+
+Operands are indicator names `<indicator>[_<parameter>][_prev]` (see `RULE_INDICATORS`;
+`_prev` reads the bar before the last), price fields (`close`, `volume`, ...), numbers,
+named `params` (tunable thresholds, see static/sweep.py) and + - * / between them.
+Registered rule strategies live in `static_momentum_strategies` next to the built-ins.
+"""
+
+
+class RuleIndicator(BaseModel):
+    func: Callable[..., Any]          # per-ticker function of static/indicators.py
+    method: str                       # PanelIndicatorEngine counterpart
+    param: Optional[str] = None       # parameter set by the `_<n>` suffix
+    output: Optional[str] = None      # column of DataFrame-valued indicators
+    columns: List[str] = ["Close"]    # price columns the indicator reads
+
+
+RULE_INDICATORS: Dict[str, RuleIndicator] = {
+    "rsi": RuleIndicator(func=ind.calculate_rsi, method="rsi", param="length"),
+    "sma": RuleIndicator(func=ind.calculate_sma, method="sma", param="length"),
+    "ema": RuleIndicator(func=ind.calculate_ema, method="ema", param="length"),
+    "roc": RuleIndicator(func=ind.calculate_roc, method="roc", param="length"),
+    "rvol": RuleIndicator(func=ind.calculate_relative_volume, method="relative_volume", param="ma_length", columns=["Volume"]),
+    "adx": RuleIndicator(func=ind.calculate_adx, method="adx", param="length", output="ADX", columns=["High", "Low", "Close"]),
+    "plus_di": RuleIndicator(func=ind.calculate_adx, method="adx", param="length", output="+DI", columns=["High", "Low", "Close"]),
+    "minus_di": RuleIndicator(func=ind.calculate_adx, method="adx", param="length", output="-DI", columns=["High", "Low", "Close"]),
+    "macd": RuleIndicator(func=ind.calculate_macd, method="macd", output="MACD"),
+    "macd_signal": RuleIndicator(func=ind.calculate_macd, method="macd", output="Signal"),
+    "macd_hist": RuleIndicator(func=ind.calculate_macd, method="macd", output="Histogram"),
+    "mom_12m_1m": RuleIndicator(func=ind.calculate_momentum_12m_1m, method="momentum_12m_1m"),
+}
+
+PRICE_FIELDS = {"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+
+_COMPARISONS: Dict[type, Tuple[str, Callable]] = {
+    ast.Gt: (">", operator.gt), ast.GtE: (">=", operator.ge),
+    ast.Lt: ("<", operator.lt), ast.LtE: ("<=", operator.le),
+}
+_ARITHMETIC: Dict[type, Callable] = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+}
+
+
+class RuleConfig(BaseModel):
+    name: str                         # key in `static_momentum_strategies`
+    rule: str
+    description: str = ""
+    params: Dict[str, float] = {}     # named thresholds used in `rule`
+
+
+# --- Operands ---
+class RuleFeature:
+    """One series a rule reads: an indicator output or a price field, optionally a bar back."""
+    def __init__(self, name: str) -> None:
+        self.name = name
+        base, self.offset = (name[:-len("_prev")], 1) if name.endswith("_prev") else (name, 0)
+        self.field = PRICE_FIELDS.get(base)
+        self.indicator: Optional[RuleIndicator] = None
+        self.params: Dict[str, int] = {}
+        if self.field is None:
+            indicator_name, _, suffix = base.rpartition("_")
+            if base in RULE_INDICATORS:
+                self.indicator = RULE_INDICATORS[base]
+            elif suffix.isdigit() and indicator_name in RULE_INDICATORS and RULE_INDICATORS[indicator_name].param:
+                self.indicator = RULE_INDICATORS[indicator_name]
+                self.params = {self.indicator.param: int(suffix)}
+            else:
+                raise ValueError(f"Unknown rule operand '{name}'. Indicators: {sorted(RULE_INDICATORS)} "
+                                 f"(optionally _<n>, _prev); fields: {sorted(PRICE_FIELDS)}")
+        self.spec = FeatureSpec(self.indicator.func, **self.params) if self.indicator is not None else None
+
+    @property
+    def columns(self) -> List[str]:
+        return [self.field] if self.field is not None else self.indicator.columns
+
+    def latest(self, df: pd.DataFrame, features: FeatureContext) -> float:
+        """Value at the last bar of `df` (or the one before for `_prev`); NaN if there is none."""
+        if self.field is not None:
+            series = df[self.field] if self.field in df.columns else pd.Series(dtype=float)
+        else:
+            series = features.feature(self.spec)
+            if self.indicator.output is not None:
+                series = series[self.indicator.output]
+        return float(series.iloc[-1 - self.offset]) if len(series) > self.offset else math.nan
+
+    def panel(self, engine: PanelIndicatorEngine) -> np.ndarray:
+        """(dates x tickers) values."""
+        if self.field is not None:
+            values = engine.panel.field(self.field)
+        else:
+            values = getattr(engine, self.indicator.method)(**self.params)
+            if self.indicator.output is not None:
+                values = values[self.indicator.output]
+        return engine.previous(values, self.offset) if self.offset else values
+
+
+class Clause:
+    """One comparison of the rule, e.g. `rsi_14 < 85`."""
+    def __init__(self, text: str, left: Callable, op: str, compare: Callable, right: Callable, features: List[str]) -> None:
+        self.text = text
+        self.left, self.op, self.compare, self.right = left, op, compare, right
+        self.features = features
+
+    def evaluate(self, values: Dict[str, Any]) -> Any:
+        with np.errstate(invalid="ignore"):
+            return self.compare(self.left(values), self.right(values))
+
+
+# --- Compilation ---
+class RulePlan:
+    """A compiled rule: evaluates on scalars (one ticker's latest bar) or arrays (a whole panel)."""
+    def __init__(self, rule: str, params: Optional[Dict[str, float]] = None) -> None:
+        self.rule = rule
+        self.params = dict(params or {})
+        self.features: Dict[str, RuleFeature] = {}
+        self.clauses: List[Clause] = []
+        try:
+            tree = ast.parse(rule.strip(), mode="eval").body
+        except SyntaxError as e:
+            raise ValueError(f"Invalid rule '{rule}': {e.msg}") from e
+        # node: clause index, or ("and" | "or", [nodes]), or ("not", node)
+        self.tree = self._compile(tree)
+        # Clauses under an odd number of `not`s reject a ticker when they hold
+        self.negated: Dict[int, bool] = {}
+        self._polarity(self.tree, False)
+
+    def _compile(self, node: ast.AST) -> Any:
+        if isinstance(node, ast.BoolOp):
+            return ("and" if isinstance(node.op, ast.And) else "or", [self._compile(v) for v in node.values])
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return ("not", self._compile(node.operand))
+        if isinstance(node, ast.Compare):
+            # a < b < c -> (a < b) and (b < c)
+            operands = [node.left, *node.comparators]
+            nodes = []
+            for left, op, right in zip(operands, node.ops, operands[1:]):
+                if type(op) not in _COMPARISONS:
+                    raise ValueError(f"Unsupported comparison in rule '{self.rule}': {ast.unparse(node)}")
+                symbol, compare = _COMPARISONS[type(op)]
+                names: List[str] = []
+                clause = Clause(f"{ast.unparse(left)} {symbol} {ast.unparse(right)}",
+                                self._operand(left, names), symbol, compare, self._operand(right, names), names)
+                self.clauses.append(clause)
+                nodes.append(len(self.clauses) - 1)
+            return nodes[0] if len(nodes) == 1 else ("and", nodes)
+        raise ValueError(f"Rule '{self.rule}' must combine comparisons with and / or / not, got: {ast.unparse(node)}")
+
+    def _operand(self, node: ast.AST, names: List[str]) -> Callable[[Dict[str, Any]], Any]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            value = float(node.value)
+            return lambda values: value
+        if isinstance(node, ast.Name):
+            name = node.id
+            if name not in self.params and name not in self.features:
+                self.features[name] = RuleFeature(name)
+            if name not in self.params:
+                names.append(name)
+            return lambda values: values[name]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            operand = self._operand(node.operand, names)
+            return lambda values: -operand(values)
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+            left, right, apply = self._operand(node.left, names), self._operand(node.right, names), _ARITHMETIC[type(node.op)]
+
+            def arithmetic(values: Dict[str, Any]) -> Any:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    return apply(left(values), right(values))
+            return arithmetic
+        raise ValueError(f"Unsupported operand in rule '{self.rule}': {ast.unparse(node)}")
+
+    def _polarity(self, node: Any, negated: bool) -> None:
+        if isinstance(node, int):
+            self.negated[node] = negated
+        elif node[0] == "not":
+            self._polarity(node[1], not negated)
+        else:
+            for child in node[1]:
+                self._polarity(child, negated)
+
+    # --- Evaluation ---
+    def evaluate(self, values: Dict[str, Any], clause_results: Optional[List[Any]] = None) -> Any:
+        """`values`: feature name / param -> scalar or array. Returns the rule outcome (same shape)."""
+        results = clause_results if clause_results is not None else self.evaluate_clauses(values)
+        return self._combine(self.tree, results)
+
+    def evaluate_clauses(self, values: Dict[str, Any]) -> List[Any]:
+        return [clause.evaluate(values) for clause in self.clauses]
+
+    def _combine(self, node: Any, results: List[Any]) -> Any:
+        if isinstance(node, int):
+            return results[node]
+        if node[0] == "not":
+            return np.logical_not(self._combine(node[1], results))
+        combine = np.logical_and if node[0] == "and" else np.logical_or
+        outcome = self._combine(node[1][0], results)
+        for child in node[1][1:]:
+            outcome = combine(outcome, self._combine(child, results))
+        return outcome
+
+    def rejecting(self, results: List[Any]) -> List[Any]:
+        """Per clause: whether it argues against the rule (a failed clause, or a holding one under `not`)."""
+        return [np.logical_not(r) if not self.negated[i] else r for i, r in enumerate(results)]
+
+
+# --- Strategy ---
+class ClauseOutcome(BaseModel):
+    clause: str
+    passed: bool
+    values: Dict[str, float] = {}
+
+
+class RuleExplanation(BaseModel):
+    rule: str
+    pass_filter: bool
+    clauses: List[ClauseOutcome] = []
+    rejected_by: List[str] = []
+
+
+class RuleStrategy(MomentumStrategy):
+    """A `MomentumStrategy` evaluating a compiled `RuleConfig`. Metrics are the rule's operands."""
+    def __init__(self, config: RuleConfig) -> None:
+        reserved = set(dir(MomentumStrategy)) | {"config", "plan"}
+        clashing = [p for p in config.params if p in reserved or not p.isidentifier()]
+        if clashing:
+            raise ValueError(f"Invalid param names for rule {config.name}: {clashing}")
+        self.config = config
+        self.plan = RulePlan(config.rule, config.params)
+        features = list(self.plan.features.values())
+        self.required_features = list(dict.fromkeys(f.spec for f in features if f.spec is not None))
+        self.feature_rows = 1 + max((f.offset for f in features), default=0)
+        self.columns = list(dict.fromkeys(c for f in features for c in f.columns))
+        self.thresholds = tuple(config.params)
+        for name, value in config.params.items():
+            setattr(self, name, value)
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    def _values(self, features: Dict[str, Any]) -> Dict[str, Any]:
+        return {**features, **self.threshold_values()}
+
+    def _latest(self, df: pd.DataFrame, features: FeatureContext) -> Dict[str, float]:
+        return {name: feature.latest(df, features) for name, feature in self.plan.features.items()}
+
+    def analyze(self, df: pd.DataFrame, features: Optional[FeatureContext] = None) -> StaticScoutResult:
+        if df.empty:
+            return StaticScoutResult(pass_filter=False, metrics={}, reason="Data Error")
+        features = features or FeatureContext(df)
+        latest = self._latest(df, features)
+        results = self.plan.evaluate_clauses(self._values(latest))
+        pass_filter = bool(self.plan.evaluate({}, results))
+        if pass_filter:
+            reason = f"Rule {self.name} matched"
+        else:
+            rejected = [c.text for c, r in zip(self.plan.clauses, self.plan.rejecting(results)) if r]
+            reason = f"Rejected by: {', '.join(rejected)}"
+        return StaticScoutResult(
+            pass_filter=pass_filter,
+            metrics={name: round(value, 2) for name, value in latest.items()},
+            reason=reason
+        )
+
+    def signal_history(self, engine: PanelIndicatorEngine, metrics: bool = True) -> StaticSignals:
+        panel = {name: feature.panel(engine) for name, feature in self.plan.features.items()}
+        passes = np.asarray(self.plan.evaluate(self._values(panel)), dtype=bool)
+        if not metrics:
+            return StaticSignals(passes=passes)
+        return StaticSignals(passes=passes, metrics={name: np.round(values, 2) for name, values in panel.items()})
+
+    # --- Explain mode ---
+    def explain(self, df: pd.DataFrame, features: Optional[FeatureContext] = None) -> RuleExplanation:
+        """Every clause's outcome on the latest bar, with the operand values it compared."""
+        if df.empty:
+            return RuleExplanation(rule=self.config.rule, pass_filter=False, rejected_by=["no data"])
+        latest = self._latest(df, features or FeatureContext(df))
+        results = self.plan.evaluate_clauses(self._values(latest))
+        rejecting = self.plan.rejecting(results)
+        return RuleExplanation(
+            rule=self.config.rule,
+            pass_filter=bool(self.plan.evaluate({}, results)),
+            clauses=[ClauseOutcome(clause=c.text, passed=bool(r), values={n: latest[n] for n in c.features})
+                     for c, r in zip(self.plan.clauses, results)],
+            rejected_by=[c.text for c, r in zip(self.plan.clauses, rejecting) if r],
+        )
+
+    def explain_latest(self, engine: PanelIndicatorEngine) -> pd.DataFrame:
+        """Universe-wide explain: tickers x clauses (True = clause holds) at each ticker's last bar, plus `pass`."""
+        panel = {name: feature.panel(engine) for name, feature in self.plan.features.items()}
+        results = self.plan.evaluate_clauses(self._values(panel))
+        latest = {c.text: engine.latest(np.asarray(r, dtype=float)) == 1.0 for c, r in zip(self.plan.clauses, results)}
+        latest["pass"] = engine.latest(np.asarray(self.plan.evaluate({}, results), dtype=float)) == 1.0
+        return pd.DataFrame(latest, index=engine.panel.tickers)
+
+
+# --- Registry ---
+def register_rule_strategies(rules: Iterable[Union[RuleConfig, dict]]) -> Dict[str, RuleStrategy]:
+    """
+    Compiles `rules` and registers them in `static_momentum_strategies` (a rule may replace
+    an earlier rule of the same name, not a built-in strategy).
+    """
+    registered = {}
+    for config in rules:
+        config = config if isinstance(config, RuleConfig) else RuleConfig(**config)
+        existing = static_momentum_strategies.get(config.name)
+        if existing is not None and not isinstance(existing, RuleStrategy):
+            raise ValueError(f"Rule name {config.name} is taken by a built-in strategy")
+        if isinstance(existing, RuleStrategy) and existing.config == config:
+            registered[config.name] = existing
+            continue
+        strategy = RuleStrategy(config)
+        static_momentum_strategies[config.name] = strategy
+        registered[config.name] = strategy
+        logging.info(f"Registered rule strategy {config.name}: {config.rule}")
+    return registered
+
+
+def load_rule_configs(path: Path) -> List[RuleConfig]:
+    """Rule definitions from a JSON file holding a list of `RuleConfig` objects."""
+    with Path(path).open('r') as f:
+        return [RuleConfig(**rule) for rule in json.load(f)]
@@ -1,13 +1,19 @@
-from pydantic import BaseModel 
+from pydantic import BaseModel, field_validator, model_validator
 from enum import Enum
-from typing import Dict
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pandas import DataFrame
 import json
 from pathlib import Path
 from datetime import datetime
 import logging
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from nifty_500_momentum.static import static_momentum_strategies, StaticScoutResult
+from nifty_500_momentum.static.feature_cache import FeatureContext, IndicatorCache
+from nifty_500_momentum.static.feature_store import strategy_feature_store
+from nifty_500_momentum.static.ensemble import EnsembleEvaluator, EnsembleMetrics
+from nifty_500_momentum.static.rules import RuleConfig, register_rule_strategies
 from nifty_500_momentum.data.manager import DataManager, DataConfig
 
 
@@ -17,20 +23,50 @@ class Strategies(str, Enum):
     REVERSAL_HUNTER = "reversal_hunter"
     TREND_SURFER = "trendsurfer"
 
-    # Ensemble strategies
+    # Ensemble strategies (see static/ensemble.py)
     ANY = "any"
     ALL = "all"
-    
+    K_OF_N = "k_of_n"
+
+
+ENSEMBLE_STRATEGIES = (Strategies.ANY, Strategies.ALL, Strategies.K_OF_N)
+
+# A built-in strategy, or the name of a rule strategy (see static/rules.py)
+StrategyKey = Union[Strategies, str]
+
+
+def as_strategy_key(value: Any) -> Any:
+    """Built-in names become `Strategies` members; other names are kept as rule names."""
+    return Strategies(value) if isinstance(value, str) and value in Strategies._value2member_map_ else value
+
+
+def strategy_name(strategy: StrategyKey) -> str:
+    return strategy.value if isinstance(strategy, Strategies) else strategy
+
 
 class ShortlisterConfig(BaseModel):
     shortlist_id: str
-    strategy: Strategies
+    strategy: StrategyKey
     data_config: DataConfig
+    max_workers: int = 1   # > 1 analyses ticker chunks on a process pool
+    chunk_size: int = 0    # tickers per chunk, 0 = about four chunks per worker
+    ensemble_k: int = 2    # strategies that must pass for Strategies.K_OF_N
+    ensemble_metrics: EnsembleMetrics = EnsembleMetrics.SHORTLISTED  # when ensembles may stop early
+    rules: List[RuleConfig] = []  # rule strategies registered next to the built-ins (select one by name)
+
+    _strategy_key = field_validator("strategy", mode="before")(as_strategy_key)
+
+    @model_validator(mode="after")
+    def _check_rule_strategy(self) -> "ShortlisterConfig":
+        if not isinstance(self.strategy, Strategies) and self.strategy not in {r.name for r in self.rules} \
+                and self.strategy not in static_momentum_strategies:
+            raise ValueError(f"Unknown strategy {self.strategy}: not built in and not among the configured rules")
+        return self
 
 
 class StaticShortlistResult(BaseModel):
     shortlist_id: str
-    strategy: Strategies
+    strategy: StrategyKey
     data_config: DataConfig
     timestamp: datetime
     num_tickers: int
@@ -38,49 +74,61 @@ class StaticShortlistResult(BaseModel):
     
     shortlisted_tickers: list[str]
     tickers_results: Dict[str, StaticScoutResult]
+
+    _strategy_key = field_validator("strategy", mode="before")(as_strategy_key)
     
     
 class Shortlister:
     def __init__(self, config: ShortlisterConfig) -> None:
         self.config = config
         self.data_manager = DataManager(config=config.data_config)
-        
+        # Indicator series shared by all strategies of this run (see static/feature_cache.py)
+        self.indicator_cache = IndicatorCache()
+        self._ensembles: Dict[Strategies, EnsembleEvaluator] = {}
+        register_rule_strategies(config.rules)
+
+    def ensemble(self, strategy: Strategies) -> EnsembleEvaluator:
+        """The evaluator of an ensemble strategy (kept for the run: it learns strategy costs)."""
+        if strategy not in self._ensembles:
+            members = {s.value: static_momentum_strategies[s.value] for s in Strategies if s not in ENSEMBLE_STRATEGIES}
+            required = {Strategies.ANY: 1, Strategies.ALL: len(members)}.get(strategy, self.config.ensemble_k)
+            self._ensembles[strategy] = EnsembleEvaluator(members, required, self.config.ensemble_metrics)
+        return self._ensembles[strategy]
+
+    def ensemble_stats(self) -> dict:
+        return EnsembleEvaluator.merge_stats([e.stats() for e in self._ensembles.values()])
         
     def analyze_momentum(self, 
                          ticker: str,
-                         strategy: Strategies) -> StaticScoutResult:
+                         strategy: StrategyKey,
+                         df: Optional[DataFrame] = None,
+                         features: Optional[FeatureContext] = None) -> StaticScoutResult:
+        """
+        Runs `strategy` on one ticker. `df` is the ticker's stored history when the
+        caller already loaded it (e.g. from a panel); otherwise it is read from storage.
+        `features` carries indicators already computed for the ticker by other strategies.
+        """
+        if features is None and df is not None:
+            features = FeatureContext(df, ticker, self.indicator_cache)
         try:
-            if strategy == Strategies.ANY:
-                passes = []
-                metrics = {}
-                reasons = ""
-                for strat in [s for s in Strategies if s not in (Strategies.ANY, Strategies.ALL)]:
-                    res = self.analyze_momentum(ticker, strat)
-                    metrics.update(res.metrics)
-                    passes.append(res.pass_filter)
-                    reasons += res.reason + "; "
-                return StaticScoutResult(
-                    pass_filter=any(passes),
-                    metrics=metrics,
-                    reason=reasons
-                )
-            elif strategy == Strategies.ALL:
-                passes = []
-                metrics = {}
-                reasons = ""
-                for strat in [s for s in Strategies if s not in (Strategies.ANY, Strategies.ALL)]:
-                    res = self.analyze_momentum(ticker, strat)
-                    metrics.update(res.metrics)
-                    passes.append(res.pass_filter)
-                    reasons += res.reason + "; "
-                return StaticScoutResult(
-                    pass_filter=all(passes),
-                    metrics=metrics,
-                    reason=reasons
-                )
+            if strategy in ENSEMBLE_STRATEGIES:
+                if df is None:
+                    # Loaded once for all strategies of the ensemble
+                    ensemble = self.ensemble(strategy)
+                    df = self.data_manager.get_stock_data(ticker, columns=ensemble.columns, last_n=ensemble.lookback)
+                    features = FeatureContext(df, ticker, self.indicator_cache)
+                if df.empty:
+                    return StaticScoutResult(pass_filter=False, metrics={}, reason="Data fetch error")
+                return self.ensemble(strategy).evaluate(df, features)
             else:
+                static_momentum_strat = static_momentum_strategies.get(strategy)
                 try:
-                    df = self.data_manager.get_stock_data(ticker)
+                    if df is None:
+                        # Only the columns and bars the strategy declares
+                        df = self.data_manager.get_stock_data(ticker,
+                                                              columns=static_momentum_strat.columns,
+                                                              last_n=static_momentum_strat.lookback)
+                        features = FeatureContext(df, ticker, self.indicator_cache)
                 except Exception as e:
                     logging.error(f"Error fetching data for {ticker}: {e}. Skipping.")
                     return StaticScoutResult(
@@ -88,8 +136,7 @@ class Shortlister:
                         metrics={},
                         reason="Data fetch error"
                     )
-                static_momentum_strat = static_momentum_strategies.get(strategy)
-                return static_momentum_strat.analyze(df)
+                return static_momentum_strat.analyze(df, features)
         except Exception as e:
             print(f"Error analyzing momentum for {ticker} with strategy {strategy}: {e}")
             return StaticScoutResult(
@@ -99,16 +146,72 @@ class Shortlister:
             )
     
     
-    def shortlist(self):
-        tickers = list(self.data_manager.storage.load_tickers().keys())
+    def _analyze_chunk(self, tickers: List[str]) -> Tuple[Dict[str, StaticScoutResult], int]:
+        """
+        Runs the configured strategy on `tickers` in this process.
+        Returns the results in `tickers` order and how many tickers used stored features.
+        """
+        # One bulk read for all tickers instead of a file per ticker (per strategy),
+        # or zero-copy views when the memory-mapped cube is enabled
+        frame = self.data_manager.stock_frames(tickers)
+        # Latest precomputed indicator rows, used for tickers whose data has not changed since
+        stored_features = (strategy_feature_store(self.data_manager).load_latest(tickers)
+                           if self.config.data_config.stock_features else {})
+        from_store = 0
 
         results = {}
-        shortlisted_tickers = []
         for ticker in tickers:
-            result = self.analyze_momentum(ticker, self.config.strategy)
-            results[ticker] = result
-            if result.pass_filter:
-                shortlisted_tickers.append(ticker)
+            df = frame(ticker)
+            features = FeatureContext(df, ticker, self.indicator_cache)
+            if ticker in stored_features and not df.empty:
+                fingerprint, latest = stored_features[ticker]
+                if fingerprint == features.fingerprint:
+                    for spec, rows in latest.items():
+                        features.seed(spec, rows)
+                    from_store += 1
+            results[ticker] = self.analyze_momentum(ticker, self.config.strategy, df, features)
+        return results, from_store
+
+    def _analyze_parallel(self, tickers: List[str]) -> Tuple[Dict[str, StaticScoutResult], int, dict, dict]:
+        """
+        Splits `tickers` into chunks analysed on a process pool. Workers read their chunk
+        from storage themselves, so only ticker names and results cross process boundaries.
+        A failing chunk marks its tickers as failed; the other chunks are unaffected.
+        """
+        workers = self.config.max_workers
+        chunk_size = self.config.chunk_size or max(1, math.ceil(len(tickers) / (workers * 4)))
+        chunks = [tickers[i:i + chunk_size] for i in range(0, len(tickers), chunk_size)]
+
+        by_ticker: Dict[str, StaticScoutResult] = {}
+        from_store = 0
+        cache_stats, ensemble_stats = [], []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.config,)) as executor:
+            futures = {executor.submit(_analyze_chunk_in_worker, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    results, chunk_from_store, chunk_cache_stats, chunk_ensemble_stats = future.result()
+                    by_ticker.update(results)
+                    from_store += chunk_from_store
+                    cache_stats.append(chunk_cache_stats)
+                    ensemble_stats.append(chunk_ensemble_stats)
+                except Exception as e:
+                    logging.error(f"Shortlist chunk {chunk[0]}..{chunk[-1]} failed: {e}")
+                    for ticker in chunk:
+                        by_ticker[ticker] = StaticScoutResult(pass_filter=False, metrics={}, reason="Worker error")
+        logging.info(f"Analysed {len(tickers)} tickers in {len(chunks)} chunks on {workers} processes.")
+        # Results in `load_tickers()` order regardless of completion order
+        return ({ticker: by_ticker[ticker] for ticker in tickers}, from_store,
+                IndicatorCache.merge_stats(cache_stats), EnsembleEvaluator.merge_stats(ensemble_stats))
+
+    def shortlist(self):
+        tickers = list(self.data_manager.storage.load_tickers().keys())
+        if self.config.max_workers > 1 and len(tickers) > 1:
+            results, from_store, cache_stats, ensemble_stats = self._analyze_parallel(tickers)
+        else:
+            results, from_store = self._analyze_chunk(tickers)
+            cache_stats, ensemble_stats = self.indicator_cache.stats(), self.ensemble_stats()
+        shortlisted_tickers = [ticker for ticker, result in results.items() if result.pass_filter]
 
         # Save results
         output = StaticShortlistResult(
@@ -122,6 +225,33 @@ class Shortlister:
             tickers_results=results
         )
         self.data_manager.storage.save_shortlist(
-            strategy_name=self.config.strategy.value,
+            strategy_name=strategy_name(self.config.strategy),
             results=output.model_dump(mode="json")
-        )
\ No newline at end of file
+        )
+        logging.info(f"Shortlisted {len(shortlisted_tickers)}/{len(tickers)} tickers. "
+                     f"Features from store: {from_store}/{len(tickers)} | "
+                     f"Stock read cache: {self.data_manager.stock_cache_stats()} | "
+                     f"Indicator cache: {cache_stats}")
+        if self.config.strategy in ENSEMBLE_STRATEGIES:
+            logging.info(f"Ensemble {strategy_name(self.config.strategy)}: {ensemble_stats}")
+        return output
+
+
+# --- Process pool workers ---
+_WORKER_SHORTLISTER: Optional[Shortlister] = None
+
+
+def _init_worker(config: ShortlisterConfig) -> None:
+    """Builds one Shortlister (storage handles, caches) per worker process."""
+    global _WORKER_SHORTLISTER
+    _WORKER_SHORTLISTER = Shortlister(config)
+
+
+def _analyze_chunk_in_worker(tickers: List[str]) -> Tuple[Dict[str, StaticScoutResult], int, dict, dict]:
+    shortlister = _WORKER_SHORTLISTER
+    # Chunks share no tickers, so a fresh cache per chunk loses nothing and keeps the stats per chunk
+    shortlister.indicator_cache = IndicatorCache()
+    for evaluator in shortlister._ensembles.values():
+        evaluator.reset_stats()
+    results, from_store = shortlister._analyze_chunk(tickers)
+    return results, from_store, shortlister.indicator_cache.stats(), shortlister.ensemble_stats()
@@ -0,0 +1,128 @@
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+from nifty_500_momentum.static import static_momentum_strategies
+from nifty_500_momentum.static.strategies.base import MomentumStrategy
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
+from nifty_500_momentum.data.interfaces import align_tz
+from nifty_500_momentum.data.panel import StockPanel
+from nifty_500_momentum.data.manager import DataManager
+
+"""
+SIGNAL HISTORY
+--------------
+What every strategy would have shortlisted on every past date, computed in one vectorized
+pass over the universe panel instead of re-running the shortlister on truncated data.
+
+Each strategy's `signal_history` evaluates its `analyze` logic on (dates x tickers)
+indicator arrays of a shared `PanelIndicatorEngine` (each indicator computed once for all
+strategies). Indicators only look back, so the row of a date uses no later bar; a
+ticker never passes on a date it has no bar.
+
+Persisted per strategy under `DataConfig.stock_signals_dir` as `<strategy>.npz`: the pass
+matrix as a bitset (`numpy.packbits`, 1 bit per cell) and the metric matrices compressed.
+"""
+
+
+class SignalHistory(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    strategy: str
+    dates: pd.DatetimeIndex
+    tickers: List[str]
+    passes: np.ndarray                  # bool (dates x tickers)
+    metrics: Dict[str, np.ndarray] = {}  # metric -> float (dates x tickers)
+
+    # --- Views ---
+    def pass_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.passes, index=self.dates, columns=self.tickers)
+
+    def metric_frame(self, name: str) -> pd.DataFrame:
+        return pd.DataFrame(self.metrics[name], index=self.dates, columns=self.tickers)
+
+    def shortlisted(self, date) -> List[str]:
+        """Tickers passing on `date` (the last panel date on or before it)."""
+        row = self.dates.searchsorted(align_tz(pd.Timestamp(date), self.dates), side="right") - 1
+        if row < 0:
+            return []
+        return [self.tickers[i] for i in np.flatnonzero(self.passes[row])]
+
+    # --- Persistence ---
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        names = list(self.metrics)
+        tmp = path.with_suffix(".npz.tmp")
+        with tmp.open('wb') as f:
+            np.savez_compressed(
+                f,
+                strategy=np.array(self.strategy),
+                dates=self.dates.as_unit("ns").asi8,  # UTC nanoseconds for tz-aware dates
+                tz=np.array(str(self.dates.tz) if self.dates.tz is not None else ""),
+                tickers=np.array(self.tickers, dtype=str),
+                passes=np.packbits(self.passes, axis=None),
+                metric_names=np.array(names, dtype=str),
+                **{f"metric_{i}": self.metrics[name] for i, name in enumerate(names)},
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "SignalHistory":
+        with np.load(Path(path)) as data:
+            tz = str(data["tz"]) or None
+            dates = pd.DatetimeIndex(data["dates"].astype("datetime64[ns]"), name="Date")
+            if tz is not None:
+                dates = dates.tz_localize("UTC").tz_convert(tz)
+            tickers = data["tickers"].tolist()
+            shape = (len(dates), len(tickers))
+            passes = np.unpackbits(data["passes"], count=shape[0] * shape[1]).astype(bool).reshape(shape)
+            metrics = {str(name): data[f"metric_{i}"] for i, name in enumerate(data["metric_names"])}
+            return cls(strategy=str(data["strategy"]), dates=dates, tickers=tickers, passes=passes, metrics=metrics)
+
+
+def compute_signal_history(panel: StockPanel,
+                           strategies: Optional[Dict[str, MomentumStrategy]] = None) -> Dict[str, SignalHistory]:
+    """Signal history of `strategies` (default: all registered ones) over every date of `panel`."""
+    strategies = strategies if strategies is not None else static_momentum_strategies
+    engine = PanelIndicatorEngine(panel)
+    histories = {}
+    for name, strategy in strategies.items():
+        signals = strategy.signal_history(engine)
+        histories[name] = SignalHistory(
+            strategy=name,
+            dates=panel.dates,
+            tickers=list(panel.tickers),
+            passes=signals.passes & engine.present,
+            metrics={metric: np.where(engine.present, values, np.nan) for metric, values in signals.metrics.items()},
+        )
+    return histories
+
+
+def signal_history_path(data_manager: DataManager, strategy: str) -> Path:
+    return data_manager.config.stock_signals_dir / f"{strategy}.npz"
+
+
+def build_signal_history(data_manager: DataManager,
+                         tickers: Optional[List[str]] = None,
+                         strategies: Optional[Dict[str, MomentumStrategy]] = None) -> Dict[str, SignalHistory]:
+    """Computes the signal history of the stored universe (default) from one panel read and persists it."""
+    start = time.perf_counter()
+    tickers = tickers if tickers is not None else list(data_manager.storage.load_tickers().keys())
+    histories = compute_signal_history(data_manager.get_stock_panel(tickers), strategies)
+    for name, history in histories.items():
+        history.save(signal_history_path(data_manager, name))
+    logging.info(f"Signal history of {len(histories)} strategies x {len(tickers)} tickers "
+                 f"built in {time.perf_counter() - start:.2f}s")
+    return histories
+
+
+def load_signal_history(data_manager: DataManager, strategy: str) -> Optional[SignalHistory]:
+    """The persisted signal history of `strategy`, or None if it was never built."""
+    path = signal_history_path(data_manager, strategy)
+    return SignalHistory.load(path) if path.exists() else None
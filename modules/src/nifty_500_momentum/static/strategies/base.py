@@ -1,19 +1,63 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from nifty_500_momentum.static.feature_cache import FeatureContext, FeatureSpec
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
 
 class StaticScoutResult(BaseModel):
     pass_filter: bool
     metrics: Dict[str, float] = {}
     reason: str = ""
 
-class MomentumStrategy(ABC):
-    @abstractmethod
-    def analyze(self, df: pd.DataFrame) -> StaticScoutResult:
-        pass
+class StaticSignals(BaseModel):
+    """A strategy's outcome on every (date, ticker) of a panel, as `analyze` would report it on that date."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    passes: np.ndarray                  # bool (dates x tickers)
+    metrics: Dict[str, np.ndarray] = {}  # metric -> float (dates x tickers), NaN where `analyze` reports none
 
+class MomentumStrategy(ABC):
+    # Indicators `analyze` requests, precomputed by the feature store (static/feature_store.py)
+    required_features: List[FeatureSpec] = []
+    # Trailing bars of each feature `analyze` reads (2 when comparing with the previous bar)
+    feature_rows: int = 1
+    # Price columns `analyze` reads and the trailing bars it needs (None: the full history,
+    # required by recursive indicators such as EMA / Wilder smoothing to give exact values)
+    columns: List[str] = ["Open", "High", "Low", "Close", "Volume"]
+    lookback: Optional[int] = None
+    # Names of the class attributes holding the tunable thresholds (see static/sweep.py)
+    thresholds: Tuple[str, ...] = ()
 
+    def threshold_values(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in self.thresholds}
 
+    def with_thresholds(self, **overrides: float) -> "MomentumStrategy":
+        """A copy of the strategy with some thresholds replaced."""
+        unknown = set(overrides) - set(self.thresholds)
+        if unknown:
+            raise ValueError(f"{type(self).__name__} has no thresholds {sorted(unknown)}; tunable: {list(self.thresholds)}")
+        strategy = copy.copy(self)
+        for name, value in overrides.items():
+            setattr(strategy, name, value)
+        return strategy
 
+    @abstractmethod
+    def analyze(self, df: pd.DataFrame, features: Optional[FeatureContext] = None) -> StaticScoutResult:
+        """
+        `features` is the ticker's shared indicator context (see `static/feature_cache.py`);
+        strategies request indicators through it so other strategies can reuse them.
+        """
+        pass
 
+    @abstractmethod
+    def signal_history(self, engine: PanelIndicatorEngine, metrics: bool = True) -> StaticSignals:
+        """
+        Vectorized `analyze` for every date of the engine's panel: the value at (date, ticker)
+        equals `analyze` on the ticker's history up to that date (indicators only look back).
+        `metrics=False` skips the metric matrices (e.g. when only pass decisions are scored).
+        """
+        pass
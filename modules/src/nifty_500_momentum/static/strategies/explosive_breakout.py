@@ -1,16 +1,32 @@
+import numpy as np
 import pandas as pd
+from typing import Optional
 import nifty_500_momentum.static.indicators as ind
-from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult
+from nifty_500_momentum.static.feature_cache import FeatureContext, FeatureSpec
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
+from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult, StaticSignals
 
 
 class ExplosiveBreakoutStrategy(MomentumStrategy):
     """
     Target: High Volume Spike + High Speed
     """
-    def analyze(self, df: pd.DataFrame) -> StaticScoutResult:
-        rvol = ind.calculate_relative_volume(df)
-        roc = ind.calculate_roc(df)
-        rsi = ind.calculate_rsi(df)
+    required_features = [
+        FeatureSpec(ind.calculate_relative_volume),
+        FeatureSpec(ind.calculate_roc),
+        FeatureSpec(ind.calculate_rsi),
+    ]
+    columns = ["Close", "Volume"]
+    rvol_min = 2.0   # volume vs its 20-day average
+    roc_min = 10.0   # % move over 10 days
+    rsi_max = 85.0   # not too extended
+    thresholds = ("rvol_min", "roc_min", "rsi_max")
+
+    def analyze(self, df: pd.DataFrame, features: Optional[FeatureContext] = None) -> StaticScoutResult:
+        features = features or FeatureContext(df)
+        rvol = features.indicator(ind.calculate_relative_volume)
+        roc = features.indicator(ind.calculate_roc)
+        rsi = features.indicator(ind.calculate_rsi)
         
         try:
             # Check latest values
@@ -28,15 +44,27 @@ class ExplosiveBreakoutStrategy(MomentumStrategy):
         reason = "Momentum weak"
 
         # Logic: Volume > 2x average AND moved > 10% in 10 days
-        if l_rvol > 2.0 and l_roc > 10.0:
-            if l_rsi < 85: # Not too extended
+        if l_rvol > self.rvol_min and l_roc > self.roc_min:
+            if l_rsi < self.rsi_max: # Not too extended
                 pass_filter = True
                 reason = "Explosive Vol & Speed"
             else:
-                reason = "Overbought (RSI > 85)"
+                reason = f"Overbought (RSI > {self.rsi_max:g})"
 
         return StaticScoutResult(
             pass_filter=pass_filter,
             metrics={'RVOL': round(l_rvol, 2), 'ROC': round(l_roc, 2)},
             reason=reason
-        )
\ No newline at end of file
+        )
+
+    def signal_history(self, engine: PanelIndicatorEngine, metrics: bool = True) -> StaticSignals:
+        rvol = engine.relative_volume()
+        roc = engine.roc()
+        with np.errstate(invalid="ignore"):
+            passes = (rvol > self.rvol_min) & (roc > self.roc_min) & (engine.rsi() < self.rsi_max)
+        if not metrics:
+            return StaticSignals(passes=passes)
+        return StaticSignals(
+            passes=passes,
+            metrics={'RVOL': np.round(rvol, 2), 'ROC': np.round(roc, 2)}
+        )
@@ -1,15 +1,29 @@
+import numpy as np
 import pandas as pd
+from typing import Optional
 import nifty_500_momentum.static.indicators as ind
-from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult
+from nifty_500_momentum.static.feature_cache import FeatureContext, FeatureSpec
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
+from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult, StaticSignals
 
 
 class GoldenMomentumStrategy(MomentumStrategy):
     """
     Target: 12M Momentum Leaders
     """
-    def analyze(self, df: pd.DataFrame) -> StaticScoutResult:
-        mom_12m = ind.calculate_momentum_12m_1m(df)
-        sma200 = ind.calculate_sma(df, 200)
+    required_features = [
+        FeatureSpec(ind.calculate_momentum_12m_1m),
+        FeatureSpec(ind.calculate_sma, length=200),
+    ]
+    columns = ["Close"]
+    lookback = 253  # 12M momentum reads the close 252 bars back
+    momentum_min = 0.20  # 12M-1M return
+    thresholds = ("momentum_min",)
+
+    def analyze(self, df: pd.DataFrame, features: Optional[FeatureContext] = None) -> StaticScoutResult:
+        features = features or FeatureContext(df)
+        mom_12m = features.indicator(ind.calculate_momentum_12m_1m)
+        sma200 = features.indicator(ind.calculate_sma, length=200)
         
         try:
             price = df['Close'].iloc[-1]
@@ -32,7 +46,7 @@ class GoldenMomentumStrategy(MomentumStrategy):
         pass_filter = False
         reason = "Low 12M Momentum"
 
-        if l_mom > 0.20 and price > l_sma200:
+        if l_mom > self.momentum_min and price > l_sma200:
             pass_filter = True
             reason = "High 12M Relative Strength"
 
@@ -40,4 +54,15 @@ class GoldenMomentumStrategy(MomentumStrategy):
             pass_filter=pass_filter,
             metrics={'12M_Mom': round(l_mom*100)},
             reason=reason
-        )
\ No newline at end of file
+        )
+
+    def signal_history(self, engine: PanelIndicatorEngine, metrics: bool = True) -> StaticSignals:
+        mom_12m = engine.momentum_12m_1m()
+        with np.errstate(invalid="ignore"):
+            passes = (mom_12m > self.momentum_min) & (engine.panel.field("Close") > engine.sma(length=200))
+        if not metrics:
+            return StaticSignals(passes=passes)
+        return StaticSignals(
+            passes=passes,
+            metrics={'12M_Mom': np.round(mom_12m * 100)}
+        )
@@ -1,15 +1,30 @@
+import numpy as np
 import pandas as pd
+from typing import Optional
 import nifty_500_momentum.static.indicators as ind
-from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult
+from nifty_500_momentum.static.feature_cache import FeatureContext, FeatureSpec
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
+from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult, StaticSignals
 
 
 class ReversalHunterStrategy(MomentumStrategy):
     """
     Target: MACD Crossover from low RSI
     """
-    def analyze(self, df: pd.DataFrame) -> StaticScoutResult:
-        macd_df = ind.calculate_macd(df)
-        rsi = ind.calculate_rsi(df)
+    required_features = [
+        FeatureSpec(ind.calculate_macd),
+        FeatureSpec(ind.calculate_rsi),
+    ]
+    feature_rows = 2  # the crossover compares with the previous histogram bar
+    columns = ["Close"]
+    rsi_low = 40.0   # RSI band of a recovering entry
+    rsi_high = 60.0
+    thresholds = ("rsi_low", "rsi_high")
+
+    def analyze(self, df: pd.DataFrame, features: Optional[FeatureContext] = None) -> StaticScoutResult:
+        features = features or FeatureContext(df)
+        macd_df = features.indicator(ind.calculate_macd)
+        rsi = features.indicator(ind.calculate_rsi)
         
         try:
             # Using clean column names from our new indicators.py
@@ -30,7 +45,7 @@ class ReversalHunterStrategy(MomentumStrategy):
 
         # Logic: Histogram turned positive (Crossover) AND RSI is recovering
         if l_hist > 0 and prev_hist < 0:
-            if 40 < l_rsi < 60: # Sweet spot for entry
+            if self.rsi_low < l_rsi < self.rsi_high: # Sweet spot for entry
                 pass_filter = True
                 reason = "Fresh MACD Crossover"
             else:
@@ -41,4 +56,21 @@ class ReversalHunterStrategy(MomentumStrategy):
             pass_filter=pass_filter,
             metrics={'MACD_Hist': round(l_hist, 2), 'RSI': round(l_rsi, 2)},
             reason=reason
-        )
\ No newline at end of file
+        )
+
+    def signal_history(self, engine: PanelIndicatorEngine, metrics: bool = True) -> StaticSignals:
+        hist = engine.macd()['Histogram']
+        rsi = engine.rsi()
+        with np.errstate(invalid="ignore"):
+            passes = (hist > 0) & (engine.previous(hist) < 0) & (self.rsi_low < rsi) & (rsi < self.rsi_high)
+        if not metrics:
+            return StaticSignals(passes=passes)
+        # `analyze` needs two bars
+        data_error = ~(engine.bar_number() >= 2)
+        return StaticSignals(
+            passes=passes,
+            metrics={
+                'MACD_Hist': np.where(data_error, np.nan, np.round(hist, 2)),
+                'RSI': np.where(data_error, np.nan, np.round(rsi, 2)),
+            }
+        )
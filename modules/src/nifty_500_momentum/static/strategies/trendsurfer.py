@@ -1,16 +1,30 @@
+import numpy as np
 import pandas as pd
+from typing import Optional
 import nifty_500_momentum.static.indicators as ind
-from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult
+from nifty_500_momentum.static.feature_cache import FeatureContext, FeatureSpec
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
+from nifty_500_momentum.static.strategies.base import MomentumStrategy, StaticScoutResult, StaticSignals
 
 
 class TrendSurferStrategy(MomentumStrategy):
     """
     Target: Steady Uptrend (SMA 200) + Strong ADX
     """
-    def analyze(self, df: pd.DataFrame) -> StaticScoutResult:
-        sma50 = ind.calculate_sma(df, 50)
-        sma200 = ind.calculate_sma(df, 200)
-        adx_df = ind.calculate_adx(df)
+    required_features = [
+        FeatureSpec(ind.calculate_sma, length=50),
+        FeatureSpec(ind.calculate_sma, length=200),
+        FeatureSpec(ind.calculate_adx),
+    ]
+    columns = ["High", "Low", "Close"]
+    adx_min = 25.0   # trend strength
+    thresholds = ("adx_min",)
+
+    def analyze(self, df: pd.DataFrame, features: Optional[FeatureContext] = None) -> StaticScoutResult:
+        features = features or FeatureContext(df)
+        sma50 = features.indicator(ind.calculate_sma, length=50)
+        sma200 = features.indicator(ind.calculate_sma, length=200)
+        adx_df = features.indicator(ind.calculate_adx)
         
         try:
             price = df['Close'].iloc[-1]
@@ -27,12 +41,25 @@ class TrendSurferStrategy(MomentumStrategy):
         pass_filter = False
         reason = "Trend Weak"
 
-        if price > l_sma50 > l_sma200 and l_adx > 25:
+        if price > l_sma50 > l_sma200 and l_adx > self.adx_min:
             pass_filter = True
-            reason = "Steady Uptrend (ADX > 25)"
+            reason = f"Steady Uptrend (ADX > {self.adx_min:g})"
 
         return StaticScoutResult(
             pass_filter=pass_filter,
             metrics={'ADX': round(l_adx, 2), 'SMA_Diff': round(l_sma50 - l_sma200, 2)},
             reason=reason
-        )
\ No newline at end of file
+        )
+
+    def signal_history(self, engine: PanelIndicatorEngine, metrics: bool = True) -> StaticSignals:
+        sma50 = engine.sma(length=50)
+        sma200 = engine.sma(length=200)
+        adx = engine.adx()['ADX']
+        with np.errstate(invalid="ignore"):
+            passes = (engine.panel.field("Close") > sma50) & (sma50 > sma200) & (adx > self.adx_min)
+        if not metrics:
+            return StaticSignals(passes=passes)
+        return StaticSignals(
+            passes=passes,
+            metrics={'ADX': np.round(adx, 2), 'SMA_Diff': np.round(sma50 - sma200, 2)}
+        )
@@ -0,0 +1,285 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type
+import pandas as pd
+
+import nifty_500_momentum.static.indicators as ind
+
+"""
+STREAMING INDICATORS
+--------------------
+Stateful counterparts of the recursive indicators in `static/indicators.py` (EMA, RSI,
+MACD, ADX). Each keeps the few numbers the recursion needs, so a new bar is absorbed in
+constant time instead of recomputing the full history:
+
+    rsi = StreamingRSI.from_history(df)          # or StreamingRSI.from_state(saved)
+    value = rsi.update({"Close": 1234.5})
+    saved = rsi.to_state()                        # JSON-serialisable
+
+The smoothing reproduces pandas' `ewm(adjust=False).mean()` step by step (same operations
+in the same order, including NaN handling), so outputs equal the batch functions exactly.
+Rolling-window indicators (SMA, ROC, relative volume) are not streamed.
+"""
+
+
+def _div(a: float, b: float) -> float:
+    """a / b with IEEE semantics (inf / NaN instead of ZeroDivisionError), as pandas divides."""
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a != a or a == 0:
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+
+def _float(value: Optional[float]) -> float:
+    """A saved state number; JSON writers that cannot store NaN leave None."""
+    return math.nan if value is None else float(value)
+
+
+def _nanmax(*values: float) -> float:
+    """Row-wise `max` of pandas: NaN values are skipped, all-NaN gives NaN."""
+    observed = [v for v in values if v == v]
+    return max(observed) if observed else math.nan
+
+
+class EWMState:
+    """One column of `ewm(com/span/alpha, adjust=False).mean()`, advanced a value at a time."""
+    __slots__ = ("alpha", "weighted", "old_wt", "started")
+
+    def __init__(self, com: Optional[float] = None, span: Optional[float] = None, alpha: Optional[float] = None) -> None:
+        if span is not None:
+            com = (span - 1) / 2.0
+        elif alpha is not None:
+            com = 1.0 / alpha - 1.0
+        self.alpha = 1.0 / (1.0 + com)
+        self.weighted = math.nan
+        self.old_wt = 1.0
+        self.started = False
+
+    def update(self, value: float) -> float:
+        if not self.started:
+            self.started = True
+            self.weighted = value
+            return value
+        weighted = self.weighted
+        if weighted == weighted:
+            # Without ignore_na the old weight decays on every bar once a mean exists
+            self.old_wt *= 1.0 - self.alpha
+            if value == value:
+                if weighted != value:
+                    self.weighted = (self.old_wt * weighted + self.alpha * value) / (self.old_wt + self.alpha)
+                self.old_wt = 1.0
+        elif value == value:
+            self.weighted = value
+        return self.weighted
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"alpha": self.alpha, "weighted": self.weighted, "old_wt": self.old_wt, "started": self.started}
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, Any]) -> "EWMState":
+        ewm = cls(alpha=1.0)
+        ewm.alpha, ewm.weighted, ewm.old_wt, ewm.started = (
+            _float(state["alpha"]), _float(state["weighted"]), _float(state["old_wt"]), state["started"]
+        )
+        return ewm
+
+
+# --- Indicators ---
+class StreamingIndicator(ABC):
+    """
+    Base class. Subclasses take the same parameters as their batch function and declare
+    the bar fields they read (`columns`) and, for multi-output indicators, the output names.
+    """
+    kind: str = ""
+    columns: Tuple[str, ...] = ("Close",)
+    outputs: Optional[Tuple[str, ...]] = None  # None: one value per bar (a Series in batch form)
+
+    @abstractmethod
+    def _step(self, *values: float) -> Any:
+        """Absorbs one bar (values of `columns`, as floats) and returns its output."""
+
+    @abstractmethod
+    def params(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def _get_state(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        pass
+
+    def update(self, bar: Mapping[str, float]) -> Any:
+        """Advances by one bar (e.g. {"High": .., "Low": .., "Close": ..}, or a DataFrame row)."""
+        return self._step(*(float(bar[c]) for c in self.columns))
+
+    def run(self, df: pd.DataFrame) -> Any:
+        """Advances over every bar of `df`; returns the outputs shaped like the batch function."""
+        rows = [self._step(*values) for values in df[list(self.columns)].to_numpy(dtype=float).tolist()]
+        if self.outputs is None:
+            return pd.Series(rows, index=df.index, dtype=float)
+        return pd.DataFrame([[row[name] for name in self.outputs] for row in rows],
+                            index=df.index, columns=list(self.outputs), dtype=float)
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame, **params) -> "StreamingIndicator":
+        """An indicator positioned after the last bar of `df`."""
+        indicator = cls(**params)
+        indicator.run(df)
+        return indicator
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "params": self.params(), "state": self._get_state()}
+
+    @classmethod
+    def from_state(cls, saved: Mapping[str, Any]) -> "StreamingIndicator":
+        indicator_cls = STREAMING_KINDS[saved["kind"]] if cls is StreamingIndicator else cls
+        indicator = indicator_cls(**saved["params"])
+        indicator._set_state(saved["state"])
+        return indicator
+
+
+class StreamingEMA(StreamingIndicator):
+    kind = "ema"
+
+    def __init__(self, length: int = 20) -> None:
+        self.length = length
+        self.ema = EWMState(span=length)
+
+    def _step(self, close: float) -> float:
+        return self.ema.update(close)
+
+    def params(self) -> Dict[str, Any]:
+        return {"length": self.length}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"ema": self.ema.to_state()}
+
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.ema = EWMState.from_state(state["ema"])
+
+
+class StreamingRSI(StreamingIndicator):
+    """Wilder RSI: state is the previous close and the smoothed gain / loss."""
+    kind = "rsi"
+
+    def __init__(self, length: int = 14) -> None:
+        self.length = length
+        self.prev_close = math.nan
+        self.avg_gain = EWMState(alpha=1 / length)
+        self.avg_loss = EWMState(alpha=1 / length)
+
+    def _step(self, close: float) -> float:
+        delta = close - self.prev_close
+        self.prev_close = close
+        gain = delta if delta > 0 else 0.0
+        loss = -(delta if delta < 0 else 0.0)  # -0.0 on flat bars, like the batch version
+        rs = _div(self.avg_gain.update(gain), self.avg_loss.update(loss))
+        rsi = 100 - _div(100, 1 + rs)
+        return rsi if rsi == rsi else 0.0
+
+    def params(self) -> Dict[str, Any]:
+        return {"length": self.length}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"prev_close": self.prev_close, "avg_gain": self.avg_gain.to_state(), "avg_loss": self.avg_loss.to_state()}
+
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.prev_close = _float(state["prev_close"])
+        self.avg_gain = EWMState.from_state(state["avg_gain"])
+        self.avg_loss = EWMState.from_state(state["avg_loss"])
+
+
+class StreamingMACD(StreamingIndicator):
+    kind = "macd"
+    outputs = ("MACD", "Signal", "Histogram")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        self.fast, self.slow, self.signal = fast, slow, signal
+        self.ema_fast = EWMState(span=fast)
+        self.ema_slow = EWMState(span=slow)
+        self.ema_signal = EWMState(span=signal)
+
+    def _step(self, close: float) -> Dict[str, float]:
+        macd_line = self.ema_fast.update(close) - self.ema_slow.update(close)
+        signal_line = self.ema_signal.update(macd_line)
+        return {"MACD": macd_line, "Signal": signal_line, "Histogram": macd_line - signal_line}
+
+    def params(self) -> Dict[str, Any]:
+        return {"fast": self.fast, "slow": self.slow, "signal": self.signal}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"fast": self.ema_fast.to_state(), "slow": self.ema_slow.to_state(), "signal": self.ema_signal.to_state()}
+
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.ema_fast = EWMState.from_state(state["fast"])
+        self.ema_slow = EWMState.from_state(state["slow"])
+        self.ema_signal = EWMState.from_state(state["signal"])
+
+
+class StreamingADX(StreamingIndicator):
+    """Wilder ADX: state is the previous bar and the four smoothed series (TR, +DM, -DM, DX)."""
+    kind = "adx"
+    columns = ("High", "Low", "Close")
+    outputs = ("ADX", "+DI", "-DI")
+
+    def __init__(self, length: int = 14) -> None:
+        self.length = length
+        self.prev_high = self.prev_low = self.prev_close = math.nan
+        self.tr = EWMState(alpha=1 / length)
+        self.plus_dm = EWMState(alpha=1 / length)
+        self.minus_dm = EWMState(alpha=1 / length)
+        self.adx = EWMState(alpha=1 / length)
+
+    def _step(self, high: float, low: float, close: float) -> Dict[str, float]:
+        tr = _nanmax(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        up_move = high - self.prev_high
+        down_move = self.prev_low - low
+        self.prev_high, self.prev_low, self.prev_close = high, low, close
+
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+        tr_smooth = self.tr.update(tr)
+        plus_di = 100 * _div(self.plus_dm.update(plus_dm), tr_smooth)
+        minus_di = 100 * _div(self.minus_dm.update(minus_dm), tr_smooth)
+        dx = _div(100 * abs(plus_di - minus_di), plus_di + minus_di)
+        return {"ADX": self.adx.update(dx), "+DI": plus_di, "-DI": minus_di}
+
+    def params(self) -> Dict[str, Any]:
+        return {"length": self.length}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            "prev_high": self.prev_high, "prev_low": self.prev_low, "prev_close": self.prev_close,
+            "tr": self.tr.to_state(), "plus_dm": self.plus_dm.to_state(),
+            "minus_dm": self.minus_dm.to_state(), "adx": self.adx.to_state(),
+        }
+
+    def _set_state(self, state: Mapping[str, Any]) -> None:
+        self.prev_high, self.prev_low, self.prev_close = (
+            _float(state["prev_high"]), _float(state["prev_low"]), _float(state["prev_close"])
+        )
+        self.tr = EWMState.from_state(state["tr"])
+        self.plus_dm = EWMState.from_state(state["plus_dm"])
+        self.minus_dm = EWMState.from_state(state["minus_dm"])
+        self.adx = EWMState.from_state(state["adx"])
+
+
+STREAMING_KINDS: Dict[str, Type[StreamingIndicator]] = {
+    cls.kind: cls for cls in (StreamingEMA, StreamingRSI, StreamingMACD, StreamingADX)
+}
+
+# Batch function -> streaming counterpart (same parameter names)
+STREAMING_COUNTERPARTS: Dict[Callable, Type[StreamingIndicator]] = {
+    ind.calculate_ema: StreamingEMA,
+    ind.calculate_rsi: StreamingRSI,
+    ind.calculate_macd: StreamingMACD,
+    ind.calculate_adx: StreamingADX,
+}
+
+
+def streaming_counterpart(func: Callable) -> Optional[Type[StreamingIndicator]]:
+    return STREAMING_COUNTERPARTS.get(func)
@@ -0,0 +1,161 @@
+import itertools
+import math
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from nifty_500_momentum.static import static_momentum_strategies
+from nifty_500_momentum.static.strategies.base import MomentumStrategy
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
+from nifty_500_momentum.data.panel import StockPanel
+from nifty_500_momentum.data.manager import DataManager
+
+"""
+PARAMETER SWEEP
+---------------
+Grid search over a strategy's thresholds (`MomentumStrategy.thresholds`) scored against
+forward returns over the whole panel history and universe.
+
+Every combination is one `signal_history` call on a shared `PanelIndicatorEngine`, so the
+indicator arrays are computed once and only the threshold comparisons are repeated. A
+signal on (date, ticker) enters at that date's close and is scored by the ticker's return
+over the next `horizon` bars; signals without `horizon` later bars are not scored.
+With `max_workers > 1` the combinations are split into chunks run on a process pool (each
+worker builds the engine once).
+"""
+
+
+class SweepConfig(BaseModel):
+    strategy: str                     # key of `static_momentum_strategies`
+    grid: Dict[str, List[float]]      # threshold -> values to try (unswept thresholds keep their default)
+    horizon: int = 5                  # bars a signal is held
+    min_signals: int = 30             # combinations with fewer scored signals are ranked last
+    rank_by: str = "mean_return"      # a statistic column of the result table
+    max_workers: int = 1              # > 1 evaluates chunks of combinations on a process pool
+    chunk_size: int = 0               # combinations per chunk, 0 = about four chunks per worker
+
+
+STATISTICS = ["signals", "signal_days", "hit_rate", "mean_return", "median_return", "excess_return", "worst_return"]
+
+
+def forward_returns(engine: PanelIndicatorEngine, horizon: int) -> np.ndarray:
+    """Return (in %) from each bar's close to the close `horizon` bars later, in the panel layout."""
+    close = engine.field("Close")
+    future = np.full(close.shape, np.nan)
+    future[:len(close) - horizon] = close[horizon:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return engine.expand((future / close - 1) * 100)
+
+
+class ParameterSweep:
+    def __init__(self, panel: StockPanel, config: SweepConfig, strategy: Optional[MomentumStrategy] = None) -> None:
+        self.panel = panel
+        self.config = config
+        self.strategy = strategy or static_momentum_strategies[config.strategy]
+        unknown = set(config.grid) - set(self.strategy.thresholds)
+        if unknown:
+            raise ValueError(f"{config.strategy} has no thresholds {sorted(unknown)}; tunable: {list(self.strategy.thresholds)}")
+        if config.rank_by not in STATISTICS:
+            raise ValueError(f"rank_by must be one of {STATISTICS}, got {config.rank_by}")
+        self._engine: Optional[PanelIndicatorEngine] = None
+
+    @property
+    def engine(self) -> PanelIndicatorEngine:
+        """Built on first use (in a worker process: once per worker)."""
+        if self._engine is None:
+            self._engine = PanelIndicatorEngine(self.panel)
+            returns = forward_returns(self._engine, self.config.horizon)
+            self._scored = ~np.isnan(returns)
+            self._returns = np.where(self._scored, returns, 0.0)
+            self._baseline = float(returns[self._scored].mean()) if self._scored.any() else float("nan")
+        return self._engine
+
+    def combinations(self) -> List[Dict[str, float]]:
+        names = list(self.config.grid)
+        return [dict(zip(names, values)) for values in itertools.product(*self.config.grid.values())]
+
+    # --- Evaluation ---
+    def evaluate(self, thresholds: Dict[str, float]) -> Dict[str, float]:
+        """Forward-return statistics of the strategy's signals with `thresholds` applied."""
+        engine = self.engine
+        signals = self.strategy.with_thresholds(**thresholds).signal_history(engine, metrics=False).passes & self._scored
+        count = int(np.count_nonzero(signals))
+        stats = {"signals": count, "signal_days": int(np.count_nonzero(signals.any(axis=1)))}
+        if count == 0:
+            return {**stats, **{name: float("nan") for name in STATISTICS[2:]}}
+        returns = self._returns[signals]
+        mean = float(returns.mean())
+        return {
+            **stats,
+            "hit_rate": float(np.count_nonzero(returns > 0) / count),
+            "mean_return": mean,
+            "median_return": float(np.median(returns)),
+            "excess_return": mean - self._baseline,
+            "worst_return": float(returns.min()),
+        }
+
+    def _evaluate_chunk(self, combinations: List[Dict[str, float]]) -> List[Dict[str, float]]:
+        return [{**combination, **self.evaluate(combination)} for combination in combinations]
+
+    def _evaluate_parallel(self, combinations: List[Dict[str, float]]) -> List[Dict[str, float]]:
+        workers = self.config.max_workers
+        chunk_size = self.config.chunk_size or max(1, math.ceil(len(combinations) / (workers * 4)))
+        chunks = [combinations[i:i + chunk_size] for i in range(0, len(combinations), chunk_size)]
+        rows: Dict[int, List[Dict[str, float]]] = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.panel, self.config, self.strategy)) as executor:
+            futures = {executor.submit(_evaluate_chunk_in_worker, chunk): i for i, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                rows[futures[future]] = future.result()
+        logging.info(f"Evaluated {len(combinations)} combinations in {len(chunks)} chunks on {workers} processes.")
+        return [row for i in range(len(chunks)) for row in rows[i]]
+
+    def run(self) -> pd.DataFrame:
+        """
+        One row per combination (thresholds + statistics), best first by `rank_by`;
+        combinations below `min_signals` go last.
+        """
+        start = time.perf_counter()
+        combinations = self.combinations()
+        if self.config.max_workers > 1 and len(combinations) > 1:
+            rows = self._evaluate_parallel(combinations)
+        else:
+            rows = self._evaluate_chunk(combinations)
+
+        table = pd.DataFrame(rows, columns=[*self.config.grid, *STATISTICS])
+        table["enough_signals"] = table["signals"] >= self.config.min_signals
+        table = table.sort_values(["enough_signals", self.config.rank_by], ascending=[False, False],
+                                  kind="stable", na_position="last", ignore_index=True)
+        table.index += 1
+        table.index.name = "rank"
+        logging.info(f"Swept {len(combinations)} {self.config.strategy} combinations over "
+                     f"{len(self.panel.tickers)} tickers x {len(self.panel.dates)} dates "
+                     f"in {time.perf_counter() - start:.2f}s")
+        return table
+
+
+def sweep_strategy(data_manager: DataManager,
+                   config: SweepConfig,
+                   tickers: Optional[List[str]] = None) -> pd.DataFrame:
+    """Runs the sweep on the full stored history of the universe (default) from one panel read."""
+    tickers = tickers if tickers is not None else list(data_manager.storage.load_tickers().keys())
+    panel = data_manager.get_stock_panel(tickers)
+    return ParameterSweep(panel, config).run()
+
+
+# --- Process pool workers ---
+_WORKER_SWEEP: Optional[ParameterSweep] = None
+
+
+def _init_worker(panel: StockPanel, config: SweepConfig, strategy: MomentumStrategy) -> None:
+    """Builds one sweep (and its indicator arrays) per worker process."""
+    global _WORKER_SWEEP
+    _WORKER_SWEEP = ParameterSweep(panel, config, strategy)
+
+
+def _evaluate_chunk_in_worker(combinations: List[Dict[str, float]]) -> List[Dict[str, float]]:
+    return _WORKER_SWEEP._evaluate_chunk(combinations)
@@ -10,6 +10,7 @@ ENV_FILE = Path(".env")
 load_dotenv(dotenv_path=ENV_FILE)
 
 from nifty_500_momentum.analysts.base_workflow import BaseWorkflowConfig
+from nifty_500_momentum.analysts.analyzers import CascadeConfig
 from nifty_500_momentum.analysts.news_filters import SelectNewsFilterStrategy
 from nifty_500_momentum.analysts.state import AnalystState
 from nifty_500_momentum.analysts.workflows.straightforward import StraightforwardWorkflow
@@ -46,6 +47,15 @@ CONFIG: Dict[str, Any] = {
         {"strategy_name": "SourceBlacklistFilter", "config": {"blacklisted_sources": ["The Motley Fool"]}},
     ],
     
+    # LLM analysis concurrency (0 = no budget)
+    "llm_max_workers": 4,
+    "llm_requests_per_minute": 60.0,
+    "llm_tokens_per_minute": 150_000.0,
+    "llm_batch_tokens": 0,  # > 0 packs several tickers per request (e.g. 8000)
+    "llm_batch_size": 10,
+    "llm_offline_batch": False,  # nightly runs: one provider batch job, re-run to resume polling
+    "llm_cascade": None,  # e.g. {"large_model": "gpt-4.1", "conviction_margin": 1.0, "sentiment_margin": 0.15}
+
     # Analysis thresholds
     "conviction_threshold": 5.0,
     "sentiment_threshold": 0.1,
@@ -82,7 +92,16 @@ def main() -> None:
     logging.basicConfig(level=log_level)
 
     data_config = build_data_config(CONFIG)
-    workflow_config = BaseWorkflowConfig(data_config=data_config)
+    workflow_config = BaseWorkflowConfig(
+        data_config=data_config,
+        llm_max_workers=CONFIG["llm_max_workers"],
+        llm_requests_per_minute=CONFIG["llm_requests_per_minute"],
+        llm_tokens_per_minute=CONFIG["llm_tokens_per_minute"],
+        llm_batch_tokens=CONFIG["llm_batch_tokens"],
+        llm_batch_size=CONFIG["llm_batch_size"],
+        llm_offline_batch=CONFIG["llm_offline_batch"],
+        llm_cascade=CascadeConfig(**CONFIG["llm_cascade"]) if CONFIG["llm_cascade"] else None,
+    )
 
     strategy = CONFIG["shortlisting_strategy"]
     news_query_prefix = CONFIG["news_query_prefix"]
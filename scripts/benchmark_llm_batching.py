@@ -0,0 +1,35 @@
+import logging
+
+from fake_llm import FakeLLM, make_inputs  # first: sets the dummy OPENAI_API_KEY
+from nifty_500_momentum.analysts.analyzers import AnalysisRunner, BatchedComprehensiveAnalyzer, ComprehensiveAnalyzer
+
+"""
+Compares one-ticker-per-request analysis with batched requests on a fake LLM that
+answers from the prompt text alone (see fake_llm.py): number of calls, input tokens
+(prompt + schema), and that both produce the same analyses in ticker order. Every
+DROP_EVERY-th batched response leaves out its last ticker, to exercise the per-ticker fallback.
+"""
+
+# --- Options ---
+NUM_TICKERS = 60
+HEADLINES_PER_TICKER = 6
+BATCH_TOKEN_BUDGETS = [4_000, 8_000, 16_000]
+DROP_EVERY = 4
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    inputs = make_inputs(NUM_TICKERS, HEADLINES_PER_TICKER)
+    baseline_llm = FakeLLM(drop_every=DROP_EVERY)
+    baseline, _ = AnalysisRunner(ComprehensiveAnalyzer(baseline_llm)).run(inputs)
+    baseline_results = [(ticker, r.model_dump_json()) for ticker, r in baseline.items()]
+    print(f"{NUM_TICKERS} tickers x {HEADLINES_PER_TICKER} headlines")
+    print(f"per ticker   : {baseline_llm.calls:>3} calls | {baseline_llm.input_tokens:>7} input tokens")
+    for budget in BATCH_TOKEN_BUDGETS:
+        llm = FakeLLM(drop_every=DROP_EVERY)
+        analyzer = BatchedComprehensiveAnalyzer(llm, max_batch_tokens=budget, max_batch_size=NUM_TICKERS)
+        results, report = AnalysisRunner(analyzer).run(inputs)
+        ordered = [(ticker, r.model_dump_json()) for ticker, r in results.items()]
+        print(f"budget {budget:>6}: {llm.calls:>3} calls ({report.requests} metered) | {llm.input_tokens:>7} input tokens | "
+              f"{baseline_llm.calls / llm.calls:.1f}x fewer calls, {baseline_llm.input_tokens / llm.input_tokens:.1f}x fewer tokens | "
+              f"{'identical' if ordered == baseline_results else 'RESULTS DIFFER'}")
@@ -0,0 +1,58 @@
+import time
+import logging
+
+from fake_llm import FakeLLM, make_inputs  # first: sets the dummy OPENAI_API_KEY
+from nifty_500_momentum.analysts.analyzers import AnalysisRunner, CascadeAnalyzer, CascadeConfig, ComprehensiveAnalyzer
+from nifty_500_momentum.analysts.final_shortlist.comprehensive import ComprehensiveFinalShortlist
+
+"""
+Compares a small -> large model cascade with running every ticker on the large model,
+on fake LLMs (see fake_llm.py): the large model returns a "true" score per prompt, the
+small one the same score plus deterministic noise (and fails validation on a few prompts).
+Reports calls and time per tier, escalations by reason (including the second pass over
+the top-N cut-off), and how much of the large-model final shortlist the cascade and the
+small model alone recover.
+"""
+
+# --- Options ---
+CONVICTION_THRESHOLD = 5.0
+SENTIMENT_THRESHOLD = 0.1
+TOP_N = 10
+SMALL_LATENCY, LARGE_LATENCY = 0.01, 0.05
+SMALL_NOISE = 1               # conviction points the small model may be off by
+SMALL_FAILURE_RATE = 0.05
+CONFIG = CascadeConfig(large_model="fake-large", conviction_margin=1.0, sentiment_margin=0.15)
+
+
+def final_shortlist(results) -> list:
+    return list(ComprehensiveFinalShortlist().shortlist(results, CONVICTION_THRESHOLD, SENTIMENT_THRESHOLD, TOP_N).values())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.ERROR)  # the small model's simulated failures
+    inputs = make_inputs()
+    large = FakeLLM("fake-large", latency=LARGE_LATENCY)
+
+    start = time.perf_counter()
+    reference, _ = AnalysisRunner(ComprehensiveAnalyzer(large)).run(inputs)
+    large_seconds = time.perf_counter() - start
+
+    small = FakeLLM("fake-small", latency=SMALL_LATENCY, noise=SMALL_NOISE, failure_rate=SMALL_FAILURE_RATE)
+    cascade = CascadeAnalyzer(CONFIG, CONVICTION_THRESHOLD, SENTIMENT_THRESHOLD, top_n=TOP_N,
+                              llm_client=small, large_llm=large)
+    start = time.perf_counter()
+    results, report = cascade.run(AnalysisRunner(cascade), inputs)
+    cascade_seconds = time.perf_counter() - start
+
+    small_only, _ = AnalysisRunner(ComprehensiveAnalyzer(small)).run(inputs)
+    expected = final_shortlist(reference)
+    print(f"{len(inputs)} tickers | large model only: {len(inputs)} large calls, {large_seconds:.2f}s")
+    for name, stats in cascade.tiers.items():
+        print(f"  cascade {name:<5}: {stats.summary()}")
+    print(f"  escalations by reason: {cascade.escalations}")
+    print(f"cascade: {cascade_seconds:.2f}s ({large_seconds / cascade_seconds:.1f}x faster), "
+          f"{report.succeeded}/{report.total} analysed, {report.requests} requests metered")
+    for name, shortlist in (("cascade", final_shortlist(results)), ("small only", final_shortlist(small_only))):
+        overlap = len(set(shortlist) & set(expected))
+        print(f"  {name:<10} final shortlist: {overlap}/{len(expected)} of the large-model shortlist "
+              f"({'same ranking' if shortlist == expected else 'differs'})")
@@ -0,0 +1,38 @@
+import logging
+
+from fake_llm import FakeLLM, make_inputs  # first: sets the dummy OPENAI_API_KEY
+from nifty_500_momentum.analysts.analyzers import AnalysisRunner, ComprehensiveAnalyzer
+
+"""
+Benchmarks the concurrent analysis stage against worker count with a fake LLM (see fake_llm.py)
+that sleeps a fixed latency per call, checks that every run returns the same analyses in
+ticker order, and that the request budget is respected.
+"""
+
+# --- Options ---
+NUM_TICKERS = 40
+LATENCY_SECONDS = 0.25
+WORKER_COUNTS = [1, 2, 4, 8]
+REQUESTS_PER_MINUTE = 1200.0   # 20/s: binding for 8 workers (32/s unthrottled)
+TOKENS_PER_MINUTE = 0.0
+
+
+if __name__ == "__main__":
+    logging.disable(logging.ERROR)
+    inputs = make_inputs(NUM_TICKERS)
+    print(f"{NUM_TICKERS} tickers, {LATENCY_SECONDS * 1000:.0f}ms per call, "
+          f"budget {REQUESTS_PER_MINUTE:g} rpm / {TOKENS_PER_MINUTE:g} tpm")
+    baseline_seconds, baseline_results = None, None
+    for workers in WORKER_COUNTS:
+        runner = AnalysisRunner(ComprehensiveAnalyzer(FakeLLM(latency=LATENCY_SECONDS)), max_workers=workers,
+                                requests_per_minute=REQUESTS_PER_MINUTE, tokens_per_minute=TOKENS_PER_MINUTE)
+        results, report = runner.run(inputs)
+        ordered = [(ticker, r.model_dump_json()) for ticker, r in results.items()]
+        if baseline_seconds is None:
+            baseline_seconds, baseline_results = report.elapsed_seconds, ordered
+        # The bucket starts full (one request per worker), then refills at the budget rate
+        floor = max(0.0, (NUM_TICKERS - workers) / (REQUESTS_PER_MINUTE / 60)) if REQUESTS_PER_MINUTE else 0.0
+        print(f"{workers:>2} workers: {report.elapsed_seconds:.2f}s | speedup {baseline_seconds / report.elapsed_seconds:.2f}x | "
+              f"{report.succeeded}/{report.total} ok | waited {report.waited_seconds:.1f}s | "
+              f"{'within' if report.elapsed_seconds >= floor else 'OVER'} budget | "
+              f"{'identical' if ordered == baseline_results else 'RESULTS DIFFER'}")
@@ -0,0 +1,96 @@
+import gzip
+import hashlib
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from nifty_500_momentum.data.config import DataConfig
+from nifty_500_momentum.data.manager import DataManager
+from nifty_500_momentum.data.sources import GoogleNewsRSSSource
+from nifty_500_momentum.data.http_client import HttpClient
+
+"""
+Load-tests concurrent news collection against a local stub RSS server.
+No network access is needed: the stub answers every search with a small feed after a delay
+and records the peak number of requests it served at once. It gzips its responses and
+honours If-None-Match, so the second pass over the same queries is served with 304s.
+"""
+
+# --- Options ---
+NUM_QUERIES = 100
+LATENCY_SECONDS = 0.2          # Simulated server latency per request
+WORKER_COUNTS = [1, 4, 8, 16]
+PER_HOST = 8                   # Requests in flight per host
+RATE_LIMIT = 100.0             # Requests/second shared by all workers
+ARTICLES_PER_FEED = 20
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>stub</title>{items}</channel></rss>"""
+ITEM = """<item><title>Article {i}</title><link>http://stub.local/{i}</link>
+<pubDate>Mon, 12 Oct 2026 10:00:00 GMT</pubDate><source url="http://stub.local">Stub</source></item>"""
+
+
+class StubRSSHandler(BaseHTTPRequestHandler):
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        time.sleep(LATENCY_SECONDS)
+        body = FEED.format(items="".join(ITEM.format(i=i) for i in range(ARTICLES_PER_FEED))).encode()
+        etag = f'"{hashlib.md5(self.path.encode() + body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+        else:
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("ETag", etag)
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        with cls.lock:
+            cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def run(base_url: str, workers: int, queries: dict, client: HttpClient) -> str:
+    StubRSSHandler.peak = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        config = DataConfig(data_dir=Path(tmp), news_max_workers=workers, news_per_host=PER_HOST,
+                            news_rate_limit=RATE_LIMIT, news_rate_burst=workers)
+        config.setup_directories()
+        dm = DataManager(config=config, news_api=GoogleNewsRSSSource(base_url=base_url, timeout=10.0, client=client))
+        report = dm.collect_news(queries, force_refresh=True)
+        return f"{report.summary()} | peak in flight {StubRSSHandler.peak}"
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRSSHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/rss/search"
+    queries = {f"FAKE{i}": f"Fake Company {i} News" for i in range(NUM_QUERIES)}
+    print(f"Sequential baseline (no sleep): ~{NUM_QUERIES * LATENCY_SECONDS:.1f}s")
+
+    for workers in WORKER_COUNTS:
+        client = HttpClient()
+        print(f"workers={workers:>3} per_host={PER_HOST} | {run(base_url, workers, queries, client)}")
+        print(f"  revalidation pass    | {run(base_url, workers, queries, client)}")
+        for host, stats in client.stats().items():
+            print(f"  {host}: {stats.requests} requests, {stats.not_modified} not modified, "
+                  f"{stats.mean_latency_ms:.0f} ms avg, {stats.bytes_received / 1024:.1f} KB on the wire, "
+                  f"{stats.bytes_decoded / 1024:.1f} KB decoded")
+    server.shutdown()
@@ -0,0 +1,93 @@
+import time
+import numpy as np
+import pandas as pd
+
+import nifty_500_momentum.static.indicators as ind
+from nifty_500_momentum.data.panel import StockPanel
+from nifty_500_momentum.static.panel_indicators import PanelIndicatorEngine
+
+"""
+Compares the universe-wide indicator engine with the per-ticker functions in
+`static/indicators.py` on synthetic data: run time and the largest relative difference
+of every indicator. Some tickers are listed late, suspended for a few days or have
+a missing close, so the gap handling of the panel engine is exercised too.
+"""
+
+# --- Options ---
+NUM_TICKERS = 500
+NUM_BARS = 500
+TOLERANCE = 1e-9
+
+
+def make_frames() -> dict:
+    frames = {}
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=NUM_BARS, name="Date")
+    for i in range(NUM_TICKERS):
+        rng = np.random.default_rng(i)
+        index = dates[-200:] if i % 10 == 0 else dates       # recent listings
+        n = len(index)
+        close = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, n)))
+        df = pd.DataFrame({
+            "Open": close * (1 + rng.normal(0, 0.005, n)),
+            "High": close * 1.02,
+            "Low": close * 0.98,
+            "Close": close,
+            "Volume": rng.integers(10_000, 1_000_000, n).astype(float),
+        }, index=index)
+        if i % 7 == 0:
+            df = df.drop(df.index[100:110])                  # suspension
+        if i % 13 == 0:
+            df.iloc[50, df.columns.get_loc("Close")] = np.nan  # bad bar
+        frames[f"FAKE{i}"] = df
+    return frames
+
+
+def per_ticker(df: pd.DataFrame) -> dict:
+    macd, adx = ind.calculate_macd(df), ind.calculate_adx(df)
+    return {
+        "RSI": ind.calculate_rsi(df), "MACD": macd["MACD"], "MACD Signal": macd["Signal"],
+        "SMA 50": ind.calculate_sma(df, 50), "SMA 200": ind.calculate_sma(df, 200),
+        "EMA 20": ind.calculate_ema(df), "ROC 10": ind.calculate_roc(df),
+        "ADX": adx["ADX"], "+DI": adx["+DI"], "RVOL": ind.calculate_relative_volume(df),
+        "12M-1M": ind.calculate_momentum_12m_1m(df),
+    }
+
+
+def panel(engine: PanelIndicatorEngine) -> dict:
+    macd, adx = engine.macd(), engine.adx()
+    return {
+        "RSI": engine.rsi(), "MACD": macd["MACD"], "MACD Signal": macd["Signal"],
+        "SMA 50": engine.sma(50), "SMA 200": engine.sma(200),
+        "EMA 20": engine.ema(), "ROC 10": engine.roc(),
+        "ADX": adx["ADX"], "+DI": adx["+DI"], "RVOL": engine.relative_volume(),
+        "12M-1M": engine.momentum_12m_1m(),
+    }
+
+
+if __name__ == "__main__":
+    stock_panel = StockPanel.from_frames(make_frames())
+    frames = {ticker: stock_panel.frame(ticker) for ticker in stock_panel.tickers}
+
+    start = time.perf_counter()
+    reference = {ticker: per_ticker(df) for ticker, df in frames.items()}
+    per_ticker_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = panel(PanelIndicatorEngine(stock_panel))
+    panel_seconds = time.perf_counter() - start
+
+    print(f"Per-ticker: {per_ticker_seconds:.2f}s | Panel: {panel_seconds:.3f}s "
+          f"({per_ticker_seconds / panel_seconds:.0f}x) for {NUM_TICKERS} tickers x {NUM_BARS} bars")
+    for name, values in results.items():
+        worst = 0.0
+        for col, ticker in enumerate(stock_panel.tickers):
+            expected = reference[ticker][name].to_numpy(dtype=float)
+            actual = values[stock_panel.dates.get_indexer(frames[ticker].index), col]
+            if not np.array_equal(np.isnan(expected), np.isnan(actual)):
+                worst = np.inf
+                break
+            valid = ~np.isnan(expected)
+            if valid.any():
+                diff = np.abs(actual[valid] - expected[valid]) / np.maximum(1.0, np.abs(expected[valid]))
+                worst = max(worst, float(diff.max()))
+        print(f"{name:<12} max rel diff {worst:.2e} {'OK' if worst <= TOLERANCE else 'MISMATCH'}")
@@ -0,0 +1,69 @@
+import os
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from nifty_500_momentum.data.config import DataConfig
+from nifty_500_momentum.data.manager import DataManager
+from nifty_500_momentum.static.shortlister import Shortlister, ShortlisterConfig, Strategies
+
+"""
+Benchmarks the process-pool Shortlister against worker count on a synthetic universe
+stored in a temporary directory, and checks that every run produces the same results
+(in the same ticker order) as the serial run.
+"""
+
+# --- Options ---
+NUM_TICKERS = 500
+NUM_BARS = 500
+STRATEGY = Strategies.ANY
+WORKER_COUNTS = [1, 2, 4, 8, 16]
+CHUNK_SIZE = 0                 # 0 = about four chunks per worker
+
+
+def make_frame(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=NUM_BARS, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, NUM_BARS)))
+    return pd.DataFrame({
+        "Open": close * (1 + rng.normal(0, 0.005, NUM_BARS)),
+        "High": close * 1.02,
+        "Low": close * 0.98,
+        "Close": close,
+        "Volume": rng.integers(10_000, 1_000_000, NUM_BARS),
+    }, index=index)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        config = DataConfig(data_dir=Path(tmp))
+        config.setup_directories()
+        storage = DataManager(config=config).storage
+        tickers = {f"FAKE{i}": f"Fake Company {i}" for i in range(NUM_TICKERS)}
+        storage.save_tickers(tickers)
+        for i, ticker in enumerate(tickers):
+            storage.save_stock(ticker, make_frame(i))
+        storage.flush()
+
+        print(f"{NUM_TICKERS} tickers x {NUM_BARS} bars, strategy {STRATEGY.value}, {os.cpu_count()} CPUs")
+        baseline_seconds, baseline_results = None, None
+        for workers in WORKER_COUNTS:
+            shortlister = Shortlister(ShortlisterConfig(
+                shortlist_id=f"benchmark_{workers}", strategy=STRATEGY, data_config=config,
+                max_workers=workers, chunk_size=CHUNK_SIZE,
+            ))
+            start = time.perf_counter()
+            output = shortlister.shortlist()
+            seconds = time.perf_counter() - start
+
+            results = json.dumps(output.model_dump(mode="json")["tickers_results"])
+            if baseline_seconds is None:
+                baseline_seconds, baseline_results = seconds, results
+            print(f"{workers:>2} workers: {seconds:.2f}s | speedup {baseline_seconds / seconds:.2f}x | "
+                  f"{output.num_shortlisted} shortlisted | "
+                  f"{'identical' if results == baseline_results else 'RESULTS DIFFER'}")
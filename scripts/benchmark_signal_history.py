@@ -0,0 +1,85 @@
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from nifty_500_momentum.data.panel import StockPanel
+from nifty_500_momentum.static import static_momentum_strategies
+from nifty_500_momentum.static.signal_history import SignalHistory, compute_signal_history
+
+"""
+Builds the signal history of every strategy on a synthetic universe and checks it against
+the shortlister's per-ticker logic: for sampled dates each ticker's history is truncated
+at that date and `analyze` must give the same pass decision and metrics (so the matrices
+use no later bar). Also reports the build time and the persisted size.
+"""
+
+# --- Options ---
+NUM_TICKERS = 500
+NUM_BARS = 500
+SAMPLED_DATES = 8
+SAMPLED_TICKERS = 60
+
+
+def make_frames() -> dict:
+    frames = {}
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=NUM_BARS, name="Date")
+    for i in range(NUM_TICKERS):
+        rng = np.random.default_rng(i)
+        index = dates[-200:] if i % 10 == 0 else dates       # recent listings
+        n = len(index)
+        close = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.03, n)))
+        df = pd.DataFrame({
+            "Open": close * (1 + rng.normal(0, 0.005, n)),
+            "High": close * (1 + rng.uniform(0, 0.03, n)),
+            "Low": close * (1 - rng.uniform(0, 0.03, n)),
+            "Close": close,
+            "Volume": rng.integers(10_000, 1_000_000, n).astype(float) * rng.choice([1, 4], n, p=[0.9, 0.1]),
+        }, index=index)
+        if i % 7 == 0:
+            df = df.drop(df.index[100:110])                  # suspension
+        frames[f"FAKE{i}"] = df
+    return frames
+
+
+def same_metric(expected, actual: float) -> bool:
+    return (expected is None and np.isnan(actual)) or (expected is not None and
+                                                      (expected == actual or (np.isnan(expected) and np.isnan(actual))))
+
+
+if __name__ == "__main__":
+    panel = StockPanel.from_frames(make_frames())
+    start = time.perf_counter()
+    histories = compute_signal_history(panel)
+    build_seconds = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    rows = rng.choice(len(panel.dates), SAMPLED_DATES, replace=False)
+    cols = rng.choice(len(panel.tickers), SAMPLED_TICKERS, replace=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, history in histories.items():
+            path = Path(tmp) / f"{name}.npz"
+            history.save(path)
+            loaded = SignalHistory.load(path)
+            round_trip = np.array_equal(loaded.passes, history.passes) and loaded.dates.equals(history.dates) and all(
+                np.array_equal(loaded.metrics[m], history.metrics[m], equal_nan=True) for m in history.metrics)
+
+            strategy = static_momentum_strategies[name]
+            mismatches = checked = 0
+            for col in cols:
+                ticker = panel.tickers[col]
+                full = panel.frame(ticker)
+                for row in rows:
+                    date = panel.dates[row]
+                    if date not in full.index:
+                        continue
+                    result = strategy.analyze(full.loc[:date])
+                    checked += 1
+                    if result.pass_filter != bool(history.passes[row, col]) or not all(
+                            same_metric(result.metrics.get(m), history.metrics[m][row, col]) for m in history.metrics):
+                        mismatches += 1
+            print(f"{name:<19} {int(history.passes.sum()):>6} passes | {path.stat().st_size / 1024:.0f} KiB on disk | "
+                  f"round trip {'OK' if round_trip else 'FAILED'} | "
+                  f"{checked} truncated re-runs: {'OK' if mismatches == 0 else f'{mismatches} MISMATCHES'}")
+    print(f"{len(histories)} strategies x {NUM_TICKERS} tickers x {len(panel.dates)} dates in {build_seconds:.2f}s")
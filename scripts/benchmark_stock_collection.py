@@ -0,0 +1,69 @@
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from nifty_500_momentum.data.config import DataConfig
+from nifty_500_momentum.data.interfaces import StockDataSource
+from nifty_500_momentum.data.manager import DataManager
+
+"""
+Benchmarks the concurrent stock collection engine against a local fake source.
+No network access is needed: the fake source sleeps to simulate provider latency.
+"""
+
+# --- Options ---
+NUM_TICKERS = 100
+LATENCY_SECONDS = 0.2          # Simulated round-trip per request
+WORKER_COUNTS = [2, 4, 8, 16]
+RATE_LIMIT = 50.0              # Requests/second shared by all workers
+NUM_BARS = 500
+BATCH_SIZE = 20                # Tickers per request for the batched fake source
+
+
+class FakeStockSource(StockDataSource):
+    """Returns random OHLCV frames after a fixed delay per request."""
+    def __init__(self, latency: float, num_bars: int, batched: bool = False) -> None:
+        self.latency = latency
+        self.num_bars = num_bars
+        self.supports_batch = batched
+
+    def fetch_history(self, ticker: str, period: str = "2y") -> pd.DataFrame:
+        time.sleep(self.latency)
+        return self._frame(ticker)
+
+    def fetch_history_many(self, tickers, period: str = "2y"):
+        time.sleep(self.latency)
+        return {ticker: self._frame(ticker) for ticker in tickers}
+
+    def _frame(self, ticker: str) -> pd.DataFrame:
+        rng = np.random.default_rng(abs(hash(ticker)) % (2**32))
+        index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=self.num_bars, name="Date")
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, self.num_bars)))
+        return pd.DataFrame({
+            "Open": close * (1 + rng.normal(0, 0.005, self.num_bars)),
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(10_000, 1_000_000, self.num_bars),
+        }, index=index)
+
+
+def run(source: StockDataSource, workers: int, tickers: list) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        config = DataConfig(data_dir=Path(tmp), stock_max_workers=workers, stock_batch_size=BATCH_SIZE,
+                            stock_rate_limit=RATE_LIMIT, stock_rate_burst=workers)
+        config.setup_directories()
+        dm = DataManager(config=config, stock_api=source)
+        return dm.collect_stock_universe(tickers, force_refresh=True).summary()
+
+
+if __name__ == "__main__":
+    tickers = [f"FAKE{i}" for i in range(NUM_TICKERS)]
+    print(f"Sequential baseline (no sleep): ~{NUM_TICKERS * LATENCY_SECONDS:.1f}s")
+
+    for batched in (False, True):
+        source = FakeStockSource(LATENCY_SECONDS, NUM_BARS, batched=batched)
+        for workers in WORKER_COUNTS:
+            print(f"batched={batched!s:<5} workers={workers:>3} | {run(source, workers, tickers)}")
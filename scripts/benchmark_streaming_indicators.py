@@ -0,0 +1,111 @@
+import json
+import time
+import numpy as np
+import pandas as pd
+
+import nifty_500_momentum.static.indicators as ind
+from nifty_500_momentum.static.streaming import (
+    StreamingIndicator, StreamingEMA, StreamingRSI, StreamingMACD, StreamingADX
+)
+from nifty_500_momentum.static.feature_store import FeatureStoreEntry
+
+"""
+Checks the streaming indicators against the batch functions in `static/indicators.py`
+and times a daily refresh. Each ticker's history is split: the first part initialises the
+indicator, its state goes through a JSON round trip, and the remaining bars are streamed
+one at a time. Streamed values must equal the batch values exactly (bit for bit).
+The edge cases (a 1-bar history, a NaN last close) save their state the way the feature
+store does, through `FeatureStoreEntry`, since that is where NaN states can get lost.
+"""
+
+# --- Options ---
+NUM_TICKERS = 500
+NUM_BARS = 500
+STREAMED_BARS = 20
+
+INDICATORS = [
+    ("EMA 20", ind.calculate_ema, StreamingEMA),
+    ("RSI 14", ind.calculate_rsi, StreamingRSI),
+    ("MACD", ind.calculate_macd, StreamingMACD),
+    ("ADX 14", ind.calculate_adx, StreamingADX),
+]
+
+
+def make_frame(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=NUM_BARS, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, NUM_BARS)))
+    df = pd.DataFrame({
+        "Open": close * (1 + rng.normal(0, 0.005, NUM_BARS)),
+        "High": close * (1 + rng.uniform(0, 0.03, NUM_BARS)),
+        "Low": close * (1 - rng.uniform(0, 0.03, NUM_BARS)),
+        "Close": close,
+        "Volume": rng.integers(10_000, 1_000_000, NUM_BARS).astype(float),
+    }, index=index)
+    if seed % 13 == 0:
+        df.iloc[50, df.columns.get_loc("Close")] = np.nan    # bad bar
+    if seed % 7 == 0:
+        df.iloc[200:205, df.columns.get_loc("Close")] = df["Close"].iloc[199]  # flat (suspended) bars
+    return df
+
+
+def manifest_round_trip(indicator: StreamingIndicator) -> StreamingIndicator:
+    entry = FeatureStoreEntry(rows=1, last_date=pd.Timestamp.today(), fingerprint="", states={"x": indicator.to_state()})
+    saved = json.loads(json.dumps(entry.model_dump(mode="json")))
+    return StreamingIndicator.from_state(FeatureStoreEntry(**saved).states["x"])
+
+
+def check_edge_cases() -> int:
+    """Mismatches over the indicators for a 1-bar history and a NaN last close."""
+    mismatches = 0
+    df = make_frame(1).iloc[:40]
+    nan_close = df.copy()
+    nan_close.iloc[19, nan_close.columns.get_loc("Close")] = np.nan
+    for _, batch, streaming in INDICATORS:
+        for frame, split in ((df, 1), (nan_close, 20)):
+            indicator = manifest_round_trip(streaming.from_history(frame.iloc[:split]))
+            streamed = [indicator.update(bar) for bar in frame[list(streaming.columns)].iloc[split:].to_dict("records")]
+            expected = batch(frame)
+            if streaming.outputs is not None:
+                streamed = [[row[output] for output in streaming.outputs] for row in streamed]
+                expected = expected[list(streaming.outputs)]
+            if not np.array_equal(np.asarray(streamed, dtype=float),
+                                  expected.iloc[split:].to_numpy(dtype=float), equal_nan=True):
+                mismatches += 1
+    return mismatches
+
+
+if __name__ == "__main__":
+    frames = [make_frame(seed) for seed in range(NUM_TICKERS)]
+    split = NUM_BARS - STREAMED_BARS
+
+    for name, batch, streaming in INDICATORS:
+        mismatches = 0
+        batch_seconds = stream_seconds = 0.0
+        for df in frames:
+            start = time.perf_counter()
+            expected = batch(df)
+            batch_seconds += time.perf_counter() - start
+
+            saved = json.dumps(streaming.from_history(df.iloc[:split]).to_state())
+            indicator = StreamingIndicator.from_state(json.loads(saved))
+            bars = df[list(streaming.columns)].iloc[split:].to_dict("records")
+            start = time.perf_counter()
+            streamed = [indicator.update(bar) for bar in bars]
+            stream_seconds += time.perf_counter() - start
+
+            if streaming.outputs is not None:
+                streamed = [[row[output] for output in streaming.outputs] for row in streamed]
+                expected = expected[list(streaming.outputs)]
+            if not np.array_equal(np.asarray(streamed, dtype=float),
+                                  expected.iloc[split:].to_numpy(dtype=float), equal_nan=True):
+                mismatches += 1
+
+        per_update_us = stream_seconds / (NUM_TICKERS * STREAMED_BARS) * 1e6
+        print(f"{name:<7} batch {batch_seconds / NUM_TICKERS * 1e3:.2f} ms/ticker (full history) | "
+              f"streaming {per_update_us:.1f} us/ticker per bar | "
+              f"{'OK' if mismatches == 0 else f'{mismatches} MISMATCHES'}")
+
+    edge_mismatches = check_edge_cases()
+    print(f"Feature store round trip (1-bar history, NaN last close): "
+          f"{'OK' if edge_mismatches == 0 else f'{edge_mismatches} MISMATCHES'}")
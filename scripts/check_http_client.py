@@ -0,0 +1,121 @@
+import gzip
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from nifty_500_momentum.data.http_client import HttpClient
+
+"""
+Checks the conditional-GET cache of `HttpClient` against a local stub server (no network).
+The stub serves a gzipped body with an ETag on /etag and a plain body with only a
+Last-Modified on /last-modified, answers matching validators with 304, and records the
+headers of every request. Asserts the 200 -> 304 round trip from memory and from disk, gzip
+decoding, the per-host counters, and that an entry older than `max_age_days` is fetched
+again instead of revalidated. Exits non-zero on the first failed check.
+"""
+
+# --- Options ---
+BODY = b"<rss>" + b"<item>stub article</item>" * 200 + b"</rss>"
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 12 Oct 2026 10:00:00 GMT"
+MAX_AGE_DAYS = 1.0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests = []   # (path, headers) of every request served
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with type(self).lock:
+            type(self).requests.append((self.path, dict(self.headers)))
+        if self.path == "/etag":
+            not_modified = self.headers.get("If-None-Match") == ETAG
+            validator = ("ETag", ETAG)
+        else:
+            not_modified = self.headers.get("If-Modified-Since") == LAST_MODIFIED
+            validator = ("Last-Modified", LAST_MODIFIED)
+        if not_modified:
+            self.send_response(304)
+            self.send_header(*validator)
+            self.end_headers()
+            return
+        body = BODY
+        gzipped = self.path == "/etag" and "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = gzip.compress(body)
+        self.send_response(200)
+        self.send_header(*validator)
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def last_request(path: str) -> dict:
+    return [headers for served, headers in StubHandler.requests if served == path][-1]
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"127.0.0.1:{server.server_address[1]}"
+    url, lm_url = f"http://{host}/etag", f"http://{host}/last-modified"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        client = HttpClient(cache_dir=cache_dir, max_age_days=MAX_AGE_DAYS)
+
+        # --- First fetch: 200, gzip decoded, validators stored ---
+        first = client.get(url)
+        assert first.status == 200 and not first.from_cache, first.status
+        assert first.content == BODY, "gzip body not decoded"
+        assert "If-None-Match" not in last_request("/etag")
+        assert len(list(cache_dir.glob("*.json"))) == 1, "validators not stored on disk"
+        print(f"200      : {len(BODY)} bytes decoded from a gzip body, ETag stored")
+
+        # --- Revalidation from memory: If-None-Match -> 304 with the cached body ---
+        second = client.get(url)
+        assert last_request("/etag").get("If-None-Match") == ETAG, "If-None-Match not sent"
+        assert second.status == 304 and second.from_cache and second.content == BODY, second.status
+        print(f"304      : If-None-Match {ETAG} sent, cached body returned")
+
+        # --- Last-Modified only: If-Modified-Since -> 304 ---
+        assert client.get(lm_url).status == 200
+        revalidated = client.get(lm_url)
+        assert last_request("/last-modified").get("If-Modified-Since") == LAST_MODIFIED, "If-Modified-Since not sent"
+        assert revalidated.status == 304 and revalidated.from_cache and revalidated.content == BODY
+        print("304      : If-Modified-Since sent for a resource with only Last-Modified")
+
+        # --- Counters ---
+        stats = client.stats()[host]
+        assert stats.requests == 4 and stats.not_modified == 2 and stats.errors == 0, stats
+        gzipped_size = len(gzip.compress(BODY))
+        assert stats.bytes_received == gzipped_size + len(BODY), stats  # 304s carry no body
+        assert stats.bytes_decoded == 4 * len(BODY), stats              # 304s count the cached body
+        print(f"counters : {stats.requests} requests, {stats.not_modified} not modified, "
+              f"{stats.bytes_received} bytes received, {stats.bytes_decoded} decoded")
+
+        # --- Revalidation from disk (new process): 304 ---
+        reloaded = HttpClient(cache_dir=cache_dir, max_age_days=MAX_AGE_DAYS).get(url)
+        assert last_request("/etag").get("If-None-Match") == ETAG
+        assert reloaded.status == 304 and reloaded.from_cache and reloaded.content == BODY
+        print("disk     : a new client revalidates the stored entry (304)")
+
+        # --- Expired entry: fetched again, not revalidated ---
+        old = time.time() - 2 * MAX_AGE_DAYS * 86400
+        for body_path in cache_dir.glob("*.body"):
+            os.utime(body_path, (old, old))
+        expired = HttpClient(cache_dir=cache_dir, max_age_days=MAX_AGE_DAYS).get(url)
+        assert "If-None-Match" not in last_request("/etag"), "expired entry was revalidated"
+        assert expired.status == 200 and not expired.from_cache and expired.content == BODY
+        print(f"expired  : an entry older than {MAX_AGE_DAYS:g} day(s) is fetched again (200)")
+
+    server.shutdown()
+    print("All HTTP client checks passed.")
@@ -0,0 +1,99 @@
+import os
+import re
+import time
+import hashlib
+import threading
+from typing import Type
+
+# The default client of `nifty_500_momentum.llm` is built at import; no request is sent here
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from pydantic import BaseModel
+from nifty_500_momentum.llm import BaseLLM, estimate_tokens
+from nifty_500_momentum.llm.base import SimpleLLMOutput
+from nifty_500_momentum.analysts.news_model import NewsArticle
+from nifty_500_momentum.analysts.analyzers import (
+    AnalyzerInput, BatchedComprehensiveAnalyzer, BatchedMomentumAnalysis,
+)
+from nifty_500_momentum.analysts.analyzers.market_drivers import MarketDriver
+from nifty_500_momentum.static.strategies.base import StaticScoutResult
+
+"""
+Offline LLM shared by the LLM benchmarks. `FakeLLM` answers from the prompt text alone, so
+the same ticker section gets the same analysis alone or in a batch: a "true" score per
+prompt, plus per-model noise when `noise` is set. Optional per-call latency, simulated
+validation failures (`failure_rate`), and every `drop_every`-th batched response leaving
+out its last ticker. `make_inputs` builds the synthetic tickers.
+"""
+
+HEADER = re.compile(r"^### Ticker: (\S+)\n", re.MULTILINE)
+
+
+def digest(text: str, salt: str) -> int:
+    return int.from_bytes(hashlib.sha256((salt + text).encode()).digest()[:4], "big")
+
+
+class FakeLLM(BaseLLM):
+    def __init__(self,
+                 model: str = "fake",
+                 latency: float = 0.0,
+                 noise: int = 0,
+                 failure_rate: float = 0.0,
+                 drop_every: int = 0):
+        super().__init__(provider_name="fake", model=model, max_retries=1)
+        self.latency, self.noise, self.failure_rate, self.drop_every = latency, noise, failure_rate, drop_every
+        self.calls = 0
+        self.input_tokens = 0   # prompt + response schema
+        self._lock = threading.Lock()
+
+    def generate_simple(self, inp) -> SimpleLLMOutput:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return SimpleLLMOutput(text=f"{self.model}: {inp.user_prompt[:40]}")
+
+    def analysis(self, prompt: str) -> dict:
+        """ComprehensiveMomentumAnalysis fields for one ticker's prompt."""
+        prompt = prompt.rstrip("\n")  # a section of a batched prompt has no trailing newline
+        if digest(prompt, "fail") % 1000 < self.failure_rate * 1000:
+            raise ValueError("response did not validate")
+        conviction = digest(prompt, "conviction") % 10 + 1
+        sentiment = (digest(prompt, "sentiment") % 200 - 80) / 100
+        if self.noise:
+            conviction += digest(prompt, self.model) % (2 * self.noise + 1) - self.noise
+            sentiment += (digest(prompt, self.model + "s") % 21 - 10) / 100
+        return dict(
+            sentiment_score=round(max(-1.0, min(1.0, sentiment)), 2),
+            conviction_score=max(1, min(10, conviction)),
+            primary_driver=MarketDriver.ORDER_WIN if "order" in prompt else MarketDriver.SPECULATION,
+            is_operator_trap=sentiment < 0,
+            reasoning=prompt[:40],
+        )
+
+    def generate_structured(self, inp, output_model: Type[BaseModel]) -> BaseModel:
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += estimate_tokens(inp.messages) + BatchedComprehensiveAnalyzer.SCHEMA_TOKENS
+            calls = self.calls
+        time.sleep(self.latency)
+        prompt = inp.messages[-1]["content"]
+        if output_model is not BatchedMomentumAnalysis:
+            return output_model(**self.analysis(prompt))
+        parts = HEADER.split(prompt)[1:]
+        analyses = [{"ticker": ticker, **self.analysis(body)} for ticker, body in zip(parts[::2], parts[1::2])]
+        if self.drop_every and calls % self.drop_every == 0:
+            analyses = analyses[:-1]
+        return BatchedMomentumAnalysis.model_validate({"analyses": analyses})
+
+
+def make_inputs(num_tickers: int = 60, headlines_per_ticker: int = 6) -> dict:
+    return {
+        f"FAKE{i}": AnalyzerInput(
+            static_results=StaticScoutResult(pass_filter=True, metrics={"rsi": 50.0 + i, "roc": 12.5},
+                                             reason="Explosive Breakout; Golden Cross"),
+            news_data=[NewsArticle(title=f"Fake Company {i} wins order #{j} worth Rs {100 * j} crore",
+                                   link="", source="Mint", published="2026-01-01")
+                       for j in range(headlines_per_ticker)],
+        )
+        for i in range(num_tickers)
+    }
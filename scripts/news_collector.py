@@ -22,6 +22,7 @@ DATA_CONFIG = DataConfig(
     data_dir=BASE_SAVE_DIR / "data" / RUN_ID,
     stock_api_sleep=5.0,
     news_api_sleep=5.0,
+    news_max_workers=1,             # > 1 fetches news concurrently (news_per_host / news_rate_limit)
     cache_expiry_hours=24,
     stock_file_ext=".parquet",
     news_file_ext=".json"
@@ -27,7 +27,8 @@ COLLECTOR_INPUTS = StocksDataCollectorInputs(
     all_tickers=True,               # Collect all Nifty 500 tickers
     tickers={},                     # Or specify a subset: {"Reliance Industries Ltd.": "RELIANCE.NS"}
     period="2y",                    # Data period to collect
-    force_refresh=False             # Force refresh even if data exists
+    force_refresh=False,            # Force refresh even if data exists
+    incremental=False               # Append only new bars to tickers already stored
 )
 
 # RunManagerConfig options
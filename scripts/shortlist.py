@@ -24,7 +24,8 @@ DATA_CONFIG = DataConfig(
 SHORTLISTER_CONFIG = ShortlisterConfig(
     shortlist_id=SHORTLIST_ID,
     strategy=STRATEGY,  # Change strategy as needed
-    data_config=DATA_CONFIG
+    data_config=DATA_CONFIG,
+    max_workers=1       # > 1 analyses ticker chunks on that many processes
 )
 
 if __name__ == "__main__":
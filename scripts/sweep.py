@@ -0,0 +1,29 @@
+from pathlib import Path
+from nifty_500_momentum.data.config import DataConfig
+from nifty_500_momentum.data.manager import DataManager
+from nifty_500_momentum.static.sweep import SweepConfig, sweep_strategy
+
+# --- Options ---
+RUN_ID = "run_1"
+BASE_SAVE_DIR = Path("data")  # Change as needed
+
+DATA_CONFIG = DataConfig(data_dir=BASE_SAVE_DIR / "data" / RUN_ID)
+
+# Thresholds to try (see `thresholds` of the strategy class); the others keep their defaults
+SWEEP_CONFIG = SweepConfig(
+    strategy="explosive_breakout",
+    grid={
+        "rvol_min": [1.5, 2.0, 2.5, 3.0],
+        "roc_min": [5.0, 7.5, 10.0, 12.5, 15.0],
+        "rsi_max": [75.0, 80.0, 85.0, 90.0],
+    },
+    horizon=5,          # bars each signal is held
+    min_signals=30,
+    rank_by="mean_return",
+    max_workers=1       # > 1 evaluates chunks of combinations on that many processes
+)
+
+if __name__ == "__main__":
+    table = sweep_strategy(DataManager(config=DATA_CONFIG), SWEEP_CONFIG)
+    table.to_csv(DATA_CONFIG.data_dir / f"sweep_{SWEEP_CONFIG.strategy}.csv")
+    print(table.head(20).to_string())